@@ -0,0 +1,61 @@
+"""
+Benchmark of calling a fleet of speakers one by one and with the bulk executor.
+
+Emulates speakers with in-process transports adding round trip latency, and prints time taken to read the name of every
+speaker in a loop and with BulkExecutor.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_bulk.py
+"""
+import random
+import time
+
+from samsung_multiroom.api import BulkExecutor
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import FakeTransport
+
+SPEAKERS = 20
+
+LATENCY = (0.01, 0.05)
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>SpkName</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><spkname>Speaker</spkname></response></UIC>')
+
+
+def get_api(i):
+    """Create api of an emulated speaker with its own latency."""
+    latency = random.uniform(*LATENCY)
+
+    def handler(command, action, payload):
+        time.sleep(latency)
+        return RESPONSE
+
+    return SamsungMultiroomApi('public', '192.168.1.{0}'.format(i), transport=FakeTransport(handler))
+
+
+def main():
+    """Run benchmark and print results."""
+    random.seed(0)
+    apis = [get_api(i) for i in range(SPEAKERS)]
+
+    started = time.perf_counter()
+    for api in apis:
+        api.get_speaker_name()
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = BulkExecutor(concurrency=SPEAKERS, deadline=5).run(apis, 'get_speaker_name')
+    bulk = time.perf_counter() - started
+
+    assert all([result.ok for result in results])
+
+    print('{0:<12} {1:>10}'.format('mode', 'time [ms]'))
+    print('{0:<12} {1:>10.1f}'.format('loop', sequential * 1000))
+    print('{0:<12} {1:>10.1f}'.format('bulk', bulk * 1000))
+    print('slowest speaker {0:.1f} ms, bulk is {1:.1f}x faster'.format(
+        max([result.elapsed for result in results]) * 1000, sequential / bulk))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark of event stream messages dropped after looking at their name only.
+
+Constructs ApiResponse for every response in benchmarks/corpus and reads its name, as EventLoop does for messages no
+event factory subscribes to, with and without lazy parsing.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_lazy_response.py
+"""
+import timeit
+
+from bench_parser import load_corpus
+
+from samsung_multiroom.api import ApiResponse
+
+NUMBER = 200
+
+
+def main():
+    """Run benchmark and print time per message."""
+    messages = list(load_corpus().values())
+
+    def dispatch(lazy):
+        for message in messages:
+            ApiResponse(message, lazy=lazy).name  # pylint: disable=expression-not-assigned
+
+    eager = min(timeit.repeat(lambda: dispatch(False), number=NUMBER, repeat=3)) / NUMBER / len(messages)
+    lazy = min(timeit.repeat(lambda: dispatch(True), number=NUMBER, repeat=3)) / NUMBER / len(messages)
+
+    print('{0:<8} {1:>14}'.format('parsing', 'message [us]'))
+    print('{0:<8} {1:>14.1f}'.format('eager', eager * 1e6))
+    print('{0:<8} {1:>14.1f}'.format('lazy', lazy * 1e6))
+    print('lazy is {0:.1f}x faster for unsubscribed messages'.format(eager / lazy))
+
+
+if __name__ == '__main__':
+    main()
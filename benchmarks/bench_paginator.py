@@ -0,0 +1,80 @@
+"""
+Benchmark of paginating over a large music folder with and without page prefetch and adaptive page size.
+
+Serves a folder of 1000 tracks from an in-process transport emulating round trip latency of a request and of each item
+sent, and prints time taken to read it starting 20 items at a time, for a few scheduler concurrency limits and prefetch
+depths, with fixed and adaptive page size.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_paginator.py
+"""
+import re
+import time
+
+from samsung_multiroom.api import CommandScheduler
+from samsung_multiroom.api import PageSizer
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import paginator
+from samsung_multiroom.api.transport import FakeTransport
+
+ITEMS = 1000
+
+LIST_COUNT = 20
+
+LATENCY = 0.005
+
+ITEM_LATENCY = 0.00005
+
+ITEM = '<music object_id="22$@{0}"><type>AUDIO</type><playindex>{0}</playindex><title>Track {0}</title></music>'
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>PCMusicList</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><listcount>{0}</listcount><musiclist>{1}</musiclist></response></UIC>')
+
+
+def handler(command, action, payload):
+    """Answer music list request after a delay."""
+    start_index = int(re.search(r'name="liststartindex" val="(\d+)"', payload).group(1))
+    list_count = int(re.search(r'name="listcount" val="(\d+)"', payload).group(1))
+    indexes = range(start_index, min(start_index + list_count, ITEMS))
+
+    time.sleep(LATENCY + len(indexes) * ITEM_LATENCY)
+
+    return RESPONSE.format(len(indexes), ''.join(ITEM.format(i) for i in indexes))
+
+
+def measure(concurrency, prefetch, adaptive):
+    """
+    :returns: Seconds taken to read the whole folder
+    """
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport(handler),
+                              scheduler=CommandScheduler(concurrency=concurrency),
+                              page_sizer=PageSizer() if adaptive else PageSizer(growth=1))
+
+    started = time.perf_counter()
+    items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, LIST_COUNT, prefetch=prefetch))
+    elapsed = time.perf_counter() - started
+
+    assert len(items) == ITEMS
+
+    return elapsed
+
+
+def main():
+    """Run benchmark and print results."""
+    print('{0:<12} {1:>9} {2:>10} {3:>10} {4:>8}'.format('concurrency', 'prefetch', 'page size', 'time [ms]',
+                                                          'speedup'))
+
+    baseline = measure(1, 0, False)
+
+    for concurrency in [1, 4]:
+        for prefetch in [0, 2, 4]:
+            for adaptive in [False, True]:
+                elapsed = measure(concurrency, prefetch, adaptive)
+
+                print('{0:<12} {1:>9} {2:>10} {3:>10.1f} {4:>7.1f}x'.format(
+                    concurrency, prefetch, 'adaptive' if adaptive else 'fixed', elapsed * 1000, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
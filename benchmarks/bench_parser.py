@@ -0,0 +1,65 @@
+"""
+Benchmark of XML parsers over a corpus of speaker responses.
+
+Parses every response in benchmarks/corpus with the xmltodict reference parser and with the expat parser, checks
+both produce the same structure, and prints time per response.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_parser.py
+"""
+import glob
+import os
+import timeit
+
+from samsung_multiroom.api import PARSER_EXPAT
+from samsung_multiroom.api import PARSER_XMLTODICT
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api.api_parser import parse_expat
+from samsung_multiroom.api.api_parser import parse_xmltodict
+
+NUMBER = 200
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', '*.xml')
+
+
+def load_corpus():
+    """
+    :returns: Dict of response name -> response text
+    """
+    corpus = {}
+
+    for path in sorted(glob.glob(CORPUS)):
+        with open(path) as corpus_file:
+            corpus[os.path.splitext(os.path.basename(path))[0]] = corpus_file.read()
+
+    return corpus
+
+
+def main():
+    """Run benchmark and print time per response."""
+    corpus = load_corpus()
+
+    for name, response_text in corpus.items():
+        assert parse_expat(response_text) == parse_xmltodict(response_text), name
+
+    print('{0:<24} {1:>16} {2:>12} {3:>8}'.format('response', 'xmltodict [us]', 'expat [us]', 'speedup'))
+
+    totals = [0, 0]
+
+    for name, response_text in corpus.items():
+        reference = min(timeit.repeat(lambda: ApiResponse(response_text, PARSER_XMLTODICT), number=NUMBER, repeat=3))
+        fast = min(timeit.repeat(lambda: ApiResponse(response_text, PARSER_EXPAT), number=NUMBER, repeat=3))
+
+        totals[0] += reference
+        totals[1] += fast
+
+        print('{0:<24} {1:>16.1f} {2:>12.1f} {3:>7.1f}x'.format(name, reference / NUMBER * 1e6, fast / NUMBER * 1e6,
+                                                               reference / fast))
+
+    print('{0:<24} {1:>16.1f} {2:>12.1f} {3:>7.1f}x'.format('mean', totals[0] / NUMBER / len(corpus) * 1e6,
+                                                           totals[1] / NUMBER / len(corpus) * 1e6,
+                                                           totals[0] / totals[1]))
+
+
+if __name__ == '__main__':
+    main()
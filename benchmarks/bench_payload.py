@@ -0,0 +1,75 @@
+"""
+Micro-benchmark of request payload formatting.
+
+Compares formatting a request path by string concatenation and quoting of the whole payload with precompiled
+payload templates.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_payload.py
+"""
+import timeit
+import urllib.parse
+
+from samsung_multiroom.api.api_payload import format_request
+
+NUMBER = 100000
+
+REQUESTS = [
+    ('UIC', 'GetVolume', None),
+    ('UIC', 'SetVolume', [('volume', 15)]),
+    ('CPM', 'SetSelectRadio', [('ip', '192.168.1.129'), ('type', 'radio', 'str')]),
+    ('UIC', 'SetSpkName', [('spkname', 'Living Room', 'cdata')]),
+    ('CPM', 'GetRadioList', [('start_index', 0), ('list_count', 30)]),
+    ('UIC', 'Set7bandEQValue', [('presetindex', 4), ('eqvalue1', 1), ('eqvalue2', 2), ('eqvalue3', 3),
+                                ('eqvalue4', 4), ('eqvalue5', 5), ('eqvalue6', 6), ('eqvalue7', 7)]),
+]
+
+
+def legacy_format_param(param):
+    """Parameter formatting as done before templates were introduced."""
+    (name, value, *attributes) = param
+
+    if not attributes:
+        type_hint = 'str'
+        if isinstance(value, int):
+            type_hint = 'dec'
+        if isinstance(value, list) and value and isinstance(value[0], int):
+            type_hint = 'dec_arr'
+    else:
+        type_hint = attributes[0]
+
+    if type_hint == 'cdata':
+        return '<p type="{0}" name="{1}" val="empty"><![CDATA[{2}]]></p>'.format(type_hint, name, value)
+    if type_hint == 'dec_arr':
+        value = ''.join(['<item>{0}</item>'.format(v) for v in value])
+        return '<p type="{0}" name="{1}" val="empty">{2}</p>'.format(type_hint, name, value)
+
+    return '<p type="{0}" name="{1}" val="{2}"/>'.format(type_hint, name, value)
+
+
+def legacy_format_request(command, action, params=None):
+    """Payload and path formatting as done before templates were introduced."""
+    payload = '<name>{0}</name>'.format(action)
+    if params:
+        for param in params:
+            payload += legacy_format_param(param)
+
+    return (payload, '/{0}?cmd={1}'.format(command, urllib.parse.quote(payload)))
+
+
+def main():
+    """Run benchmark and print time per request."""
+    print('{0:<18} {1:>12} {2:>14} {3:>8}'.format('action', 'legacy [us]', 'template [us]', 'speedup'))
+
+    for command, action, params in REQUESTS:
+        assert legacy_format_request(command, action, params) == format_request(command, action, params)
+
+        legacy = min(timeit.repeat(lambda: legacy_format_request(command, action, params), number=NUMBER, repeat=3))
+        template = min(timeit.repeat(lambda: format_request(command, action, params), number=NUMBER, repeat=3))
+
+        print('{0:<18} {1:>12.2f} {2:>14.2f} {3:>7.1f}x'.format(action, legacy / NUMBER * 1e6,
+                                                               template / NUMBER * 1e6, legacy / template))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of a burst of calls sent one by one and pipelined on a single connection.
+
+Emulates a speaker with a local HTTP server that answers every batch of requests it reads after a round trip delay, and
+prints time taken to apply a scene of volume, mute, source and equalizer settings.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_pipeline.py
+"""
+import socket
+import threading
+import time
+
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import HttpClientTransport
+
+NUMBER = 20
+
+LATENCY = 0.02
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>SceneApplied</method><version>1.0</version>'
+            '<speakerip>127.0.0.1</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"></response></UIC>')
+
+
+def serve(server):
+    """Answer keep-alive connections, delaying every batch of requests by the round trip latency."""
+    while True:
+        connection, _ = server.accept()
+        threading.Thread(target=handle, args=(connection, ), daemon=True).start()
+
+
+def handle(connection):
+    """Answer complete requests received on the connection."""
+    data = b''
+
+    with connection:
+        while True:
+            received = connection.recv(65536)
+            if not received:
+                return
+
+            data += received
+            *requests, data = data.split(b'\r\n\r\n')
+            if not requests:
+                continue
+
+            time.sleep(LATENCY)
+
+            body = RESPONSE.encode()
+            connection.sendall(b''.join(b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body)
+                                        for _ in requests))
+
+
+def apply_scene(api):
+    """Send a burst of calls applying a scene."""
+    api.pipeline() \
+        .call('SetVolume', 15) \
+        .call('SetMute', False) \
+        .call('SetFunc', 'aux') \
+        .call('Set7bandEQMode', 1) \
+        .send()
+
+
+def main():
+    """Run benchmark and print results."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(8)
+    threading.Thread(target=serve, args=(server, ), daemon=True).start()
+
+    port = server.getsockname()[1]
+
+    print('{0:<12} {1:>16}'.format('mode', 'time/burst [ms]'))
+
+    timings = {}
+
+    for mode, pipelining in [('sequential', False), ('pipelined', True)]:
+        api = SamsungMultiroomApi('public', '127.0.0.1', port, transport=HttpClientTransport(), pipelining=pipelining)
+
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            apply_scene(api)
+        timings[mode] = (time.perf_counter() - started) / NUMBER
+
+        assert api.pipelining == pipelining
+
+        print('{0:<12} {1:>16.1f}'.format(mode, timings[mode] * 1000))
+
+    print('pipelined is {0:.1f}x faster'.format(timings['sequential'] / timings['pipelined']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of memory held by list items decoded as dicts and as records.
+
+Decodes a music list response of 1000 items both ways and reports memory still allocated once the response itself
+is discarded, and time taken to decode and read durations of all items.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_records.py
+"""
+import time
+import tracemalloc
+
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api.api_commands import COMMANDS
+
+ITEMS = 1000
+
+ITEM = """<music object_id="22$@{0}">
+    <type>AUDIO</type>
+    <playindex>{0}</playindex>
+    <name><![CDATA[Track {0}.mp3]]></name>
+    <title><![CDATA[Track {0}]]></title>
+    <artist><![CDATA[Air]]></artist>
+    <album><![CDATA[Moon Safari]]></album>
+    <thumbnail><![CDATA[http://192.168.1.111:50002/transcoder/jpegtnscaler.cgi/folderart/{0}.jpg]]></thumbnail>
+    <timelength>0:04:58.000</timelength>
+    <device_udn>uuid:00113249-398f-0011-8f39-8f3949321100</device_udn>
+</music>"""
+
+RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<UIC>
+    <method>PCMusicList</method>
+    <version>1.0</version>
+    <speakerip>192.168.1.129</speakerip>
+    <user_identifier>public</user_identifier>
+    <response result="ok">
+        <listcount>{0}</listcount>
+        <musiclist>{1}</musiclist>
+    </response>
+</UIC>""".format(ITEMS, ''.join(ITEM.format(i) for i in range(ITEMS)))
+
+
+def decode(records):
+    """Decode music list the way api does."""
+    return COMMANDS['PCGetMusicListByID'].decode(ApiResponse(RESPONSE).data, records)
+
+
+def duration(item):
+    """Read duration in seconds of an item the way callers do."""
+    value = item['timelength']
+
+    if isinstance(value, int):
+        return value
+
+    (hours, minutes, seconds) = value.split(':')
+
+    return int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+
+
+def measure(records):
+    """
+    :returns: Tuple (bytes held per 1000 items, seconds taken per 1000 items)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = decode(records)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(10):
+        items = decode(records)
+        for item in items:
+            duration(item)
+    elapsed = (time.perf_counter() - started) / 10
+
+    return (held / len(items) * 1000, elapsed / len(items) * 1000)
+
+
+def main():
+    """Run benchmark and print results."""
+    dict_held, dict_time = measure(False)
+    record_held, record_time = measure(True)
+
+    print('{0:<8} {1:>16} {2:>18}'.format('items', 'held [KiB/1000]', 'decode [ms/1000]'))
+    print('{0:<8} {1:>16.1f} {2:>18.1f}'.format('dicts', dict_held / 1024, dict_time * 1000))
+    print('{0:<8} {1:>16.1f} {2:>18.1f}'.format('records', record_held / 1024, record_time * 1000))
+    print('records hold {0:.1f}x less memory'.format(dict_held / record_held))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of the overhead of recording call statistics.
+
+Times ApiStats.record() on its own and a call through the whole api stack against an in-process transport, to show
+how much of the call recording takes.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_stats.py
+"""
+import timeit
+
+from samsung_multiroom.api import ApiStats
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import FakeTransport
+
+NUMBER = 20000
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>VolumeLevel</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><volume>10</volume></response></UIC>')
+
+
+def main():
+    """Run benchmark and print time per call."""
+    api_stats = ApiStats()
+    record = min(timeit.repeat(lambda: api_stats.record('192.168.1.129', 'GetVolume', 0.02, 40, 250), number=NUMBER,
+                               repeat=3))
+
+    transport = FakeTransport()
+    transport.add_response('GetVolume', RESPONSE)
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+    call = min(timeit.repeat(api.get_volume, number=NUMBER // 10, repeat=3)) * 10
+
+    print('{0:<12} {1:>10}'.format('operation', 'time [us]'))
+    print('{0:<12} {1:>10.2f}'.format('record', record / NUMBER * 1e6))
+    print('{0:<12} {1:>10.2f}'.format('api call', call / NUMBER * 1e6))
+    print('recording is {0:.1f}% of an api call without network'.format(record / call * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of peak memory used to browse a large music list page, decoded at once and streamed.
+
+Serves a music list response of 1000 items from an in-process transport, in 4 KiB chunks when streamed, and reports
+peak memory allocated while reading all items, and time until the first item is available.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_streaming.py
+"""
+import time
+import tracemalloc
+
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import FakeTransport
+
+ITEMS = 1000
+
+CHUNK_SIZE = 4096
+
+ITEM = """<music object_id="22$@{0}">
+    <type>AUDIO</type>
+    <playindex>{0}</playindex>
+    <name><![CDATA[Track {0}.mp3]]></name>
+    <title><![CDATA[Track {0}]]></title>
+    <artist><![CDATA[Air]]></artist>
+    <album><![CDATA[Moon Safari]]></album>
+    <thumbnail><![CDATA[http://192.168.1.111:50002/transcoder/jpegtnscaler.cgi/folderart/{0}.jpg]]></thumbnail>
+    <timelength>0:04:58.000</timelength>
+    <device_udn>uuid:00113249-398f-0011-8f39-8f3949321100</device_udn>
+</music>"""
+
+RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<UIC>
+    <method>PCMusicList</method>
+    <version>1.0</version>
+    <speakerip>192.168.1.129</speakerip>
+    <user_identifier>public</user_identifier>
+    <response result="ok">
+        <listcount>{0}</listcount>
+        <musiclist>{1}</musiclist>
+    </response>
+</UIC>""".format(ITEMS, ''.join(ITEM.format(i) for i in range(ITEMS)))
+
+
+def measure(streaming):
+    """
+    :returns: Tuple (peak bytes allocated, seconds until first item, seconds until last item)
+    """
+    transport = FakeTransport(chunk_size=CHUNK_SIZE)
+    transport.add_response('PCGetMusicListByID', RESPONSE)
+
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, records=True, streaming=streaming)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    durations = 0
+
+    for item in api.pc_get_music_list_by_id('uuid:00113249-398f-0011-8f39-8f3949321100', '22$30224', 0, ITEMS):
+        if first is None:
+            first = time.perf_counter() - started
+        durations += item.timelength
+
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert durations == ITEMS * 298
+
+    return (peak, first, elapsed)
+
+
+def main():
+    """Run benchmark and print results."""
+    print('{0:<10} {1:>12} {2:>18} {3:>17}'.format('mode', 'peak [KiB]', 'first item [ms]', 'all items [ms]'))
+
+    results = {}
+    for name, streaming in [('list', False), ('streamed', True)]:
+        results[name] = measure(streaming)
+        peak, first, elapsed = results[name]
+
+        print('{0:<10} {1:>12.1f} {2:>18.2f} {3:>17.2f}'.format(name, peak / 1024, first * 1000, elapsed * 1000))
+
+    print('streaming needs {0:.1f}x less peak memory'.format(results['list'][0] / results['streamed'][0]))
+
+
+if __name__ == '__main__':
+    main()
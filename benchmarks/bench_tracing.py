@@ -0,0 +1,67 @@
+"""
+Benchmark of the overhead of tracing.
+
+Times a plain method against one decorated with traced(), and a speaker call through the whole api stack against an
+in-process transport, with the default NullTracer and with a Tracer.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_tracing.py
+"""
+import timeit
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import Tracer
+from samsung_multiroom.api import set_tracer
+from samsung_multiroom.api import traced
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.speaker import Speaker
+
+NUMBER = 100000
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>VolumeLevel</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><volume>10</volume></response></UIC>')
+
+
+class Facade:
+    """Facade with the same method plain and traced."""
+
+    def plain(self):
+        """Do nothing."""
+
+    @traced
+    def traced(self):
+        """Do nothing."""
+
+
+def measure(func, number):
+    """:returns: Time per call in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    """Run benchmark and print time per call."""
+    facade = Facade()
+
+    transport = FakeTransport()
+    transport.add_response('GetVolume', RESPONSE)
+    speaker = Speaker(SamsungMultiroomApi('public', '192.168.1.129', transport=transport), MagicMock(), MagicMock(),
+                      MagicMock(), MagicMock(), MagicMock())
+
+    print('{0:<24} {1:>14} {2:>14}'.format('call', 'null [us]', 'tracer [us]'))
+
+    timings = []
+    for tracer in [None, Tracer()]:
+        set_tracer(tracer)
+        timings.append((measure(facade.plain, NUMBER), measure(facade.traced, NUMBER),
+                        measure(speaker.get_volume, NUMBER // 20)))
+
+    set_tracer(None)
+
+    for i, name in enumerate(['plain method', 'traced method', 'speaker.get_volume()']):
+        print('{0:<24} {1:>14.2f} {2:>14.2f}'.format(name, timings[0][i], timings[1][i]))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,5 +7,41 @@ from .api import METHOD_GET
 from .api import SamsungMultiroomApi
 from .api import SamsungMultiroomApiException
 from .api import paginator
+from .api_async import AsyncSamsungMultiroomApi
+from .api_async import async_paginator
+from .api_bulk import BulkExecutor
+from .api_bulk import BulkResult
+from .api_cache import ApiCache
+from .api_circuit_breaker import STATE_CLOSED
+from .api_circuit_breaker import STATE_HALF_OPEN
+from .api_circuit_breaker import STATE_OPEN
+from .api_circuit_breaker import CircuitBreaker
+from .api_commands import COMMANDS
+from .api_commands import Command
+from .api_commands import Param
+from .api_hedging import HedgePolicy
+from .api_known_state import KnownState
+from .api_page_size import PageSizer
+from .api_parser import PARSER_EXPAT
+from .api_parser import PARSER_XMLTODICT
+from .api_pipeline import ApiPipeline
+from .api_records import Record
+from .api_records import parse_duration
 from .api_response import ApiResponse
+from .api_retry import RetryPolicy
+from .api_scheduler import LANE_BULK
+from .api_scheduler import LANE_INTERACTIVE
+from .api_scheduler import CommandScheduler
+from .api_session import ApiSession
+from .api_single_flight import SingleFlight
+from .api_stats import ApiStats
 from .api_stream import ApiStream
+from .api_timeout import AdaptiveTimeout
+from .api_tracing import NullTracer
+from .api_tracing import Span
+from .api_tracing import Tracer
+from .api_tracing import get_current_span
+from .api_tracing import get_tracer
+from .api_tracing import set_tracer
+from .api_tracing import traced
+from .api_write_coalescer import WriteCoalescer
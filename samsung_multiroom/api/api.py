@@ -1,18 +1,45 @@
 """Low level api to communicate with samsung multiroom speaker."""
+import collections
+import concurrent.futures
+import contextvars
+import functools
 import inspect
 import logging
+import time as _time
 import urllib.parse
 
-import requests
-
+from .api_circuit_breaker import ACQUIRE_PROBE
+from .api_circuit_breaker import ACQUIRE_REJECT
+from .api_commands import COMMAND_CPM
+from .api_commands import COMMAND_UIC
+from .api_commands import COMMANDS
+from .api_commands import bool_on_off  # pylint: disable=unused-import
+from .api_commands import on_off_bool  # pylint: disable=unused-import
+from .api_commands import response_list  # pylint: disable=unused-import
+from .api_known_state import KnownState
+from .api_page_size import PageSizer
+from .api_parser import ItemParser
+from .api_parser import ParseError
+from .api_pipeline import ApiPipeline
+from .api_payload import format_action  # pylint: disable=unused-import
+from .api_payload import format_param  # pylint: disable=unused-import
+from .api_payload import format_payload  # pylint: disable=unused-import
+from .api_payload import format_request
+from .api_payload import parse_action
 from .api_response import ApiResponse
+from .api_retry import RetryPolicy
+from .api_scheduler import CommandScheduler
+from .api_single_flight import SingleFlight
+from .api_stats import ApiStats
 from .api_stream import ApiStream
+from .api_timeout import AdaptiveTimeout
+from .api_tracing import get_tracer
+from .transport import PipelineInterruptedException
+from .transport import RequestsTransport
+from .transport import TransportException
 
 METHOD_GET = 'get'
 
-COMMAND_UIC = 'UIC'
-COMMAND_CPM = 'CPM'
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,22 +52,76 @@ class SamsungMultiroomApi:
     Samsung Multiroom Api implementation.
 
     Contains non-inclusive list of API calls you can make to control the speaker.
+
+    Get* requests time out after an adaptive timeout derived from their recent round trip times, between 0.5 seconds and
+    timeout. Those that failed to reach the speaker or received a malformed response are retried, with each attempt
+    limited to the time left until timeout since the first one. A Get* call therefore takes about timeout at most, even
+    when a slow speaker makes it time out and retry a few times. Failing requests fast while the speaker is
+    unreachable is left to an optional CircuitBreaker, as a couple of timed out attempts would otherwise open it.
     """
 
-    def __init__(self, user, ip_address, port=55001, timeout=5):
+    def __init__(self, user, ip_address, port=55001, timeout=5, session=None, transport=None, cache=None,
+                 scheduler=None, timeouts=None, circuit_breaker=None,
+                 retry_policy=None, hedge_policy=None, write_coalescer=None,
+                 known_state=None, records=False, streaming=False, page_sizer=None, pipelining=False,
+                 api_stats=None):
         """
         Initialise endpoint.
 
         :param user: User identifier to pass along with request
         :param ip_address: IP address of the speaker to connect to
         :param port: Port to use, defaults to 55001
-        :param timeout: Timeout in seconds
+        :param timeout: Timeout in seconds, upper bound of adaptive timeouts
+        :param session: (optional) ApiSession instance to reuse connections, otherwise new connection is opened for
+            every request. Ignored if transport is passed.
+        :param transport: (optional) Transport instance, defaults to RequestsTransport
+        :param cache: (optional) ApiCache instance to cache responses of idempotent Get* actions
+        :param scheduler: (optional) CommandScheduler instance queueing requests to the speaker, by default one
+            request is sent at a time
+        :param timeouts: (optional) AdaptiveTimeout instance deriving timeouts of Get* requests from observed round
+            trip times, defaults to one bounded by timeout
+        :param circuit_breaker: (optional) CircuitBreaker instance failing requests fast while speaker is unreachable,
+            not used by default
+        :param retry_policy: (optional) RetryPolicy instance retrying Get* requests that failed to reach the speaker or
+            received malformed response
+        :param hedge_policy: (optional) HedgePolicy instance sending duplicates of slow Get* requests, not used by
+            default
+        :param write_coalescer: (optional) WriteCoalescer instance collapsing rapid volume, mute, equalizer and
+            playback position writes, not used by default
+        :param known_state: (optional) KnownState instance learning speaker's settings from responses, skips Set*
+            requests that would change nothing if created with skip_redundant=True
+        :param records: Return items of music, preset, radio and app lists as Record instances with converted fields
+            instead of dicts
+        :param streaming: Return items of lists as iterators yielding them while the response is received and parsed,
+            instead of lists, see stream()
+        :param page_sizer: (optional) PageSizer instance tuning page sizes of paginator() over this api, defaults to one
+            growing pages while their latency stays flat, False to keep page sizes as passed to paginator()
+        :param pipelining: Write bursts of calls made with pipeline() back-to-back on a single connection, falls back to
+            sending them one by one for good once speaker leaves pipelined requests unanswered
+        :param api_stats: (optional) ApiStats instance counting calls and recording their latency, share one between
+            apis to see stats of many speakers together
         """
         self._user = user
         self._ip_address = ip_address
         self._port = port
         self._endpoint = 'http://{0}:{1}'.format(ip_address, port)
         self._timeout = timeout
+        self._session = session
+        self._transport = transport or RequestsTransport(session)
+        self._cache = cache
+        self._single_flight = SingleFlight()
+        self._scheduler = scheduler or CommandScheduler()
+        self._timeouts = timeouts or AdaptiveTimeout(floor=min(0.5, timeout), ceiling=timeout)
+        self._circuit_breaker = circuit_breaker
+        self._retry_policy = retry_policy or RetryPolicy(deadline=timeout)
+        self._hedge_policy = hedge_policy
+        self._write_coalescer = write_coalescer
+        self._known_state = known_state or KnownState()
+        self._records = records
+        self._streaming = streaming
+        self._page_sizer = PageSizer() if page_sizer is None else (page_sizer or None)
+        self._pipelining = pipelining
+        self._api_stats = api_stats or ApiStats()
 
     @property
     def ip_address(self):
@@ -56,13 +137,119 @@ class SamsungMultiroomApi:
         """
         return self._port
 
-    def request(self, method, command, payload):
+    @property
+    def session(self):
+        """
+        :returns: ApiSession instance or None if connections are not pooled
+        """
+        return self._session
+
+    @property
+    def transport(self):
+        """
+        :returns: Transport instance used to make requests
+        """
+        return self._transport
+
+    @property
+    def cache(self):
+        """
+        :returns: ApiCache instance or None if responses are not cached
+        """
+        return self._cache
+
+    @property
+    def single_flight(self):
+        """
+        :returns: SingleFlight instance coalescing concurrent identical Get* requests
+        """
+        return self._single_flight
+
+    @property
+    def scheduler(self):
+        """
+        :returns: CommandScheduler instance queueing requests to the speaker
+        """
+        return self._scheduler
+
+    @property
+    def timeouts(self):
+        """
+        :returns: AdaptiveTimeout instance deriving timeouts of Get* requests
+        """
+        return self._timeouts
+
+    @property
+    def circuit_breaker(self):
+        """
+        :returns: CircuitBreaker instance tracking speaker's availability or None if requests are never failed fast
+        """
+        return self._circuit_breaker
+
+    @property
+    def retry_policy(self):
+        """
+        :returns: RetryPolicy instance retrying failed Get* requests
+        """
+        return self._retry_policy
+
+    @property
+    def hedge_policy(self):
+        """
+        :returns: HedgePolicy instance or None if slow requests are not hedged
+        """
+        return self._hedge_policy
+
+    @property
+    def write_coalescer(self):
+        """
+        :returns: WriteCoalescer instance or None if writes are not coalesced
+        """
+        return self._write_coalescer
+
+    @property
+    def known_state(self):
+        """
+        :returns: KnownState instance with last known values of speaker's settings
+        """
+        return self._known_state
+
+    @property
+    def page_sizer(self):
+        """
+        :returns: PageSizer instance tuning page sizes of paginator() over this api, None if disabled
+        """
+        return self._page_sizer
+
+    @property
+    def api_stats(self):
+        """
+        :returns: ApiStats instance counting calls and recording their latency
+        """
+        return self._api_stats
+
+    @property
+    def pipelining(self):
+        """
+        :returns: True if bursts of calls made with pipeline() are written back-to-back on a single connection
+        """
+        return self._pipelining
+
+    def is_available(self):
+        """
+        :returns: False if speaker recently stopped responding and requests would fail straight away, always True
+            without a circuit breaker
+        """
+        return self._circuit_breaker is None or self._circuit_breaker.is_available()
+
+    def request(self, method, command, payload, timeout=None):
         """
         Makes a request to a configured endpoint.
 
         :param method: HTTP method to use
         :param command: UIC|CPM
         :param payload: XML string with payload
+        :param timeout: (optional) Timeout in seconds, defaults to the one api was initialised with
         :returns: Response dict
         :raises: ValueError
         :raises: SamsungMultiroomApiException
@@ -73,56 +260,394 @@ class SamsungMultiroomApi:
         if command not in [COMMAND_UIC, COMMAND_CPM]:
             raise ValueError('Invalid command {0}, must be one of COMMAND_* constants'.format(method))
 
-        url = '{0}/{1}?cmd={2}'.format(self._endpoint, command, urllib.parse.quote(payload))
-        headers = {
-            'mobileUUID': self._user,
-            'mobileName': 'Wireless Audio',
-            'mobileVersion': '1.0',
-        }
+        path = '/{0}?cmd={1}'.format(command, urllib.parse.quote(payload))
+
+        return self._request_path(parse_action(payload), path, payload, timeout)
+
+    def _request_path(self, action, path, payload, timeout=None):
+        with get_tracer().span(action, speaker=self._ip_address):
+            url = self._endpoint + path
+            started = _time.monotonic()
+            response_text = None
+
+            try:
+                _LOGGER.debug('Request %s. Raw payload %s', url, payload)
+                response_text = self._transport.request(self._ip_address, self._port, path, self._get_headers(),
+                                                        timeout or self._timeout)
+
+                response = self._parse_response_text(response_text)
+            except TransportException as transport_exception:
+                self._record_stats(action, path, started, error=True)
+                _LOGGER.error('Request %s failed', url, exc_info=1)
+                raise SamsungMultiroomApiException('Request {0} failed'.format(url)) from transport_exception
+            except SamsungMultiroomApiException:
+                self._record_stats(action, path, started, _get_size(response_text), error=True)
+                raise
+
+            self._record_stats(action, path, started, _get_size(response_text))
+
+            return response
+
+    def _request_items(self, action, path, payload, item_path):
+        url = self._endpoint + path
+        parser = ItemParser(item_path)
+        started = _time.monotonic()
+        received = 0
 
         try:
             _LOGGER.debug('Request %s. Raw payload %s', url, payload)
-            response = requests.get(url, headers=headers, timeout=self._timeout)
-
-            return self._parse_response_text(response.text)
-        except requests.exceptions.RequestException as request_exception:
+            for chunk in self._transport.request_chunks(self._ip_address, self._port, path, self._get_headers(),
+                                                        self._timeout):
+                received += _get_size(chunk)
+                yield from parser.feed(chunk)
+
+            response_dict = parser.close()
+        except TransportException as transport_exception:
+            self._record_stats(action, path, started, received, error=True)
             _LOGGER.error('Request %s failed', url, exc_info=1)
-            raise SamsungMultiroomApiException('Request {0} failed'.format(url)) from request_exception
+            raise SamsungMultiroomApiException('Request {0} failed'.format(url)) from transport_exception
+        except ParseError:
+            self._record_stats(action, path, started, received, error=True)
+            raise SamsungMultiroomApiException('Received invalid response to {0}'.format(
+                url)) from _MalformedResponseError()
 
-    def _parse_response_text(self, response_text):
-        _LOGGER.debug('Response %s', response_text)
+        _LOGGER.debug('Response %s', response_dict)
 
-        response = ApiResponse(response_text)
+        # items are yielded as they come, so an unsuccessful response can only be reported once it is complete
+        try:
+            result = next(iter(response_dict.values()))['response']['@result']
+        except (AttributeError, KeyError, StopIteration, TypeError):
+            result = None
+
+        self._record_stats(action, path, started, received, error=result != 'ok')
+
+        if result is None:
+            raise SamsungMultiroomApiException('Received invalid response to {0}'.format(
+                url)) from _MalformedResponseError()
+
+        if result != 'ok':
+            raise SamsungMultiroomApiException('Received unsuccessful response to {0}'.format(url))
+
+    def _record_stats(self, action, path, started, received=0, error=False):
+        self._api_stats.record(self._ip_address, action, _time.monotonic() - started, len(path), received, error)
 
-        if not response.success:
-            raise SamsungMultiroomApiException('Received invalid response {0}'.format(response.raw))
+    def _get_headers(self):
+        return {
+            'mobileUUID': self._user,
+            'mobileName': 'Wireless Audio',
+            'mobileVersion': '1.0',
+        }
+
+    def _parse_response_text(self, response_text):
+        response = _parse_response(response_text)
+
+        self._known_state.handle_response(response)
 
         return response.data
 
-    def get(self, command, action, params=None):
+    def get(self, command, action, params=None, force=False):
         """
         Generic GET request.
 
         :param command: COMMAND_* constant
         :param action: Get action name to execute e.g. GetVolume
         :param params: List of tuples (name, value, (optional) type hint str/dec/cdata)
-        :returns dict
+        :param force: Send Set* action even if speaker is already known to be in requested state
+        :returns dict, empty if request was skipped
         """
-        return self.request(METHOD_GET, command, format_payload(action, params))
+        if not force and self._known_state.is_redundant(action, params):
+            return {}
+
+        payload, path = format_request(command, action, params)
+
+        return self._cache_get(command, action, payload, lambda: self._get(command, action, payload, path))
+
+    def call(self, name, *args, force=False):
+        """
+        Make a call described by the command table.
+
+        :param name: Action name from the command table e.g. GetVolume
+        :param args: Call arguments, one per param of the command
+        :param force: Send Set* action even if speaker is already known to be in requested state
+        :returns: Decoded response, see Command.decode()
+        :raises: ValueError if action is not in the command table
+        """
+        command = COMMANDS.get(name)
+        if command is None:
+            raise ValueError('Unknown action {0}'.format(name))
+
+        if self._streaming and command.items is not None:
+            return self.stream(name, *args)
+
+        return command.decode(self.get(command.command, name, command.encode(*args), force=force), self._records)
+
+    def stream(self, name, *args):
+        """
+        Make a list call described by the command table and yield items as soon as they are parsed.
+
+        Items are never collected into a list, so a large page needs little memory and first items are available
+        before the rest of the response is received. Request is sent once iteration starts and holds its turn with the
+        scheduler until the iterator is exhausted or closed. Streamed responses are not cached, retried or hedged.
+
+        Example:
+            for item in api.stream('PCGetMusicListByID', device_udn, parent_id, 0, 1000):
+                print(item['title'])
+
+        :param name: Action name of a list command e.g. PCGetMusicListByID
+        :param args: Call arguments, one per param of the command
+        :returns: Iterator of items, dicts or Record instances
+        :raises: ValueError if action is not a list command in the command table
+        """
+        command = COMMANDS.get(name)
+        if command is None or command.items is None:
+            raise ValueError('Unknown list action {0}'.format(name))
+
+        payload, path = format_request(command.command, name, command.encode(*args))
+        items = self._send_streamed(name, payload, path, ('response',) + command.items)
+
+        return command.decode_items(items, self._records)
+
+    def pipeline(self):
+        """
+        Start a burst of calls sent together.
+
+        Example:
+            api.pipeline().call('SetVolume', 10).call('SetMute', False).send()
+
+        :returns: ApiPipeline instance
+        """
+        return ApiPipeline(self._send_pipeline)
+
+    def _write(self, target, name, *args, force=False):
+        if self._write_coalescer is None:
+            self.call(name, *args, force=force)
+            return None
+
+        return self._write_coalescer.submit(target, lambda: self.call(name, *args, force=force))
+
+    def _cache_get(self, command, action, payload, load):
+        if self._cache is None:
+            return load()
+
+        return self._cache.get(command, action, payload, load)
+
+    def _send_pipeline(self, calls):
+        results = [None] * len(calls)
+        errors = []
+        pending = []
+
+        for i, (command, action, params, force, _) in enumerate(calls):
+            if not force and self._known_state.is_redundant(action, params):
+                results[i] = {}
+                continue
+
+            payload, path = format_request(command, action, params)
+            pending.append((i, command, action, payload, path))
+
+        if self._pipelining and len(pending) > 1:
+            pending = self._request_pipelined(pending, results, errors)
+
+        for i, command, action, payload, path in pending:
+            try:
+                results[i] = self._cache_get(command, action, payload,
+                                             functools.partial(self._get, command, action, payload, path))
+            except SamsungMultiroomApiException as api_exception:
+                errors.append((i, api_exception))
+
+        if errors:
+            raise min(errors, key=lambda error: error[0])[1]
+
+        return [response if spec is None else spec.decode(response, self._records)
+                for response, (_, _, _, _, spec) in zip(results, calls)]
+
+    def _request_pipelined(self, pending, results, errors):
+        self._acquire_circuit()
+        interrupted = None
+        started = _time.monotonic()
+
+        try:
+            with self._scheduler.slot(pending[0][2]):
+                _LOGGER.debug('Pipelined requests %s. Raw payloads %s', self._endpoint,
+                              [payload for _, _, _, payload, _ in pending])
+                started = _time.monotonic()
+                response_texts = self._transport.request_pipelined(self._ip_address, self._port,
+                                                                   [path for _, _, _, _, path in pending],
+                                                                   self._get_headers(), self._timeout)
+        except PipelineInterruptedException as pipeline_exception:
+            _LOGGER.error('Pipelined requests to %s failed', self._endpoint, exc_info=1)
+            interrupted = pipeline_exception
+            response_texts = pipeline_exception.responses
+        except TransportException as transport_exception:
+            for _, _, action, _, path in pending:
+                self._record_stats(action, path, started, error=True)
+
+            _LOGGER.error('Pipelined requests to %s failed', self._endpoint, exc_info=1)
+            self._record_failure()
+            raise SamsungMultiroomApiException('Pipelined requests to {0} failed'.format(
+                self._endpoint)) from transport_exception
+
+        if interrupted is None:
+            self._record_success()
+        else:
+            self._record_failure()
+
+        # responses of a burst arrive together, each is recorded with latency of the whole burst
+        for (i, command, action, payload, path), response_text in zip(pending, response_texts):
+            try:
+                results[i] = self._cache_get(command, action, payload,
+                                             functools.partial(self._parse_response_text, response_text))
+            except SamsungMultiroomApiException as api_exception:
+                errors.append((i, api_exception))
+                self._record_stats(action, path, started, _get_size(response_text), error=True)
+            else:
+                self._record_stats(action, path, started, _get_size(response_text))
+
+        unanswered = pending[len(response_texts):]
+
+        if unanswered:
+            _LOGGER.warning('Speaker %s answered %d of %d pipelined requests, sending requests one by one from now on',
+                            self._endpoint, len(response_texts), len(pending))
+            self._pipelining = False
+
+        if interrupted is None:
+            # speaker closed the connection, requests it left unanswered were not executed and are sent again
+            return unanswered
+
+        # requests unanswered by a failed connection might have been executed, only Get* are safe to send again
+        for i, _, action, _, path in unanswered:
+            if not is_idempotent(action):
+                api_exception = SamsungMultiroomApiException('Pipelined request {0} to {1} failed'.format(
+                    action, self._endpoint))
+                api_exception.__cause__ = interrupted
+
+                errors.append((i, api_exception))
+                self._record_stats(action, path, started, error=True)
+
+        return [request for request in unanswered if is_idempotent(request[2])]
+
+    def _get(self, command, action, payload, path):
+        if not is_idempotent(action):
+            return self._send(action, payload, path)
+
+        # identical requests made concurrently by other threads share a single round trip
+        return self._single_flight.do((command, payload), lambda: self._retry_policy.run(
+            lambda remaining: self._send(action, payload, path, remaining), _is_transient_failure))
+
+    def _send(self, action, payload, path, timeout=None):
+        self._acquire_circuit()
+
+        try:
+            response = self._scheduler.run(action, lambda: self._request_hedged(action, payload, path, timeout))
+        except SamsungMultiroomApiException as api_exception:
+            self._record_exception(api_exception)
+            raise
+
+        self._record_success()
+
+        return response
+
+    def _send_streamed(self, action, payload, path, item_path):
+        self._acquire_circuit()
+
+        try:
+            with self._scheduler.slot(action):
+                yield from self._request_items(action, path, payload, item_path)
+        except SamsungMultiroomApiException as api_exception:
+            self._record_exception(api_exception)
+            raise
+
+        self._record_success()
+
+    def _acquire_circuit(self):
+        if self._circuit_breaker is None:
+            return
+
+        acquired = self._circuit_breaker.acquire()
+
+        if acquired == ACQUIRE_REJECT:
+            raise SamsungMultiroomApiException('Speaker {0} is unavailable'.format(self._endpoint))
+
+        if acquired == ACQUIRE_PROBE:
+            self._probe()
+
+    def _record_exception(self, api_exception):
+        # invalid response still means speaker is reachable
+        if _is_transport_failure(api_exception):
+            self._record_failure()
+        else:
+            self._record_success()
+
+    def _record_success(self):
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+
+    def _record_failure(self):
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_failure()
+
+    def _probe(self):
+        try:
+            payload, path = format_request(COMMAND_UIC, 'GetSpkName')
+            self._scheduler.run('GetSpkName', lambda: self._request_adaptive('GetSpkName', payload, path))
+        except SamsungMultiroomApiException as api_exception:
+            if not _is_transport_failure(api_exception):
+                self._circuit_breaker.record_success()
+                return
+
+            self._circuit_breaker.record_failure()
+            raise SamsungMultiroomApiException('Speaker {0} is unavailable'.format(self._endpoint)) from api_exception
+        except BaseException:
+            # probe must report back whatever went wrong, circuit would stay half open for good otherwise
+            self._circuit_breaker.record_failure()
+            raise
+
+        self._circuit_breaker.record_success()
+
+    def _request_hedged(self, action, payload, path, timeout=None):
+        if self._hedge_policy is None or not is_idempotent(action):
+            return self._request_adaptive(action, payload, path, timeout)
+
+        # duplicate must not exceed concurrency of the scheduler, whose slot the call already holds
+        return self._hedge_policy.run(action, lambda: self._request_adaptive(action, payload, path, timeout),
+                                      self._scheduler.spare_slot)
+
+    def _request_adaptive(self, action, payload, path, timeout=None):
+        # writes might take a while to apply, only reads get timeouts based on their usual latency
+        if not is_idempotent(action):
+            return self._request_path(action, path, payload)
+
+        started = _time.monotonic()
+        adaptive_timeout = self._timeouts.get_timeout(action)
+
+        # attempt must not run past the deadline of retries
+        if timeout is not None:
+            adaptive_timeout = min(adaptive_timeout, timeout)
+
+        try:
+            response = self._request_path(action, path, payload, adaptive_timeout)
+        except SamsungMultiroomApiException as api_exception:
+            if _is_transport_failure(api_exception):
+                self._timeouts.backoff(action)
+            raise
+
+        self._timeouts.observe(action, _time.monotonic() - started)
+
+        return response
 
     def get_speaker_name(self):
         """
         :returns: Speaker name
         """
-        return self.get(COMMAND_UIC, 'GetSpkName')['spkname']
+        return self.call('GetSpkName')
 
-    def set_speaker_name(self, name):
+    def set_speaker_name(self, name, force=False):
         """
         Set speaker name.
 
         :param name: new speaker name
+        :param force: Send the request even if speaker is already known to be in requested state
         """
-        self.get(COMMAND_UIC, 'SetSpkName', [('spkname', name, 'cdata')])
+        self.call('SetSpkName', name, force=force)
 
     def get_main_info(self):
         """
@@ -145,9 +670,10 @@ class SamsungMultiroomApi:
             - protocolver - 2.3
             - btmacaddr - bluetooth MAC address
         """
-        path = '/{0}?cmd={1}'.format(COMMAND_UIC, urllib.parse.quote(format_payload('GetMainInfo')))
+        path = format_request(COMMAND_UIC, 'GetMainInfo')[1]
 
-        stream = ApiStream(self._user, self._ip_address, self._port, self._timeout)
+        stream = ApiStream(self._user, self._ip_address, self._port, self._timeout, transport=self._transport,
+                           api_stats=self._api_stats)
 
         # Speaker sends two http responses for this request, latter one contains correct payload. We attempt
         # to fetch both responses and read/parse both.
@@ -172,15 +698,17 @@ class SamsungMultiroomApi:
 
         :returns: int - volume level
         """
-        return int(self.get(COMMAND_UIC, 'GetVolume')['volume'])
+        return self.call('GetVolume')
 
-    def set_volume(self, volume):
+    def set_volume(self, volume, force=False):
         """
         Set speaker volume level.
 
         :param volume: Volume level between 0 and 100
+        :param force: Send the request even if speaker is already known to be in requested state
+        :returns: Future if writes are coalesced, None otherwise
         """
-        self.get(COMMAND_UIC, 'SetVolume', [('volume', int(volume))])
+        return self._write('SetVolume', 'SetVolume', volume, force=force)
 
     def get_mute(self):
         """
@@ -188,15 +716,17 @@ class SamsungMultiroomApi:
 
         :returns: boolean True if muted
         """
-        return on_off_bool(self.get(COMMAND_UIC, 'GetMute')['mute'])
+        return self.call('GetMute')
 
-    def set_mute(self, mute):
+    def set_mute(self, mute, force=False):
         """
         Mute/unmute the speaker.
 
         :param mute: boolean True to mute
+        :param force: Send the request even if speaker is already known to be in requested state
+        :returns: Future if writes are coalesced, None otherwise
         """
-        self.get(COMMAND_UIC, 'SetMute', [('mute', bool_on_off(mute))])
+        return self._write('SetMute', 'SetMute', mute, force=force)
 
     def get_func(self):
         """
@@ -206,15 +736,16 @@ class SamsungMultiroomApi:
             - function - aux|bt|hdmi|optical|soundshare|wifi
             - submode - dlna|cp|?
         """
-        return self.get(COMMAND_UIC, 'GetFunc')
+        return self.call('GetFunc')
 
-    def set_func(self, function):
+    def set_func(self, function, force=False):
         """
         Set the source for the speaker
 
         :param function: aux|bt|hdmi|optical|soundshare|wifi
+        :param force: Send the request even if speaker is already known to be in requested state
         """
-        self.get(COMMAND_UIC, 'SetFunc', [('function', function)])
+        self.call('SetFunc', function, force=force)
 
     def get_shuffle_mode(self):
         """
@@ -222,15 +753,16 @@ class SamsungMultiroomApi:
 
         :returns: Boolean True if shuffle mode is enabled
         """
-        return on_off_bool(self.get(COMMAND_UIC, 'GetShuffleMode')['shuffle'])
+        return self.call('GetShuffleMode')
 
-    def set_shuffle_mode(self, shuffle_mode):
+    def set_shuffle_mode(self, shuffle_mode, force=False):
         """
         Enable/disable shuffle mode of the playlist.
 
         :param shuffle_mode: boolean
+        :param force: Send the request even if speaker is already known to be in requested state
         """
-        self.get(COMMAND_UIC, 'SetShuffleMode', [('shufflemode', bool_on_off(shuffle_mode))])
+        self.call('SetShuffleMode', shuffle_mode, force=force)
 
     def set_trick_mode(self, trick_mode):
         """
@@ -238,10 +770,7 @@ class SamsungMultiroomApi:
 
         :param trick_mode: previous|next
         """
-        if trick_mode not in ['previous', 'next']:
-            raise ValueError('Trick mode must one of: previous, next')
-
-        self.get(COMMAND_UIC, 'SetTrickMode', [('trickmode', trick_mode)])
+        self.call('SetTrickMode', trick_mode)
 
     def set_playback_control(self, playback_control):
         """
@@ -249,10 +778,7 @@ class SamsungMultiroomApi:
 
         :param playback_control: resume|pause|play
         """
-        if playback_control not in ['resume', 'pause']:
-            raise ValueError('Playback control must be one of: resume, pause')
-
-        self.get(COMMAND_UIC, 'SetPlaybackControl', [('playbackcontrol', playback_control)])
+        self.call('SetPlaybackControl', playback_control)
 
     def get_music_info(self):
         """
@@ -275,7 +801,7 @@ class SamsungMultiroomApi:
             - seek - enable|?
             - pause - enable|?
         """
-        return self.get(COMMAND_UIC, 'GetMusicInfo')
+        return self.call('GetMusicInfo')
 
     def get_play_status(self):
         """
@@ -286,7 +812,7 @@ class SamsungMultiroomApi:
             - submode - dlna|cp
             - playstatus - (optional) play|pause
         """
-        return self.get(COMMAND_UIC, 'GetPlayStatus')
+        return self.call('GetPlayStatus')
 
     def set_search_time(self, play_time):
         """
@@ -297,8 +823,9 @@ class SamsungMultiroomApi:
         Setting play time further than length of the track ends the current track and plays next from the beginning.
 
         :play_time: play time in seconds
+        :returns: Future if writes are coalesced, None otherwise
         """
-        self.get(COMMAND_UIC, 'SetSearchTime', [('playtime', int(play_time))])
+        return self._write('SetSearchTime', 'SetSearchTime', play_time)
 
     def get_preset_list(self, start_index, list_count):
         """
@@ -313,15 +840,7 @@ class SamsungMultiroomApi:
             - contentid
             - mediaid
         """
-        response = self.get(COMMAND_CPM, 'GetPresetList', [
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ])
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['presetlist']['preset'])
+        return self.call('GetPresetList', start_index, list_count)
 
     def get_radio_info(self):
         """
@@ -341,7 +860,7 @@ class SamsungMultiroomApi:
             - timestamp - in ISO 8601 format
             - noqueue
         """
-        return self.get(COMMAND_CPM, 'GetRadioInfo')
+        return self.call('GetRadioInfo')
 
     def set_play_preset(self, preset_type, preset_index):
         """
@@ -352,10 +871,7 @@ class SamsungMultiroomApi:
         :param preset_type: 1 - speaker, 0 - my
         :param preset_index: Index of get preset list
         """
-        self.get(COMMAND_CPM, 'SetPlayPreset', [
-            ('presettype', int(preset_type)),
-            ('presetindex', int(preset_index)),
-        ])
+        self.call('SetPlayPreset', preset_type, preset_index)
 
     def set_select_radio(self):
         """
@@ -363,7 +879,7 @@ class SamsungMultiroomApi:
 
         Precede this with set_play_preset.
         """
-        self.get(COMMAND_CPM, 'SetSelectRadio')
+        self.call('SetSelectRadio')
 
     def get_dms_list(self, start_index, list_count):
         """
@@ -381,15 +897,7 @@ class SamsungMultiroomApi:
             - thumbnail_PNG_SM - thumbnail url
             - thumbnail_JPG_SM - thumbnail url
         """
-        response = self.get(COMMAND_UIC, 'GetDmsList', [
-            ('liststartindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ])
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['dmslist']['dms'])
+        return self.call('GetDmsList', start_index, list_count)
 
     def pc_get_music_list_by_category(self, device_udn, start_index, list_count):
         """
@@ -410,18 +918,7 @@ class SamsungMultiroomApi:
             - timelength - None
             - device_udn -
         """
-        response = self.get(COMMAND_UIC, 'PCGetMusicListByCategory', [
-            ('device_udn', device_udn),
-            ('filter', 'folder'),
-            ('categoryid', 'folder'),
-            ('liststartindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ])
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['musiclist']['music'])
+        return self.call('PCGetMusicListByCategory', device_udn, start_index, list_count)
 
     def pc_get_music_list_by_id(self, device_udn, parent_id, start_index, list_count):
         """
@@ -443,18 +940,7 @@ class SamsungMultiroomApi:
             - timelength - HH:MM:SS.xxx format
             - device_udn -
         """
-        response = self.get(COMMAND_UIC, 'PCGetMusicListByID', [
-            ('device_udn', device_udn),
-            ('filter', 'folder'),
-            ('parentid', str(parent_id)),
-            ('liststartindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ])
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['musiclist']['music'])
+        return self.call('PCGetMusicListByID', device_udn, parent_id, start_index, list_count)
 
     def set_playlist_playback_control(self, items):
         """
@@ -469,30 +955,7 @@ class SamsungMultiroomApi:
             - artist - song artist
             - thumbnail - URL
         """
-        params = [
-            ('playbackcontrol', 'play'),
-            ('playertype', 'allshare'),
-            ('sourcename', '', 'cdata'),
-            ('playindex', 0),
-            ('playtime', 0),
-            ('totalobjectcount', len(items)),
-        ]
-
-        for item in items:
-            if 'title' not in item:
-                item['title'] = 'Unknown'
-            if 'artist' not in item:
-                item['artist'] = 'Unknown'
-            if 'thumbnail' not in item:
-                item['thumbnail'] = ''
-
-            params.append(('device_udn', item['device_udn']))
-            params.append(('objectid', item['object_id']))
-            params.append(('songtitle', item['title'], 'cdata'))
-            params.append(('thumbnail', item['thumbnail'], 'cdata'))
-            params.append(('artist', item['artist'], 'cdata'))
-
-        self.get(COMMAND_UIC, 'SetPlaylistPlaybackControl', params)
+        self.call('SetPlaylistPlaybackControl', items)
 
     def browse_main(self, start_index, list_count):
         """
@@ -513,17 +976,7 @@ class SamsungMultiroomApi:
             - thumbnail - URL
             - contentid
         """
-        params = [
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'BrowseMain', params)
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('BrowseMain', start_index, list_count)
 
     def get_select_radio_list(self, content_id, start_index, list_count):
         """
@@ -537,18 +990,7 @@ class SamsungMultiroomApi:
         :param list_count:
         :returns: see browse_main()
         """
-        params = [
-            ('contentid', int(content_id)),
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'GetSelectRadioList', params)
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('GetSelectRadioList', content_id, start_index, list_count)
 
     def get_current_radio_list(self, start_index, list_count):
         """
@@ -558,17 +1000,7 @@ class SamsungMultiroomApi:
         :param list_count:
         :returns: see browse_main()
         """
-        params = [
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'GetCurrentRadioList', params)
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('GetCurrentRadioList', start_index, list_count)
 
     def get_upper_radio_list(self, start_index, list_count):
         """
@@ -578,17 +1010,7 @@ class SamsungMultiroomApi:
         :param list_count:
         :returns: see browse_main()
         """
-        params = [
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'GetUpperRadioList', params)
-
-        if not int(response['listcount']):
-            return []
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('GetUpperRadioList', start_index, list_count)
 
     def set_play_select(self, content_ids):
         """
@@ -597,17 +1019,7 @@ class SamsungMultiroomApi:
         :param content_ids: Content id as returned by get_upper_radio_list(), get_select_radio_list() or
             get_current_radio_list(), or list of content ids
         """
-        if not isinstance(content_ids, list):
-            content_ids = [content_ids]
-
-        if len(content_ids) > 1:
-            params = [('selectitemids', [int(id) for id in content_ids])]
-        elif content_ids:
-            params = [('selectitemid', int(content_ids[0]))]
-        else:
-            params = [('selectitemid', '')]
-
-        self.get(COMMAND_CPM, 'SetPlaySelect', params)
+        self.call('SetPlaySelect', content_ids)
 
     def get_station_data(self, content_id):
         """
@@ -624,9 +1036,7 @@ class SamsungMultiroomApi:
             - browsemode
             - timestamp
         """
-        params = [('selectitemid', int(content_id))]
-
-        return self.get(COMMAND_CPM, 'GetStationData', params)
+        return self.call('GetStationData', content_id)
 
     def get_7band_eq_list(self):
         """
@@ -637,9 +1047,7 @@ class SamsungMultiroomApi:
             - presetindex
             - presetname
         """
-        response = self.get(COMMAND_UIC, 'Get7BandEQList')
-
-        return response_list(response['presetlist']['preset'])
+        return self.call('Get7BandEQList')
 
     def get_current_eq_mode(self):
         """
@@ -656,11 +1064,9 @@ class SamsungMultiroomApi:
             - eqvalue6
             - eqvalue7
         """
-        response = self.get(COMMAND_UIC, 'GetCurrentEQMode')
-
-        return response
+        return self.call('GetCurrentEQMode')
 
-    def set_7band_eq_value(self, preset_index, values):
+    def set_7band_eq_value(self, preset_index, values, force=False):
         """
         Set preset's equalizer settings.
 
@@ -669,23 +1075,20 @@ class SamsungMultiroomApi:
 
         :param preset_index:
         :param values: List of 7 integers ranging between -6 and 6
+        :param force: Send the request even if speaker is already known to be in requested state
+        :returns: Future if writes are coalesced, None otherwise
         """
-        params = [('presetindex', int(preset_index))]
-
-        for i, value in enumerate(values):
-            params.append(('eqvalue' + str(i + 1), int(value)))
-
-        self.get(COMMAND_UIC, 'Set7bandEQValue', params)
+        return self._write(('Set7bandEQValue', int(preset_index)), 'Set7bandEQValue', preset_index, values,
+                           force=force)
 
-    def set_7band_eq_mode(self, preset_index):
+    def set_7band_eq_mode(self, preset_index, force=False):
         """
         Switch equalizer to a predefined preset.
 
         :param preset_index:
+        :param force: Send the request even if speaker is already known to be in requested state
         """
-        params = [('presetindex', int(preset_index))]
-
-        self.get(COMMAND_UIC, 'Set7bandEQMode', params)
+        self.call('Set7bandEQMode', preset_index, force=force)
 
     def reset_7band_eq_value(self, preset_index, values):
         """
@@ -694,12 +1097,7 @@ class SamsungMultiroomApi:
         :param preset_index:
         :param values: List of 7 integers ranging between -6 and 6
         """
-        params = [('presetindex', int(preset_index))]
-
-        for i, value in enumerate(values):
-            params.append(('eqvalue' + str(i + 1), int(value)))
-
-        self.get(COMMAND_UIC, 'Reset7bandEQValue', params)
+        self.call('Reset7bandEQValue', preset_index, values)
 
     def del_custom_eq_mode(self, preset_index):
         """
@@ -709,9 +1107,7 @@ class SamsungMultiroomApi:
 
         :param preset_index:
         """
-        params = [('presetindex', int(preset_index))]
-
-        self.get(COMMAND_UIC, 'DelCustomEQMode', params)
+        self.call('DelCustomEQMode', preset_index)
 
     def add_custom_eq_mode(self, preset_index, preset_name):
         """
@@ -724,9 +1120,7 @@ class SamsungMultiroomApi:
         :param presetindex:
         :param presetname:
         """
-        params = [('presetindex', int(preset_index)), ('presetname', preset_name)]
-
-        self.get(COMMAND_UIC, 'AddCustomEQMode', params)
+        self.call('AddCustomEQMode', preset_index, preset_name)
 
     def set_speaker_time(self, datetime):
         """
@@ -734,16 +1128,8 @@ class SamsungMultiroomApi:
 
         :param datetime: Datetime object e.g. datetime.datetime.now()
         """
-        params = [
-            ('year', datetime.year),
-            ('month', datetime.month),
-            ('day', datetime.day),
-            ('hour', datetime.hour),
-            ('min', datetime.minute),
-            ('sec', datetime.second),
-        ]
-
-        self.get(COMMAND_UIC, 'SetSpeakerTime', params)
+        self.call('SetSpeakerTime', datetime.year, datetime.month, datetime.day, datetime.hour, datetime.minute,
+                  datetime.second)
 
     def get_sleep_timer(self):
         """
@@ -752,7 +1138,7 @@ class SamsungMultiroomApi:
             - sleepoption - off|start
             - sleeptime - remaining time in seconds
         """
-        return self.get(COMMAND_UIC, 'GetSleepTimer')
+        return self.call('GetSleepTimer')
 
     def set_sleep_timer(self, option, time):
         """
@@ -760,12 +1146,7 @@ class SamsungMultiroomApi:
         :param option: off|start
         :param time: delay in seconds
         """
-        params = [
-            ('option', option),
-            ('sleeptime', int(time)),
-        ]
-
-        self.get(COMMAND_UIC, 'SetSleepTimer', params)
+        self.call('SetSleepTimer', option, time)
 
     def get_alarm_info(self):
         """
@@ -787,9 +1168,7 @@ class SamsungMultiroomApi:
             - alarmsoundname - name of predefined alarm sound names as returned by get_alarm_sound_list()
             - duration - duration of alarm in seconds
         """
-        response = self.get(COMMAND_UIC, 'GetAlarmInfo')
-
-        return response_list(response['alarmList']['alarm'])
+        return self.call('GetAlarmInfo')
 
     def set_alarm_on_off(self, index, alarm):
         """
@@ -798,12 +1177,7 @@ class SamsungMultiroomApi:
         :param index: Alarm index
         :param alarm: on|off
         """
-        params = [
-            ('index', int(index)),
-            ('alarm', alarm),
-        ]
-
-        self.get(COMMAND_UIC, 'SetAlarmOnOff', params)
+        self.call('SetAlarmOnOff', index, alarm)
 
     def get_alarm_sound_list(self):
         """
@@ -814,9 +1188,7 @@ class SamsungMultiroomApi:
             - alarsoundindex - (note misspelling) alarm sound index
             - alarmsoundname - alarm sound name
         """
-        response = self.get(COMMAND_UIC, 'GetAlarmSoundList')
-
-        return response_list(response['alarmlist']['alarmsound'])
+        return self.call('GetAlarmSoundList')
 
     def set_alarm_info(self, index, hour, minute, week, duration, volume, station_data):
         """
@@ -836,22 +1208,7 @@ class SamsungMultiroomApi:
             - thumbnail
             - stationurl
         """
-        params = [
-            ('index', int(index)),
-            ('hour', int(hour)),
-            ('min', int(minute)),
-            ('week', hex(int(week, 16))),
-            ('volume', int(volume)),
-            ('title', station_data['title'], 'cdata'),
-            ('description', station_data['description'], 'cdata'),
-            ('thumbnail', station_data['thumbnail'], 'cdata'),
-            ('stationurl', station_data['stationurl'], 'cdata'),
-            ('soundenable', 'off'),
-            ('sound', -1),
-            ('duration', int(duration)),
-        ]
-
-        self.get(COMMAND_UIC, 'SetAlarmInfo', params)
+        self.call('SetAlarmInfo', index, hour, minute, week, duration, volume, station_data)
 
     def del_alarm(self, index_list):
         """
@@ -862,12 +1219,7 @@ class SamsungMultiroomApi:
 
         :param index_list: List of alarm indices as returned by get_alarm_info()
         """
-        params = [
-            ('totaldelnum', len(index_list)),
-        ]
-        params += [('index', int(i)) for i in index_list]
-
-        self.get(COMMAND_UIC, 'DelAlarm', params)
+        self.call('DelAlarm', index_list)
 
     def spk_in_group(self, action):
         """
@@ -875,9 +1227,7 @@ class SamsungMultiroomApi:
 
         :param action: select|?
         """
-        params = [('act', action)]
-
-        return self.get(COMMAND_UIC, 'SpkInGroup', params)
+        return self.call('SpkInGroup', action)
 
     def set_multispk_group(self, name, speakers):
         """
@@ -889,28 +1239,13 @@ class SamsungMultiroomApi:
             - ip
             - mac
         """
-        params = [('name', name, 'cdata'), ('index', 1), ('type', 'main'), ('spknum', len(speakers))]
-
-        for i, speaker in enumerate(speakers):
-            if i == 0:
-                params += [
-                    ('audiosourcemacaddr', speaker['mac']),
-                    ('audiosourcename', speaker['name'], 'cdata'),
-                    ('audiosourcetype', 'speaker'),
-                ]
-            else:
-                params += [
-                    ('subspkip', speaker['ip']),
-                    ('subspkmacaddr', speaker['mac']),
-                ]
-
-        self.get(COMMAND_UIC, 'SetMultispkGroup', params)
+        self.call('SetMultispkGroup', name, speakers)
 
     def set_ungroup(self):
         """
         Ungroup speakers.
         """
-        self.get(COMMAND_UIC, 'SetUngroup')
+        self.call('SetUngroup')
 
     def set_group_name(self, name):
         """
@@ -918,9 +1253,7 @@ class SamsungMultiroomApi:
 
         :param name: new name
         """
-        params = [('groupname', name, 'cdata')]
-
-        self.get(COMMAND_UIC, 'SetGroupName', params)
+        self.call('SetGroupName', name)
 
     def get_cp_list(self, start_index, list_count):
         """
@@ -933,14 +1266,7 @@ class SamsungMultiroomApi:
             - username - (optionally if signed in) signed in user name
             - istrial_user - (optionally) 1
         """
-        params = [
-            ('liststartindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'GetCpList', params)
-
-        return response_list(response['cplist']['cp'])
+        return self.call('GetCpList', start_index, list_count)
 
     def set_cp_service(self, cp_id):
         """
@@ -950,9 +1276,7 @@ class SamsungMultiroomApi:
 
         :param cp_id: Cp service id as returned by get_cp_list()
         """
-        params = [('cpservice_id', int(cp_id))]
-
-        self.get(COMMAND_CPM, 'SetCpService', params)
+        self.call('SetCpService', cp_id)
 
     def get_cp_info(self):
         """
@@ -972,7 +1296,7 @@ class SamsungMultiroomApi:
                 - playstatus - play|pause
             },
         """
-        return self.get(COMMAND_CPM, 'GetCpInfo')
+        return self.call('GetCpInfo')
 
     def set_sign_in(self, username, password):
         """
@@ -981,12 +1305,7 @@ class SamsungMultiroomApi:
         :param username: Service username
         :param password: Service password
         """
-        params = [
-            ('username', username),
-            ('password', password),
-        ]
-
-        self.get(COMMAND_CPM, 'SetSignIn', params)
+        self.call('SetSignIn', username, password)
 
     def set_sign_out(self):
         """
@@ -994,7 +1313,7 @@ class SamsungMultiroomApi:
 
         You need to be authenticated for this call to be successful.
         """
-        self.get(COMMAND_CPM, 'SetSignOut')
+        self.call('SetSignOut')
 
     def get_cp_submenu(self):
         """
@@ -1004,9 +1323,7 @@ class SamsungMultiroomApi:
             - @id - id of the menu item
             - submenuitem_localized - menu item name
         """
-        response = self.get(COMMAND_CPM, 'GetCpSubmenu')
-
-        return response_list(response['submenu']['submenuitem'])
+        return self.call('GetCpSubmenu')
 
     def set_select_cp_submenu(self, content_id, start_index, list_count):
         """
@@ -1020,15 +1337,7 @@ class SamsungMultiroomApi:
             - title
             - contentid
         """
-        params = [
-            ('contentid', int(content_id)),
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'SetSelectCpSubmenu', params)
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('SetSelectCpSubmenu', content_id, start_index, list_count)
 
     def get_cp_player_playlist(self, start_index, list_count):
         """
@@ -1051,20 +1360,13 @@ class SamsungMultiroomApi:
             - thumbnail - thumbnail url
 
         """
-        params = [
-            ('startindex', int(start_index)),
-            ('listcount', int(list_count)),
-        ]
-
-        response = self.get(COMMAND_CPM, 'GetCpPlayerPlaylist', params)
-
-        return response_list(response['menulist']['menuitem'])
+        return self.call('GetCpPlayerPlaylist', start_index, list_count)
 
     def set_skip_current_track(self):
         """
         Skip current track and play next item on the playlist.
         """
-        self.get(COMMAND_CPM, 'SetSkipCurrentTrack')
+        self.call('SetSkipCurrentTrack')
 
     def get_current_play_time(self):
         """
@@ -1074,7 +1376,7 @@ class SamsungMultiroomApi:
             - tracklength - track length in seconds
             - playtime - playback position in seconds
         """
-        return self.get(COMMAND_UIC, 'GetCurrentPlayTime')
+        return self.call('GetCurrentPlayTime')
 
     def set_play_cp_playlist_track(self, item_id):
         """
@@ -1082,9 +1384,7 @@ class SamsungMultiroomApi:
 
         :param item_id: Item id as returned by get_cp_player_playlist()
         """
-        params = [('selectitemid', int(item_id))]
-
-        return self.get(COMMAND_CPM, 'SetPlayCpPlaylistTrack', params)
+        return self.call('SetPlayCpPlaylistTrack', item_id)
 
     def get_repeat_mode(self):
         """
@@ -1092,97 +1392,64 @@ class SamsungMultiroomApi:
 
         :returns: string one|all|off for repeat one track, all tracks on the playlist, or disabled repeat mode
         """
-        response = self.get(COMMAND_UIC, 'GetRepeatMode')
+        return self.call('GetRepeatMode')
 
-        return response['repeat']
-
-    def set_repeat_mode(self, mode):
+    def set_repeat_mode(self, mode, force=False):
         """
         Set playback repeat mode.
 
         :param mode: string one|all|off for repeat one track, all tracks on the playlist, or disabled repeat mode
+        :param force: Send the request even if speaker is already known to be in requested state
         """
-        params = [('repeatmode', mode)]
-
-        self.get(COMMAND_UIC, 'SetRepeatMode', params)
-
-
-def on_off_bool(value):
-    """Convert on/off to True/False correspondingly."""
-    return value == 'on'
-
-
-def bool_on_off(value):
-    """Convert True/False to on/off correspondingly."""
-    return 'on' if value else 'off'
+        self.call('SetRepeatMode', mode, force=force)
 
 
-def response_list(input_list):
-    """xmltodict returns different structure if there's one item on the list."""
-    if isinstance(input_list, dict):
-        input_list = [input_list]
-
-    return input_list
-
-
-def format_action(action):
-    """Format request action."""
-    return '<name>{0}</name>'.format(action)
-
-
-def format_param(param):
+def is_idempotent(action):
     """
-    Format request parameter.
-
-    :param param: Tuple e.g. ('list_count', 30, 'dec')
-        - name - name of the param
-        - value - mixed value
-        - type_hint - (optionally) str|dec|cdata|dec_arr
+    :param action: Action name e.g. GetVolume
+    :returns: True if action only reads speaker's state and can be safely sent more than once
     """
-    (name, value, *attributes) = param
-
-    if not attributes:
-        type_hint = 'str'
-        if isinstance(value, int):
-            type_hint = 'dec'
-        if isinstance(value, list) and value and isinstance(value[0], int):
-            type_hint = 'dec_arr'
-    else:
-        type_hint = attributes[0]
-
-    if type_hint == 'cdata':
-        return '<p type="{0}" name="{1}" val="empty"><![CDATA[{2}]]></p>'.format(type_hint, name, value)
-    if type_hint == 'dec_arr':
-        value = ''.join(['<item>{0}</item>'.format(v) for v in value])
-        return '<p type="{0}" name="{1}" val="empty">{2}</p>'.format(type_hint, name, value)
+    return action.startswith(('Get', 'PCGet'))
 
-    return '<p type="{0}" name="{1}" val="{2}"/>'.format(type_hint, name, value)
 
+def paginator(*args, prefetch=0, page_sizer=None):
+    """
+    Generator to paginate over api call.
 
-def format_payload(action, params=None):
-    """Format full request payload."""
-    payload = format_action(action)
-    if params:
-        for param in params:
-            payload += format_param(param)
+    Api method must accept start_index and list_count parameters.
 
-    return payload
+    Page size starts at list_count and is tuned by the page sizer of the api, see PageSizer. Pages of get_* and
+    pc_get_* methods that time out or are received malformed are retried at a smaller size, as long as it is above the
+    minimum of the page sizer. Streamed pages are retried only if they fail before their first item is received.
 
+    A page shorter than requested ends the list. Speaker might cut a page grown by the page sizer short on its own
+    though, so such a page ends the list only if it is also shorter than the largest page received before, otherwise
+    the list continues right after it.
 
-def paginator(*args):
-    """
-    Generator to paginate over api call.
+    With prefetch, first page is fetched on its own, as secondary function might depend on it having been called.
+    Subsequent pages are requested in advance from worker threads while the current one is consumed, and yielded in
+    order up to the first short page. Requests still queue with the api scheduler, so the speaker never receives more
+    of them at once than its concurrency allows. Up to prefetch pages past the end of the list might be requested.
+    Prefetched pages of a streaming api are read in full by the worker threads.
 
-    Api method must accept start_index and list_count parameters.
+    Example:
+        for item in paginator(api.pc_get_music_list_by_id, device_udn, parent_id, 0, 20, prefetch=4):
+            print(item['title'])
 
     :param: callable function to use for pagination
     :param: optionally pass second function that will be used for subsequent pages
     :param: pass all initial values that first callable function accepts, they will be replicated to a second callable
+    :param prefetch: Number of pages requested ahead of the one being consumed, 0 to fetch one page at a time
+    :param page_sizer: (optional) PageSizer instance, defaults to the one of the api the function is bound to, if any,
+        False to keep list_count as passed
     :returns: Iterable
     """
     if not callable(args[0]):
         raise ValueError('First argument must be a function')
 
+    if prefetch < 0:
+        raise ValueError('Prefetch must not be negative')
+
     primary = args[0]
     secondary = args[0]
     args = args[1:]
@@ -1203,20 +1470,199 @@ def paginator(*args):
         if parameter in secondary_parameters:
             secondary_kwargs[parameter] = args[i]
 
-    current = primary
-    current_kwargs = primary_kwargs
-    has_more = True
+    if page_sizer is None:
+        page_sizer = getattr(getattr(primary, '__self__', None), 'page_sizer', None)
+    elif page_sizer is False:
+        page_sizer = None
 
-    while has_more:
-        items = current(**current_kwargs)
+    current = _Pages(primary, primary_kwargs, page_sizer)
+    pages = _Pages(secondary, secondary_kwargs, page_sizer)
+    start_index = primary_kwargs['start_index']
+    full_page_size = primary_kwargs['list_count']
+
+    while True:
+        items, list_count = current.load(current.get_kwargs(start_index))
+
+        # items might be streamed, count them as they come
+        count = 0
         for item in items:
+            count += 1
             yield item
 
-        has_more = len(items) >= current_kwargs['list_count']
+        if _is_last_page(count, list_count, full_page_size):
+            return
+
+        full_page_size = max(full_page_size, min(count, list_count))
+        start_index += min(count, list_count)
+        current = pages
+
+        if prefetch:
+            yield from _prefetch_pages(pages, start_index, prefetch, full_page_size)
+            return
+
+
+class _Pages:
+
+    def __init__(self, load, kwargs, page_sizer):
+        self._load = load
+        self._kwargs = kwargs
+        self._page_sizer = page_sizer
+        self._method = getattr(load, '__name__', None)
+        # list calls selecting a submenu or the like change speaker's state, sending them twice is not safe
+        self._retryable = self._method is not None and self._method.startswith(('get_', 'pc_get_'))
+
+    def get_kwargs(self, start_index):
+        """Build call kwargs of the page starting at start_index, sized by the page sizer."""
+        kwargs = dict(self._kwargs, start_index=start_index)
+
+        if self._page_sizer is not None:
+            kwargs['list_count'] = self._page_sizer.get_page_size(self._method, kwargs['list_count'])
+
+        return kwargs
+
+    def load(self, kwargs):
+        """
+        :returns: Tuple (items, list_count the page was received with), smaller than requested if page was shrunk
+        """
+        if self._page_sizer is None:
+            return (self._load(**kwargs), kwargs['list_count'])
+
+        while True:
+            started = _time.monotonic()
+
+            try:
+                items = self._load(**kwargs)
+
+                if isinstance(items, list):
+                    self._page_sizer.observe(self._method, kwargs['list_count'], _time.monotonic() - started)
+                    return (items, kwargs['list_count'])
+
+                # streamed page is sent once iteration starts, wait for its first item to know it got through
+                items = iter(items)
+                first = next(items, _END)
+            except SamsungMultiroomApiException as api_exception:
+                list_count = kwargs['list_count']
+
+                retryable = self._retryable and _is_transient_failure(api_exception)
+                if not retryable or list_count <= self._page_sizer.minimum:
+                    raise
+
+                kwargs = dict(kwargs, list_count=min(list_count - 1, self._page_sizer.backoff(self._method,
+                                                                                              list_count)))
+                continue
+
+            return (self._observe(first, items, kwargs['list_count'], started), kwargs['list_count'])
+
+    def fetch(self, kwargs):
+        """Load page and read all of its items, for pages loaded by worker threads."""
+        items, list_count = self.load(kwargs)
+
+        return (list(items), list_count)
+
+    def _observe(self, first, items, list_count, started):
+        if first is _END:
+            self._page_sizer.observe(self._method, list_count, _time.monotonic() - started)
+            return
+
+        yield first
+        yield from items
+
+        self._page_sizer.observe(self._method, list_count, _time.monotonic() - started)
+
+
+_END = object()
+
+
+def _is_last_page(count, list_count, full_page_size):
+    return count < list_count and count < full_page_size
+
+
+def _prefetch_pages(pages, start_index, prefetch, full_page_size):
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch,
+                                                     thread_name_prefix='samsung-multiroom-paginator')
+    pending = collections.deque()
+    next_start_index = start_index
+
+    def submit():
+        nonlocal next_start_index
+
+        kwargs = pages.get_kwargs(next_start_index)
+        # pages fetched in other threads still belong to the span of the caller
+        pending.append((next_start_index, executor.submit(contextvars.copy_context().run, pages.fetch, kwargs)))
+        next_start_index += kwargs['list_count']
+
+    try:
+        for _ in range(prefetch):
+            submit()
+
+        while True:
+            page_start_index, future = pending.popleft()
+
+            # a page was shrunk, pages planned after it would leave a gap
+            if page_start_index != start_index:
+                future.cancel()
+                for _, pending_future in pending:
+                    pending_future.cancel()
+
+                pending.clear()
+                next_start_index = start_index
+
+                for _ in range(prefetch):
+                    submit()
+
+                continue
+
+            items, list_count = future.result()
+
+            # keep the pipeline full while the page is consumed
+            submit()
+
+            yield from items
+
+            if _is_last_page(len(items), list_count, full_page_size):
+                return
+
+            full_page_size = max(full_page_size, min(len(items), list_count))
+            start_index += min(len(items), list_count)
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+
+class _MalformedResponseError(ValueError):
+    """Response body could not be parsed."""
+
+
+def _parse_response(response_text):
+    _LOGGER.debug('Response %s', response_text)
+
+    response = ApiResponse(response_text, lazy=False)
+
+    if response.name is None:
+        raise SamsungMultiroomApiException('Received invalid response {0}'.format(
+            response.raw)) from _MalformedResponseError()
+
+    if not response.success:
+        raise SamsungMultiroomApiException('Received invalid response {0}'.format(response.raw))
+
+    return response
+
+
+def _is_transport_failure(api_exception):
+    return isinstance(api_exception.__cause__, TransportException)
+
+
+def _is_transient_failure(exception):
+    return isinstance(exception.__cause__, (TransportException, _MalformedResponseError))
+
+
+def _get_size(text):
+    if text is None:
+        return 0
 
-        current = secondary
-        current_kwargs = secondary_kwargs
-        current_kwargs['start_index'] = current_kwargs['start_index'] + current_kwargs['list_count']
+    return len(text.encode() if isinstance(text, str) else text)
 
 
 def _get_callable_parameters(arg_callable):
@@ -0,0 +1,709 @@
+"""Asyncio api to communicate with samsung multiroom speaker."""
+import logging
+import urllib.parse
+
+from .api import COMMAND_CPM
+from .api import COMMAND_UIC
+from .api import METHOD_GET
+from .api import SamsungMultiroomApiException
+from .api import _get_callable_parameters
+from .api import _parse_response
+from .api_commands import COMMANDS
+from .api_payload import format_request
+from .transport import AsyncioTransport
+from .transport import TransportException
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncSamsungMultiroomApi:
+    """
+    Asyncio counterpart of SamsungMultiroomApi.
+
+    Exposes the same api calls as coroutines, so multiple speakers can be controlled concurrently from a single event
+    loop without a thread per speaker.
+
+    Example:
+        apis = [AsyncSamsungMultiroomApi('unique-id', ip) for ip in ['192.168.1.129', '192.168.1.130']]
+        volumes = await asyncio.gather(*[api.get_volume() for api in apis])
+    """
+
+    def __init__(self, user, ip_address, port=55001, timeout=5, transport=None, records=False):
+        """
+        Initialise endpoint.
+
+        :param user: User identifier to pass along with request
+        :param ip_address: IP address of the speaker to connect to
+        :param port: Port to use, defaults to 55001
+        :param timeout: Timeout in seconds
+        :param transport: (optional) AsyncTransport instance, defaults to AsyncioTransport
+        :param records: Return items of music, preset, radio and app lists as Record instances with converted fields
+            instead of dicts
+        """
+        self._user = user
+        self._ip_address = ip_address
+        self._port = port
+        self._timeout = timeout
+        self._transport = transport or AsyncioTransport()
+        self._records = records
+
+    @property
+    def ip_address(self):
+        """
+        :returns: IP address of the host
+        """
+        return self._ip_address
+
+    @property
+    def port(self):
+        """
+        :returns: Port to use
+        """
+        return self._port
+
+    @property
+    def transport(self):
+        """
+        :returns: AsyncTransport instance used to make requests
+        """
+        return self._transport
+
+    async def close(self):
+        """
+        Close all idle connections.
+        """
+        await self._transport.close()
+
+    async def request(self, method, command, payload):
+        """
+        Makes a request to a configured endpoint.
+
+        :param method: HTTP method to use
+        :param command: UIC|CPM
+        :param payload: XML string with payload
+        :returns: Response dict
+        :raises: ValueError
+        :raises: SamsungMultiroomApiException
+        """
+        if method not in [METHOD_GET]:
+            raise ValueError('Invalid method {0}, must be one of METHOD_* constants'.format(method))
+
+        if command not in [COMMAND_UIC, COMMAND_CPM]:
+            raise ValueError('Invalid command {0}, must be one of COMMAND_* constants'.format(method))
+
+        path = '/{0}?cmd={1}'.format(command, urllib.parse.quote(payload))
+
+        return await self._request_path(path, payload)
+
+    async def _request_path(self, path, payload):
+        url = 'http://{0}:{1}{2}'.format(self._ip_address, self._port, path)
+
+        try:
+            _LOGGER.debug('Request %s. Raw payload %s', url, payload)
+            response_text = await self._transport.request(self._ip_address, self._port, path, self._get_headers(),
+                                                          self._timeout)
+
+            return self._parse_response_text(response_text)
+        except TransportException as transport_exception:
+            _LOGGER.error('Request %s failed', url, exc_info=1)
+            raise SamsungMultiroomApiException('Request {0} failed'.format(url)) from transport_exception
+
+    def _get_headers(self):
+        return {
+            'mobileUUID': self._user,
+            'mobileName': 'Wireless Audio',
+            'mobileVersion': '1.0',
+        }
+
+    def _parse_response_text(self, response_text):
+        return _parse_response(response_text).data
+
+    async def get(self, command, action, params=None):
+        """
+        Generic GET request.
+
+        :param command: COMMAND_* constant
+        :param action: Get action name to execute e.g. GetVolume
+        :param params: List of tuples (name, value, (optional) type hint str/dec/cdata)
+        :returns dict
+        """
+        payload, path = format_request(command, action, params)
+
+        return await self._request_path(path, payload)
+
+    async def call(self, name, *args):
+        """
+        Make a call described by the command table.
+
+        See SamsungMultiroomApi.call().
+        """
+        command = COMMANDS.get(name)
+        if command is None:
+            raise ValueError('Unknown action {0}'.format(name))
+
+        return command.decode(await self.get(command.command, name, command.encode(*args)), self._records)
+
+    async def get_main_info(self):
+        """
+        Get main information about speaker.
+
+        See SamsungMultiroomApi.get_main_info().
+        """
+        path = format_request(COMMAND_UIC, 'GetMainInfo')[1]
+        url = 'http://{0}:{1}{2}'.format(self._ip_address, self._port, path)
+
+        stream = self._transport.stream(self._ip_address, self._port, path, self._get_headers(), self._timeout)
+
+        # Speaker sends two http responses for this request, latter one contains correct payload.
+        try:
+            async for response_text in stream:
+                response = _parse_response(response_text)
+
+                if response.name == 'MainInfo':
+                    return response.data
+        except TransportException as transport_exception:
+            _LOGGER.error('Request %s failed', url, exc_info=1)
+            raise SamsungMultiroomApiException('Request {0} failed'.format(url)) from transport_exception
+        finally:
+            await stream.aclose()
+
+        raise SamsungMultiroomApiException('Request {0} failed'.format(url))
+
+    async def get_speaker_name(self):
+        """
+        Get speaker name.
+
+        See SamsungMultiroomApi.get_speaker_name().
+        """
+        return await self.call('GetSpkName')
+
+    async def set_speaker_name(self, name):
+        """
+        Set speaker name.
+
+        See SamsungMultiroomApi.set_speaker_name().
+        """
+        await self.call('SetSpkName', name)
+
+    async def get_volume(self):
+        """
+        Get current volume level between 0 and 100.
+
+        See SamsungMultiroomApi.get_volume().
+        """
+        return await self.call('GetVolume')
+
+    async def set_volume(self, volume):
+        """
+        Set speaker volume level.
+
+        See SamsungMultiroomApi.set_volume().
+        """
+        await self.call('SetVolume', volume)
+
+    async def get_mute(self):
+        """
+        Get mute state of the speaker.
+
+        See SamsungMultiroomApi.get_mute().
+        """
+        return await self.call('GetMute')
+
+    async def set_mute(self, mute):
+        """
+        Mute/unmute the speaker.
+
+        See SamsungMultiroomApi.set_mute().
+        """
+        await self.call('SetMute', mute)
+
+    async def get_func(self):
+        """
+        Retrieve current source for the speaker.
+
+        See SamsungMultiroomApi.get_func().
+        """
+        return await self.call('GetFunc')
+
+    async def set_func(self, function):
+        """
+        Set the source for the speaker
+
+        See SamsungMultiroomApi.set_func().
+        """
+        await self.call('SetFunc', function)
+
+    async def get_shuffle_mode(self):
+        """
+        Retrieve currently set shuffle mode.
+
+        See SamsungMultiroomApi.get_shuffle_mode().
+        """
+        return await self.call('GetShuffleMode')
+
+    async def set_shuffle_mode(self, shuffle_mode):
+        """
+        Enable/disable shuffle mode of the playlist.
+
+        See SamsungMultiroomApi.set_shuffle_mode().
+        """
+        await self.call('SetShuffleMode', shuffle_mode)
+
+    async def set_trick_mode(self, trick_mode):
+        """
+        Move to next/previous track on the playlist.
+
+        See SamsungMultiroomApi.set_trick_mode().
+        """
+        await self.call('SetTrickMode', trick_mode)
+
+    async def set_playback_control(self, playback_control):
+        """
+        Pause/resume current playlist.
+
+        See SamsungMultiroomApi.set_playback_control().
+        """
+        await self.call('SetPlaybackControl', playback_control)
+
+    async def get_music_info(self):
+        """
+        Get detailed information about current track on the playlist.
+
+        See SamsungMultiroomApi.get_music_info().
+        """
+        return await self.call('GetMusicInfo')
+
+    async def get_play_status(self):
+        """
+        Get information about play/pause status for the playlist.
+
+        See SamsungMultiroomApi.get_play_status().
+        """
+        return await self.call('GetPlayStatus')
+
+    async def set_search_time(self, play_time):
+        """
+        Set current track to play from a specific time.
+
+        See SamsungMultiroomApi.set_search_time().
+        """
+        await self.call('SetSearchTime', play_time)
+
+    async def get_preset_list(self, start_index, list_count):
+        """
+        Get list of predefined radios.
+
+        See SamsungMultiroomApi.get_preset_list().
+        """
+        return await self.call('GetPresetList', start_index, list_count)
+
+    async def get_radio_info(self):
+        """
+        Retrieves currently selected radio info and play status.
+
+        See SamsungMultiroomApi.get_radio_info().
+        """
+        return await self.call('GetRadioInfo')
+
+    async def set_play_preset(self, preset_type, preset_index):
+        """
+        Select radio of a particular index.
+
+        See SamsungMultiroomApi.set_play_preset().
+        """
+        await self.call('SetPlayPreset', preset_type, preset_index)
+
+    async def set_select_radio(self):
+        """
+        Play selected preset preset.
+
+        See SamsungMultiroomApi.set_select_radio().
+        """
+        await self.call('SetSelectRadio')
+
+    async def get_dms_list(self, start_index, list_count):
+        """
+        Retrieve list of DLNA compatible devices to use as a media source.
+
+        See SamsungMultiroomApi.get_dms_list().
+        """
+        return await self.call('GetDmsList', start_index, list_count)
+
+    async def pc_get_music_list_by_category(self, device_udn, start_index, list_count):
+        """
+        Browse containers at the root of the DLNA device.
+
+        See SamsungMultiroomApi.pc_get_music_list_by_category().
+        """
+        return await self.call('PCGetMusicListByCategory', device_udn, start_index, list_count)
+
+    async def pc_get_music_list_by_id(self, device_udn, parent_id, start_index, list_count):
+        """
+        Browse containers/audio items in the container of the DLNA device.
+
+        See SamsungMultiroomApi.pc_get_music_list_by_id().
+        """
+        return await self.call('PCGetMusicListByID', device_udn, parent_id, start_index, list_count)
+
+    async def set_playlist_playback_control(self, items):
+        """
+        Create a playlist and playback.
+
+        See SamsungMultiroomApi.set_playlist_playback_control().
+        """
+        await self.call('SetPlaylistPlaybackControl', items)
+
+    async def browse_main(self, start_index, list_count):
+        """
+        Browse radios from the root.
+
+        See SamsungMultiroomApi.browse_main().
+        """
+        return await self.call('BrowseMain', start_index, list_count)
+
+    async def get_select_radio_list(self, content_id, start_index, list_count):
+        """
+        Browse specific radio folder.
+
+        See SamsungMultiroomApi.get_select_radio_list().
+        """
+        return await self.call('GetSelectRadioList', content_id, start_index, list_count)
+
+    async def get_current_radio_list(self, start_index, list_count):
+        """
+        Browse previously browsed radio folder.
+
+        See SamsungMultiroomApi.get_current_radio_list().
+        """
+        return await self.call('GetCurrentRadioList', start_index, list_count)
+
+    async def get_upper_radio_list(self, start_index, list_count):
+        """
+        Browse parent of a browsed radio folder.
+
+        See SamsungMultiroomApi.get_upper_radio_list().
+        """
+        return await self.call('GetUpperRadioList', start_index, list_count)
+
+    async def set_play_select(self, content_ids):
+        """
+        Plays selected radio or app item.
+
+        See SamsungMultiroomApi.set_play_select().
+        """
+        await self.call('SetPlaySelect', content_ids)
+
+    async def get_station_data(self, content_id):
+        """
+        Get radio station data.
+
+        See SamsungMultiroomApi.get_station_data().
+        """
+        return await self.call('GetStationData', content_id)
+
+    async def get_7band_eq_list(self):
+        """
+        Retrieve equalizer presets.
+
+        See SamsungMultiroomApi.get_7band_eq_list().
+        """
+        return await self.call('Get7BandEQList')
+
+    async def get_current_eq_mode(self):
+        """
+        Retrieve current equalizer settings.
+
+        See SamsungMultiroomApi.get_current_eq_mode().
+        """
+        return await self.call('GetCurrentEQMode')
+
+    async def set_7band_eq_value(self, preset_index, values):
+        """
+        Set preset's equalizer settings.
+
+        See SamsungMultiroomApi.set_7band_eq_value().
+        """
+        await self.call('Set7bandEQValue', preset_index, values)
+
+    async def set_7band_eq_mode(self, preset_index):
+        """
+        Switch equalizer to a predefined preset.
+
+        See SamsungMultiroomApi.set_7band_eq_mode().
+        """
+        await self.call('Set7bandEQMode', preset_index)
+
+    async def reset_7band_eq_value(self, preset_index, values):
+        """
+        Overwrite preset's equalizer settings.
+
+        See SamsungMultiroomApi.reset_7band_eq_value().
+        """
+        await self.call('Reset7bandEQValue', preset_index, values)
+
+    async def del_custom_eq_mode(self, preset_index):
+        """
+        Delete custom preset.
+
+        See SamsungMultiroomApi.del_custom_eq_mode().
+        """
+        await self.call('DelCustomEQMode', preset_index)
+
+    async def add_custom_eq_mode(self, preset_index, preset_name):
+        """
+        Creates a new custom preset, using currently set equilizer values.
+
+        See SamsungMultiroomApi.add_custom_eq_mode().
+        """
+        await self.call('AddCustomEQMode', preset_index, preset_name)
+
+    async def set_speaker_time(self, datetime):
+        """
+        Set speaker's internal time
+
+        See SamsungMultiroomApi.set_speaker_time().
+        """
+        await self.call('SetSpeakerTime', datetime.year, datetime.month, datetime.day, datetime.hour, datetime.minute,
+                        datetime.second)
+
+    async def get_sleep_timer(self):
+        """
+        Get sleep timer settings
+
+        See SamsungMultiroomApi.get_sleep_timer().
+        """
+        return await self.call('GetSleepTimer')
+
+    async def set_sleep_timer(self, option, time):
+        """
+        Put speaker into sleep mode after specific time
+
+        See SamsungMultiroomApi.set_sleep_timer().
+        """
+        await self.call('SetSleepTimer', option, time)
+
+    async def get_alarm_info(self):
+        """
+        Get list of set alarms.
+
+        See SamsungMultiroomApi.get_alarm_info().
+        """
+        return await self.call('GetAlarmInfo')
+
+    async def set_alarm_on_off(self, index, alarm):
+        """
+        Enable/disable alarm.
+
+        See SamsungMultiroomApi.set_alarm_on_off().
+        """
+        await self.call('SetAlarmOnOff', index, alarm)
+
+    async def get_alarm_sound_list(self):
+        """
+        Get list of predefined alarm sounds to use for alarm.
+
+        See SamsungMultiroomApi.get_alarm_sound_list().
+        """
+        return await self.call('GetAlarmSoundList')
+
+    async def set_alarm_info(self, index, hour, minute, week, duration, volume, station_data):
+        """
+        Create alarm.
+
+        See SamsungMultiroomApi.set_alarm_info().
+        """
+        await self.call('SetAlarmInfo', index, hour, minute, week, duration, volume, station_data)
+
+    async def del_alarm(self, index_list):
+        """
+        Delete alarm(s).
+
+        See SamsungMultiroomApi.del_alarm().
+        """
+        await self.call('DelAlarm', index_list)
+
+    async def spk_in_group(self, action):
+        """
+        Speaker grouping action.
+
+        See SamsungMultiroomApi.spk_in_group().
+        """
+        return await self.call('SpkInGroup', action)
+
+    async def set_multispk_group(self, name, speakers):
+        """
+        Group speakers.
+
+        See SamsungMultiroomApi.set_multispk_group().
+        """
+        await self.call('SetMultispkGroup', name, speakers)
+
+    async def set_ungroup(self):
+        """
+        Ungroup speakers.
+
+        See SamsungMultiroomApi.set_ungroup().
+        """
+        await self.call('SetUngroup')
+
+    async def set_group_name(self, name):
+        """
+        Update speaker's group name.
+
+        See SamsungMultiroomApi.set_group_name().
+        """
+        await self.call('SetGroupName', name)
+
+    async def get_cp_list(self, start_index, list_count):
+        """
+        Get list of speakers app integrations.
+
+        See SamsungMultiroomApi.get_cp_list().
+        """
+        return await self.call('GetCpList', start_index, list_count)
+
+    async def set_cp_service(self, cp_id):
+        """
+        Switch to a specific cp service.
+
+        See SamsungMultiroomApi.set_cp_service().
+        """
+        await self.call('SetCpService', cp_id)
+
+    async def get_cp_info(self):
+        """
+        Get info about currently active cp service.
+
+        See SamsungMultiroomApi.get_cp_info().
+        """
+        return await self.call('GetCpInfo')
+
+    async def set_sign_in(self, username, password):
+        """
+        Authenticate with the currently active service.
+
+        See SamsungMultiroomApi.set_sign_in().
+        """
+        await self.call('SetSignIn', username, password)
+
+    async def set_sign_out(self):
+        """
+        Sign out from the currently active service.
+
+        See SamsungMultiroomApi.set_sign_out().
+        """
+        await self.call('SetSignOut')
+
+    async def get_cp_submenu(self):
+        """
+        Get list of top level service categories.
+
+        See SamsungMultiroomApi.get_cp_submenu().
+        """
+        return await self.call('GetCpSubmenu')
+
+    async def set_select_cp_submenu(self, content_id, start_index, list_count):
+        """
+        Get list of sub categories.
+
+        See SamsungMultiroomApi.set_select_cp_submenu().
+        """
+        return await self.call('SetSelectCpSubmenu', content_id, start_index, list_count)
+
+    async def get_cp_player_playlist(self, start_index, list_count):
+        """
+        Get currently active service playlist.
+
+        See SamsungMultiroomApi.get_cp_player_playlist().
+        """
+        return await self.call('GetCpPlayerPlaylist', start_index, list_count)
+
+    async def set_skip_current_track(self):
+        """
+        Skip current track and play next item on the playlist.
+
+        See SamsungMultiroomApi.set_skip_current_track().
+        """
+        await self.call('SetSkipCurrentTrack')
+
+    async def get_current_play_time(self):
+        """
+        Get info about current track playback position and length.
+
+        See SamsungMultiroomApi.get_current_play_time().
+        """
+        return await self.call('GetCurrentPlayTime')
+
+    async def set_play_cp_playlist_track(self, item_id):
+        """
+        Advance playback to specific track on the playlist.
+
+        See SamsungMultiroomApi.set_play_cp_playlist_track().
+        """
+        return await self.call('SetPlayCpPlaylistTrack', item_id)
+
+    async def get_repeat_mode(self):
+        """
+        Get playback repeat mode.
+
+        See SamsungMultiroomApi.get_repeat_mode().
+        """
+        return await self.call('GetRepeatMode')
+
+    async def set_repeat_mode(self, mode):
+        """
+        Set playback repeat mode.
+
+        See SamsungMultiroomApi.set_repeat_mode().
+        """
+        await self.call('SetRepeatMode', mode)
+
+
+async def async_paginator(*args):
+    """
+    Asynchronous generator to paginate over async api call.
+
+    Api method must be a coroutine accepting start_index and list_count parameters.
+
+    :param: coroutine function to use for pagination
+    :param: optionally pass second coroutine function that will be used for subsequent pages
+    :param: pass all initial values that first coroutine function accepts, they will be replicated to a second one
+    :returns: Async iterable
+    """
+    if not callable(args[0]):
+        raise ValueError('First argument must be a function')
+
+    primary = args[0]
+    secondary = args[0]
+    args = args[1:]
+
+    if callable(args[0]):
+        secondary = args[0]
+        args = args[1:]
+
+    primary_parameters = _get_callable_parameters(primary)
+    secondary_parameters = _get_callable_parameters(secondary)
+
+    # match primary_parameters with args
+    primary_kwargs = {}
+    secondary_kwargs = {}
+
+    for i, parameter in enumerate(primary_parameters):
+        primary_kwargs[parameter] = args[i]
+        if parameter in secondary_parameters:
+            secondary_kwargs[parameter] = args[i]
+
+    current = primary
+    current_kwargs = primary_kwargs
+    has_more = True
+
+    while has_more:
+        items = await current(**current_kwargs)
+        for item in items:
+            yield item
+
+        has_more = len(items) >= current_kwargs['list_count']
+
+        current = secondary
+        current_kwargs = secondary_kwargs
+        current_kwargs['start_index'] = current_kwargs['start_index'] + current_kwargs['list_count']
@@ -0,0 +1,180 @@
+"""
+Same call made on many speakers at once.
+"""
+import concurrent.futures
+import contextvars
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BulkExecutor:
+    """
+    Run the same action on many targets from a bounded pool of threads, within a total deadline.
+
+    Targets are usually SamsungMultiroomApi instances, but anything with the named method works, Speaker instances
+    included. A failing target does not affect the others, every target gets its own BulkResult, so whole run takes
+    roughly as long as the slowest target rather than all of them together.
+
+    Example:
+        executor = BulkExecutor(concurrency=8, deadline=10)
+
+        for result in executor.run(apis, 'get_main_info'):
+            if result.ok:
+                print(result.target.ip_address, result.value['spkname'])
+
+        executor.run(apis, 'set_speaker_time', datetime.datetime.now())
+    """
+
+    def __init__(self, concurrency=8, deadline=None):
+        """
+        :param concurrency: Maximum number of targets called at once
+        :param deadline: (optional) Time in seconds after which targets still not answered fail with TimeoutError
+        """
+        if concurrency < 1:
+            raise ValueError('Concurrency must be at least 1')
+
+        if deadline is not None and deadline <= 0:
+            raise ValueError('Deadline must be positive')
+
+        self._concurrency = concurrency
+        self._deadline = deadline
+
+    @property
+    def concurrency(self):
+        """
+        :returns: Maximum number of targets called at once
+        """
+        return self._concurrency
+
+    @property
+    def deadline(self):
+        """
+        :returns: Time in seconds after which targets still not answered fail, None to wait for all of them
+        """
+        return self._deadline
+
+    def run(self, targets, action, *args, **kwargs):
+        """
+        Call action on every target.
+
+        Calls still running when the deadline passes are left to finish in the background, their results are
+        discarded.
+
+        :param targets: List of SamsungMultiroomApi, Speaker or other instances
+        :param action: Method name e.g. get_main_info, or callable accepting target followed by args and kwargs
+        :param args: Positional arguments of the call
+        :param kwargs: Keyword arguments of the call
+        :returns: List of BulkResult instances, in the order of targets
+        """
+        targets = list(targets)
+        if not targets:
+            return []
+
+        def call(target):
+            started = time.monotonic()
+
+            try:
+                if callable(action):
+                    value = action(target, *args, **kwargs)
+                else:
+                    value = getattr(target, action)(*args, **kwargs)
+            except Exception as exception:  # pylint: disable=broad-except
+                return BulkResult(target, error=exception, elapsed=time.monotonic() - started)
+
+            return BulkResult(target, value=value, elapsed=time.monotonic() - started)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(self._concurrency, len(targets)),
+                                                         thread_name_prefix='samsung-multiroom-bulk')
+
+        try:
+            futures = [executor.submit(contextvars.copy_context().run, call, target) for target in targets]
+            concurrent.futures.wait(futures, timeout=self._deadline)
+        finally:
+            executor.shutdown(wait=False)
+
+        results = []
+
+        for target, future in zip(targets, futures):
+            if future.done():
+                results.append(future.result())
+                continue
+
+            future.cancel()
+            _LOGGER.debug('Bulk call %s on %s did not finish within %s seconds', action, target, self._deadline)
+            results.append(BulkResult(target, error=TimeoutError('Deadline of {0} seconds exceeded'.format(
+                self._deadline)), elapsed=self._deadline))
+
+        return results
+
+
+class BulkResult:
+    """
+    Result of a call made on one of the targets of a bulk run.
+    """
+
+    __slots__ = ('_target', '_value', '_error', '_elapsed')
+
+    def __init__(self, target, value=None, error=None, elapsed=None):
+        """
+        :param target: Target the call was made on
+        :param value: Value returned by the call
+        :param error: Exception raised by the call, or TimeoutError if it did not finish in time
+        :param elapsed: Time in seconds the call took
+        """
+        self._target = target
+        self._value = value
+        self._error = error
+        self._elapsed = elapsed
+
+    @property
+    def target(self):
+        """
+        :returns: Target the call was made on
+        """
+        return self._target
+
+    @property
+    def value(self):
+        """
+        :returns: Value returned by the call, None if it failed
+        """
+        return self._value
+
+    @property
+    def error(self):
+        """
+        :returns: Exception raised by the call, None if it succeeded
+        """
+        return self._error
+
+    @property
+    def ok(self):
+        """
+        :returns: True if the call succeeded
+        """
+        return self._error is None
+
+    @property
+    def elapsed(self):
+        """
+        :returns: Time in seconds the call took
+        """
+        return self._elapsed
+
+    def get(self):
+        """
+        :returns: Value returned by the call
+        :raises: Exception raised by the call
+        """
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def __repr__(self):
+        if self._error is not None:
+            return 'BulkResult({0!r}, error={1!r})'.format(self._target, self._error)
+
+        return 'BulkResult({0!r}, value={1!r})'.format(self._target, self._value)
@@ -0,0 +1,300 @@
+"""
+Read-through cache for idempotent api calls.
+"""
+import collections
+import copy
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL = {
+    'GetSpkName': 60,
+    'Get7BandEQList': 300,
+    'GetCurrentEQMode': 10,
+    'GetCpList': 300,
+    'GetAlarmSoundList': 300,
+    'GetFunc': 5,
+}
+
+DEFAULT_INVALIDATES = {
+    'SetSpkName': ['GetSpkName'],
+    'AddCustomEQMode': ['Get7BandEQList', 'GetCurrentEQMode'],
+    'DelCustomEQMode': ['Get7BandEQList', 'GetCurrentEQMode'],
+    'Set7bandEQMode': ['GetCurrentEQMode'],
+    'Set7bandEQValue': ['GetCurrentEQMode'],
+    'Reset7bandEQValue': ['GetCurrentEQMode'],
+    'SetFunc': ['GetFunc'],
+    'SetVolume': ['GetVolume'],
+    'SetMute': ['GetMute'],
+    'SetShuffleMode': ['GetShuffleMode'],
+    'SetRepeatMode': ['GetRepeatMode'],
+    'SetCpService': ['GetCpList', 'GetCpInfo'],
+    'SetSignIn': ['GetCpList', 'GetCpInfo'],
+    'SetSignOut': ['GetCpList', 'GetCpInfo'],
+    'SetAlarmInfo': ['GetAlarmInfo'],
+    'SetAlarmOnOff': ['GetAlarmInfo'],
+    'DelAlarm': ['GetAlarmInfo'],
+}
+
+DEFAULT_EVENT_TTL = {
+    'GetSpkName': 600,
+    'GetFunc': 300,
+    'GetVolume': 300,
+    'GetMute': 300,
+    'GetShuffleMode': 300,
+    'GetRepeatMode': 300,
+}
+
+# stream messages carrying the same data as the response to the Get* action
+_EVENT_UPDATES = {
+    'SpkName': 'GetSpkName',
+    'CurrentFunc': 'GetFunc',
+    'VolumeLevel': 'GetVolume',
+    'MuteStatus': 'GetMute',
+    'ShuffleMode': 'GetShuffleMode',
+    'RepeatMode': 'GetRepeatMode',
+}
+
+# stream messages announcing a change without carrying the new state
+_EVENT_INVALIDATES = {
+    'CpChanged': ['GetFunc', 'GetCpInfo', 'GetCpList', 'GetRadioInfo', 'GetMusicInfo', 'GetPlayStatus'],
+    'SignInStatus': ['GetCpInfo', 'GetCpList'],
+    'SignOutStatus': ['GetCpInfo', 'GetCpList'],
+    'StartPlaybackEvent': ['GetPlayStatus', 'GetMusicInfo', 'GetRadioInfo'],
+    'StopPlaybackEvent': ['GetPlayStatus', 'GetMusicInfo', 'GetRadioInfo'],
+    'EndPlaybackEvent': ['GetPlayStatus', 'GetMusicInfo', 'GetRadioInfo'],
+    'PausePlaybackEvent': ['GetPlayStatus'],
+}
+
+# responses to GetMainInfo sent whenever the stream is (re)connected
+_EVENT_CONNECTED = ['RequestDeviceInfo', 'MainInfo']
+
+
+class ApiCache:
+    """
+    Bounded read-through cache for Get* actions.
+
+    Only actions with a configured ttl are cached. Entries are keyed by command and full payload, so calls with
+    different parameters are cached separately. Sending one of the Set* actions drops cached responses of the Get*
+    actions it affects.
+
+    Cache can also follow the speaker's event stream. While the stream is open, responses it pushes update or drop
+    cached entries, so actions kept up to date this way are cached for longer event_ttl.
+
+    Example:
+        cache = ApiCache(ttl={'GetSpkName': 60}, max_size=128)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', cache=cache)
+
+        event_loop = EventLoop(ApiStream('unique-id', '192.168.1.129'))
+        event_loop.add_response_listener(cache.handle_response)
+    """
+
+    def __init__(self, ttl=None, max_size=128, invalidates=None, event_ttl=None, clock=time.monotonic):
+        """
+        :param ttl: Dict of action name to time in seconds its response is cached for, defaults to DEFAULT_TTL
+        :param max_size: Maximum number of cached responses, least recently used are evicted first
+        :param invalidates: Dict of action name to list of action names whose cached responses it invalidates,
+            defaults to DEFAULT_INVALIDATES
+        :param event_ttl: Dict of action name to time in seconds its response is cached for while the event stream is
+            followed, defaults to DEFAULT_EVENT_TTL
+        :param clock: Callable returning current time in seconds
+        """
+        if max_size < 1:
+            raise ValueError('Max size must be at least 1')
+
+        self._ttl = dict(DEFAULT_TTL if ttl is None else ttl)
+        self._max_size = max_size
+        self._invalidates = dict(DEFAULT_INVALIDATES if invalidates is None else invalidates)
+        self._event_ttl = dict(DEFAULT_EVENT_TTL if event_ttl is None else event_ttl)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._live = False
+
+        # bumped whenever cached responses of an action go stale, so loads started before are not stored
+        self._generation = 0
+        self._generations = collections.Counter()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def max_size(self):
+        """
+        :returns: Maximum number of cached responses
+        """
+        return self._max_size
+
+    @property
+    def live(self):
+        """
+        :returns: True if cache is kept up to date by the event stream
+        """
+        return self._live
+
+    def ttl(self, action):
+        """
+        :param action: Action name e.g. GetSpkName
+        :returns: Time in seconds response is cached for or None if action is not cached
+        """
+        if self._live and action in self._event_ttl:
+            return self._event_ttl[action]
+
+        return self._ttl.get(action)
+
+    def get(self, command, action, payload, load):
+        """
+        Get response from the cache, or load and cache it.
+
+        :param command: COMMAND_* constant
+        :param action: Action name e.g. GetSpkName
+        :param payload: Full request payload
+        :param load: Callable making the actual request
+        :returns: Response dict
+        """
+        if action in self._invalidates:
+            try:
+                return load()
+            finally:
+                self.invalidate(*self._invalidates[action])
+
+        ttl = self.ttl(action)
+        if ttl is None:
+            return load()
+
+        key = (command, payload)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[2])
+
+            self._misses += 1
+            generation = self._get_generation(action)
+
+        response = load()
+
+        with self._lock:
+            if self._get_generation(action) != generation:
+                _LOGGER.debug('%s response went stale while loading, not caching it', action)
+                return response
+
+            self._entries[key] = (action, self._clock() + ttl, copy.deepcopy(response))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return response
+
+    def invalidate(self, *actions):
+        """
+        Drop cached responses.
+
+        :param actions: Action names to drop responses of, all responses are dropped if none passed
+        """
+        with self._lock:
+            self._bump_generation(*actions)
+
+            keys = [key for key, entry in self._entries.items() if not actions or entry[0] in actions]
+
+            for key in keys:
+                del self._entries[key]
+
+            if keys:
+                _LOGGER.debug('Invalidated %d cached responses', len(keys))
+
+            self._invalidations += len(keys)
+
+    def handle_response(self, response):
+        """
+        Update cache from a response pushed by the event stream.
+
+        Meant to be registered with EventLoop.add_response_listener().
+
+        :param response: ApiResponse instance, None when the stream is closed
+        """
+        if response is None:
+            _LOGGER.debug('Event stream closed, dropping responses cached for longer')
+            self._live = False
+            self._invalidate_event_actions()
+            return
+
+        if response.name in _EVENT_CONNECTED:
+            # messages could have been missed while stream was disconnected
+            self._live = True
+            self._invalidate_event_actions()
+            return
+
+        if response.name in _EVENT_UPDATES and response.success:
+            action = _EVENT_UPDATES[response.name]
+            data = response.data
+
+            # lazy response is parsed only now and might turn out malformed, value changed to an unknown one
+            if data is None:
+                self.invalidate(action)
+            else:
+                self._update(action, data)
+        elif response.name in _EVENT_INVALIDATES:
+            self.invalidate(*_EVENT_INVALIDATES[response.name])
+
+    def clear(self):
+        """
+        Drop all cached responses.
+        """
+        self.invalidate()
+
+    def _invalidate_event_actions(self):
+        if self._event_ttl:
+            self.invalidate(*self._event_ttl.keys())
+
+    def _update(self, action, data):
+        ttl = self.ttl(action)
+        if ttl is None:
+            return
+
+        with self._lock:
+            self._bump_generation(action)
+
+            for key, entry in list(self._entries.items()):
+                if entry[0] == action:
+                    self._entries[key] = (action, self._clock() + ttl, copy.deepcopy(data))
+
+    def _get_generation(self, action):
+        return (self._generation, self._generations[action])
+
+    def _bump_generation(self, *actions):
+        if not actions:
+            self._generation += 1
+
+        for action in actions:
+            self._generations[action] += 1
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        :returns: Dict
+            - hits - number of calls answered from the cache
+            - misses - number of calls that had to be sent to the speaker
+            - evictions - number of responses dropped to stay within max_size
+            - invalidations - number of responses dropped by Set* actions or invalidate()
+            - size - number of responses currently cached
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'size': len(self._entries),
+            }
@@ -0,0 +1,137 @@
+"""
+Fast failing of requests to unreachable speakers.
+"""
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+ACQUIRE_ALLOW = 'allow'
+ACQUIRE_PROBE = 'probe'
+ACQUIRE_REJECT = 'reject'
+
+
+class CircuitBreaker:
+    """
+    Track consecutive failures of requests to a single speaker.
+
+    After failure_threshold consecutive failures circuit opens and requests are rejected straight away, without
+    waiting for a timeout. Once reset_timeout passes, a single caller is asked to probe the speaker. Circuit closes
+    if the probe succeeds, otherwise it opens again for another reset_timeout.
+
+    Example:
+        circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', circuit_breaker=circuit_breaker)
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=10, clock=time.monotonic):
+        """
+        :param failure_threshold: Number of consecutive failures opening the circuit
+        :param reset_timeout: Time in seconds circuit stays open before speaker is probed again
+        :param clock: Callable returning current time in seconds
+        """
+        if failure_threshold < 1:
+            raise ValueError('Failure threshold must be at least 1')
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = None
+
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self):
+        """
+        :returns: STATE_* constant
+        """
+        return self._state
+
+    def is_available(self):
+        """
+        :returns: False if requests to the speaker would be rejected
+        """
+        with self._lock:
+            if self._state == STATE_OPEN:
+                return self._is_reset_timeout_over()
+
+            return self._state == STATE_CLOSED
+
+    def acquire(self):
+        """
+        Decide what to do with a request about to be sent.
+
+        :returns: ACQUIRE_* constant
+            - ACQUIRE_ALLOW - send the request
+            - ACQUIRE_PROBE - probe the speaker first, and report result with record_success() or record_failure()
+            - ACQUIRE_REJECT - fail the request without sending it
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return ACQUIRE_ALLOW
+
+            if self._state == STATE_OPEN and self._is_reset_timeout_over():
+                _LOGGER.debug('Probing speaker after %.1f seconds', self._clock() - self._opened_at)
+                self._state = STATE_HALF_OPEN
+                return ACQUIRE_PROBE
+
+            self._rejected += 1
+
+            return ACQUIRE_REJECT
+
+    def record_success(self):
+        """
+        Record request or probe that reached the speaker.
+        """
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                _LOGGER.info('Speaker is reachable again, closing circuit')
+
+            self._state = STATE_CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """
+        Record request or probe that failed to reach the speaker.
+        """
+        with self._lock:
+            self._failures += 1
+
+            if self._state == STATE_HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state == STATE_CLOSED:
+                    _LOGGER.warning('Speaker failed %d times in a row, opening circuit', self._failures)
+                    self._opened += 1
+
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+
+    def stats(self):
+        """
+        Get circuit statistics.
+
+        :returns: Dict
+            - state - STATE_* constant
+            - failures - number of consecutive failures
+            - opened - number of times circuit opened
+            - rejected - number of requests rejected without being sent
+        """
+        with self._lock:
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'opened': self._opened,
+                'rejected': self._rejected,
+            }
+
+    def _is_reset_timeout_over(self):
+        return self._clock() - self._opened_at >= self._reset_timeout
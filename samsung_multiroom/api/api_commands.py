@@ -0,0 +1,482 @@
+"""
+Declarative table of api commands, with encoders of their params and decoders of their responses.
+"""
+from .api_records import DmsItem
+from .api_records import MenuItem
+from .api_records import MusicItem
+from .api_records import PresetItem
+
+COMMAND_UIC = 'UIC'
+COMMAND_CPM = 'CPM'
+
+PARAM_AUTO = 'auto'
+PARAM_STR = 'str'
+PARAM_DEC = 'dec'
+PARAM_CDATA = 'cdata'
+PARAM_ON_OFF = 'on_off'
+
+FIELD_STR = 'str'
+FIELD_INT = 'int'
+FIELD_BOOL = 'bool'
+
+_ARGUMENT = object()
+
+
+def on_off_bool(value):
+    """Convert on/off to True/False correspondingly."""
+    return value == 'on'
+
+
+def bool_on_off(value):
+    """Convert True/False to on/off correspondingly."""
+    return 'on' if value else 'off'
+
+
+def response_list(input_list):
+    """xmltodict returns different structure if there's one item on the list."""
+    if isinstance(input_list, dict):
+        input_list = [input_list]
+
+    return input_list
+
+
+# param type -> (function coercing the argument, type hint)
+_PARAM_TYPES = {
+    PARAM_AUTO: (None, None),
+    PARAM_STR: (str, None),
+    PARAM_DEC: (int, 'dec'),
+    PARAM_CDATA: (None, 'cdata'),
+    PARAM_ON_OFF: (bool_on_off, None),
+}
+
+# field type -> function converting the response value
+_FIELD_TYPES = {
+    FIELD_STR: None,
+    FIELD_INT: int,
+    FIELD_BOOL: on_off_bool,
+}
+
+
+class Param:
+    """
+    Spec of a single request param.
+
+    Example:
+        Param('volume', PARAM_DEC)
+        Param('filter', value='folder')
+        Param('trickmode', choices=['previous', 'next'])
+        Param('eqvalue', PARAM_DEC, numbered=True)
+    """
+
+    __slots__ = ('name', 'param_type', 'value', 'choices', 'numbered')
+
+    def __init__(self, name, param_type=PARAM_AUTO, value=_ARGUMENT, choices=None, numbered=False):
+        """
+        :param name: Name of the param
+        :param param_type: PARAM_* constant, PARAM_AUTO leaves the type to be inferred from the value
+        :param value: (optional) Fixed value, otherwise param takes the next call argument
+        :param choices: (optional) List of allowed argument values
+        :param numbered: Argument is a list of values sent as params name1, name2, ... nameN
+        """
+        if param_type not in _PARAM_TYPES:
+            raise ValueError('Invalid param type {0}, must be one of PARAM_* constants'.format(param_type))
+
+        self.name = name
+        self.param_type = param_type
+        self.value = value
+        self.choices = choices
+        self.numbered = numbered
+
+    @property
+    def is_argument(self):
+        """
+        :returns: True if param takes a call argument
+        """
+        return self.value is _ARGUMENT
+
+
+class Command:
+    """
+    Spec of a single api command.
+
+    Encoder and decoder are built once, so calls only run the coercions the spec requires. Commands whose params vary
+    with the arguments, e.g. one group of params per list item, are given an encoder function instead.
+
+    Example:
+        command = Command('GetVolume', COMMAND_UIC, field='volume', field_type=FIELD_INT)
+
+        response = api.get(command.command, command.name, command.encode())
+        volume = command.decode(response)
+    """
+
+    def __init__(self, name, command, params=(), field=None, field_type=FIELD_STR, items=None, count=None,
+                 record=None, encoder=None):
+        """
+        :param name: Action name e.g. GetVolume
+        :param command: COMMAND_* constant
+        :param params: List of Param instances, in the order of call arguments
+        :param field: (optional) Response field returned, otherwise whole response is returned
+        :param field_type: FIELD_* constant type of the returned field
+        :param items: (optional) Path to the list of items returned, e.g. ('menulist', 'menuitem')
+        :param count: (optional) Response field with number of items, none are returned if it is 0
+        :param record: (optional) Record subclass items can be decoded into
+        :param encoder: (optional) Callable accepting call arguments and returning list of request params, used
+            instead of params
+        """
+        if field_type not in _FIELD_TYPES:
+            raise ValueError('Invalid field type {0}, must be one of FIELD_* constants'.format(field_type))
+
+        self._name = name
+        self._command = command
+        self._record = record
+        self._items = None if items is None else tuple(items)
+        self._params = tuple(params)
+        self._arity = len([param for param in self._params if param.is_argument])
+
+        self._encoders = tuple(_build_encoder(param) for param in self._params)
+        self._encoder = encoder
+
+        if items is not None:
+            self._decoder = _build_items_decoder(self._items, count)
+        elif field is not None:
+            self._decoder = _build_field_decoder(field, _FIELD_TYPES[field_type])
+        else:
+            self._decoder = None
+
+    @property
+    def name(self):
+        """
+        :returns: Action name
+        """
+        return self._name
+
+    @property
+    def command(self):
+        """
+        :returns: COMMAND_* constant
+        """
+        return self._command
+
+    @property
+    def params(self):
+        """
+        :returns: Tuple of Param instances
+        """
+        return self._params
+
+    def encode(self, *args):
+        """
+        Build request params from call arguments.
+
+        :param args: One argument per param without fixed value
+        :returns: List of tuples (name, value, (optional) type hint)
+        :raises: TypeError if number of arguments does not match the spec
+        :raises: ValueError if argument is not one of the allowed choices
+        """
+        if self._encoder is not None:
+            return self._encoder(*args)
+
+        if len(args) != self._arity:
+            raise TypeError('{0} takes {1} arguments ({2} given)'.format(self._name, self._arity, len(args)))
+
+        params = []
+        args = iter(args)
+
+        for encoder in self._encoders:
+            encoder(params, args)
+
+        return params
+
+    @property
+    def items(self):
+        """
+        :returns: Tuple of keys leading to the list of items in the response, None if command does not return a list
+        """
+        return self._items
+
+    @property
+    def record(self):
+        """
+        :returns: Record subclass items can be decoded into, None if items are always dicts
+        """
+        return self._record
+
+    def decode(self, response, records=False):
+        """
+        Extract result from a response.
+
+        :param response: Response dict
+        :param records: Decode items into Record instances, if the spec has a record type
+        :returns: Field value, list of items or whole response, depending on the spec
+        """
+        if self._decoder is None:
+            return response
+
+        result = self._decoder(response)
+
+        if records and self._record is not None:
+            from_dict = self._record.from_dict
+            result = [from_dict(item) for item in result]
+
+        return result
+
+    def decode_items(self, items, records=False):
+        """
+        Decode items parsed one by one from a streamed response.
+
+        :param items: Iterable of item dicts
+        :param records: Decode items into Record instances, if the spec has a record type
+        :returns: Iterable of items
+        """
+        if records and self._record is not None:
+            return map(self._record.from_dict, items)
+
+        return items
+
+
+def _build_encoder(param):
+    coerce, type_hint = _PARAM_TYPES[param.param_type]
+    name = param.name
+
+    def to_tuple(param_name, value):
+        if coerce is not None:
+            value = coerce(value)
+
+        if type_hint is None:
+            return (param_name, value)
+
+        return (param_name, value, type_hint)
+
+    if not param.is_argument:
+        fixed = to_tuple(name, param.value)
+
+        def encode_fixed(params, _):
+            params.append(fixed)
+
+        return encode_fixed
+
+    if param.numbered:
+        def encode_numbered(params, args):
+            for i, value in enumerate(next(args)):
+                params.append(to_tuple(name + str(i + 1), value))
+
+        return encode_numbered
+
+    choices = param.choices
+
+    def encode_argument(params, args):
+        value = next(args)
+
+        if choices is not None and value not in choices:
+            raise ValueError('{0} must be one of: {1}'.format(name, ', '.join(choices)))
+
+        params.append(to_tuple(name, value))
+
+    return encode_argument
+
+
+def _build_field_decoder(field, convert):
+    if convert is None:
+        return lambda response: response[field]
+
+    return lambda response: convert(response[field])
+
+
+def _build_items_decoder(items, count):
+    def decode_items(response):
+        if count is not None and not int(response[count]):
+            return []
+
+        for key in items:
+            response = response[key]
+
+        return response_list(response)
+
+    return decode_items
+
+
+def _encode_playlist_playback_control(items):
+    params = [
+        ('playbackcontrol', 'play'),
+        ('playertype', 'allshare'),
+        ('sourcename', '', 'cdata'),
+        ('playindex', 0),
+        ('playtime', 0),
+        ('totalobjectcount', len(items)),
+    ]
+
+    for item in items:
+        if 'title' not in item:
+            item['title'] = 'Unknown'
+        if 'artist' not in item:
+            item['artist'] = 'Unknown'
+        if 'thumbnail' not in item:
+            item['thumbnail'] = ''
+
+        params.append(('device_udn', item['device_udn']))
+        params.append(('objectid', item['object_id']))
+        params.append(('songtitle', item['title'], 'cdata'))
+        params.append(('thumbnail', item['thumbnail'], 'cdata'))
+        params.append(('artist', item['artist'], 'cdata'))
+
+    return params
+
+
+def _encode_play_select(content_ids):
+    if not isinstance(content_ids, list):
+        content_ids = [content_ids]
+
+    if len(content_ids) > 1:
+        return [('selectitemids', [int(id) for id in content_ids])]
+
+    if content_ids:
+        return [('selectitemid', int(content_ids[0]))]
+
+    return [('selectitemid', '')]
+
+
+def _encode_alarm_info(index, hour, minute, week, duration, volume, station_data):
+    return [
+        ('index', int(index)),
+        ('hour', int(hour)),
+        ('min', int(minute)),
+        ('week', hex(int(week, 16))),
+        ('volume', int(volume)),
+        ('title', station_data['title'], 'cdata'),
+        ('description', station_data['description'], 'cdata'),
+        ('thumbnail', station_data['thumbnail'], 'cdata'),
+        ('stationurl', station_data['stationurl'], 'cdata'),
+        ('soundenable', 'off'),
+        ('sound', -1),
+        ('duration', int(duration)),
+    ]
+
+
+def _encode_del_alarm(index_list):
+    params = [
+        ('totaldelnum', len(index_list)),
+    ]
+    params += [('index', int(i)) for i in index_list]
+
+    return params
+
+
+def _encode_multispk_group(name, speakers):
+    params = [('name', name, 'cdata'), ('index', 1), ('type', 'main'), ('spknum', len(speakers))]
+
+    for i, speaker in enumerate(speakers):
+        if i == 0:
+            params += [
+                ('audiosourcemacaddr', speaker['mac']),
+                ('audiosourcename', speaker['name'], 'cdata'),
+                ('audiosourcetype', 'speaker'),
+            ]
+        else:
+            params += [
+                ('subspkip', speaker['ip']),
+                ('subspkmacaddr', speaker['mac']),
+            ]
+
+    return params
+
+
+_LIST_PARAMS = (Param('startindex', PARAM_DEC), Param('listcount', PARAM_DEC))
+_LIST_START_PARAMS = (Param('liststartindex', PARAM_DEC), Param('listcount', PARAM_DEC))
+_EQ_VALUE_PARAMS = (Param('presetindex', PARAM_DEC), Param('eqvalue', PARAM_DEC, numbered=True))
+
+COMMANDS = {command.name: command for command in [
+    # speaker
+    Command('GetSpkName', COMMAND_UIC, field='spkname'),
+    Command('SetSpkName', COMMAND_UIC, [Param('spkname', PARAM_CDATA)]),
+    Command('GetVolume', COMMAND_UIC, field='volume', field_type=FIELD_INT),
+    Command('SetVolume', COMMAND_UIC, [Param('volume', PARAM_DEC)]),
+    Command('GetMute', COMMAND_UIC, field='mute', field_type=FIELD_BOOL),
+    Command('SetMute', COMMAND_UIC, [Param('mute', PARAM_ON_OFF)]),
+    Command('GetFunc', COMMAND_UIC),
+    Command('SetFunc', COMMAND_UIC, [Param('function')]),
+    Command('SetSpeakerTime', COMMAND_UIC, [Param('year'), Param('month'), Param('day'), Param('hour'),
+                                            Param('min'), Param('sec')]),
+    Command('GetSleepTimer', COMMAND_UIC),
+    Command('SetSleepTimer', COMMAND_UIC, [Param('option'), Param('sleeptime', PARAM_DEC)]),
+
+    # playback
+    Command('GetShuffleMode', COMMAND_UIC, field='shuffle', field_type=FIELD_BOOL),
+    Command('SetShuffleMode', COMMAND_UIC, [Param('shufflemode', PARAM_ON_OFF)]),
+    Command('GetRepeatMode', COMMAND_UIC, field='repeat'),
+    Command('SetRepeatMode', COMMAND_UIC, [Param('repeatmode')]),
+    Command('SetTrickMode', COMMAND_UIC, [Param('trickmode', choices=['previous', 'next'])]),
+    Command('SetPlaybackControl', COMMAND_UIC, [Param('playbackcontrol', choices=['resume', 'pause'])]),
+    Command('GetMusicInfo', COMMAND_UIC),
+    Command('GetPlayStatus', COMMAND_UIC),
+    Command('SetSearchTime', COMMAND_UIC, [Param('playtime', PARAM_DEC)]),
+    Command('GetCurrentPlayTime', COMMAND_UIC),
+
+    # dlna
+    Command('GetDmsList', COMMAND_UIC, _LIST_START_PARAMS, items=('dmslist', 'dms'), count='listcount',
+            record=DmsItem),
+    Command('PCGetMusicListByCategory', COMMAND_UIC, [
+        Param('device_udn'),
+        Param('filter', value='folder'),
+        Param('categoryid', value='folder'),
+        *_LIST_START_PARAMS,
+    ], items=('musiclist', 'music'), count='listcount', record=MusicItem),
+    Command('PCGetMusicListByID', COMMAND_UIC, [
+        Param('device_udn'),
+        Param('filter', value='folder'),
+        Param('parentid', PARAM_STR),
+        *_LIST_START_PARAMS,
+    ], items=('musiclist', 'music'), count='listcount', record=MusicItem),
+    Command('SetPlaylistPlaybackControl', COMMAND_UIC, encoder=_encode_playlist_playback_control),
+
+    # radio
+    Command('GetPresetList', COMMAND_CPM, _LIST_PARAMS, items=('presetlist', 'preset'), count='listcount',
+            record=PresetItem),
+    Command('GetRadioInfo', COMMAND_CPM),
+    Command('SetPlayPreset', COMMAND_CPM, [Param('presettype', PARAM_DEC), Param('presetindex', PARAM_DEC)]),
+    Command('SetSelectRadio', COMMAND_CPM),
+    Command('BrowseMain', COMMAND_CPM, _LIST_PARAMS, items=('menulist', 'menuitem'), count='listcount',
+            record=MenuItem),
+    Command('GetSelectRadioList', COMMAND_CPM, [Param('contentid', PARAM_DEC), *_LIST_PARAMS],
+            items=('menulist', 'menuitem'), count='listcount', record=MenuItem),
+    Command('GetCurrentRadioList', COMMAND_CPM, _LIST_PARAMS, items=('menulist', 'menuitem'), count='listcount',
+            record=MenuItem),
+    Command('GetUpperRadioList', COMMAND_CPM, _LIST_PARAMS, items=('menulist', 'menuitem'), count='listcount',
+            record=MenuItem),
+    Command('GetStationData', COMMAND_CPM, [Param('selectitemid', PARAM_DEC)]),
+    Command('SetPlaySelect', COMMAND_CPM, encoder=_encode_play_select),
+
+    # equalizer
+    Command('Get7BandEQList', COMMAND_UIC, items=('presetlist', 'preset')),
+    Command('GetCurrentEQMode', COMMAND_UIC),
+    Command('Set7bandEQValue', COMMAND_UIC, _EQ_VALUE_PARAMS),
+    Command('Set7bandEQMode', COMMAND_UIC, [Param('presetindex', PARAM_DEC)]),
+    Command('Reset7bandEQValue', COMMAND_UIC, _EQ_VALUE_PARAMS),
+    Command('DelCustomEQMode', COMMAND_UIC, [Param('presetindex', PARAM_DEC)]),
+    Command('AddCustomEQMode', COMMAND_UIC, [Param('presetindex', PARAM_DEC), Param('presetname')]),
+
+    # alarms
+    Command('GetAlarmInfo', COMMAND_UIC, items=('alarmList', 'alarm')),
+    Command('SetAlarmOnOff', COMMAND_UIC, [Param('index', PARAM_DEC), Param('alarm')]),
+    Command('GetAlarmSoundList', COMMAND_UIC, items=('alarmlist', 'alarmsound')),
+    Command('SetAlarmInfo', COMMAND_UIC, encoder=_encode_alarm_info),
+    Command('DelAlarm', COMMAND_UIC, encoder=_encode_del_alarm),
+
+    # grouping
+    Command('SpkInGroup', COMMAND_UIC, [Param('act')]),
+    Command('SetUngroup', COMMAND_UIC),
+    Command('SetGroupName', COMMAND_UIC, [Param('groupname', PARAM_CDATA)]),
+    Command('SetMultispkGroup', COMMAND_UIC, encoder=_encode_multispk_group),
+
+    # services
+    Command('GetCpList', COMMAND_CPM, _LIST_START_PARAMS, items=('cplist', 'cp')),
+    Command('SetCpService', COMMAND_CPM, [Param('cpservice_id', PARAM_DEC)]),
+    Command('GetCpInfo', COMMAND_CPM),
+    Command('SetSignIn', COMMAND_CPM, [Param('username'), Param('password')]),
+    Command('SetSignOut', COMMAND_CPM),
+    Command('GetCpSubmenu', COMMAND_CPM, items=('submenu', 'submenuitem')),
+    Command('SetSelectCpSubmenu', COMMAND_CPM, [Param('contentid', PARAM_DEC), *_LIST_PARAMS],
+            items=('menulist', 'menuitem'), record=MenuItem),
+    Command('GetCpPlayerPlaylist', COMMAND_CPM, _LIST_PARAMS, items=('menulist', 'menuitem'), record=MenuItem),
+    Command('SetSkipCurrentTrack', COMMAND_CPM),
+    Command('SetPlayCpPlaylistTrack', COMMAND_CPM, [Param('selectitemid', PARAM_DEC)]),
+]}
@@ -0,0 +1,182 @@
+"""
+Hedging of slow idempotent api calls.
+"""
+import collections
+import concurrent.futures
+import contextvars
+import logging
+import math
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HedgePolicy:
+    """
+    Send a duplicate of a call that takes longer than usual, and use whichever answer arrives first.
+
+    Duplicate is sent once the call takes longer than percentile of recent latencies of the same action. To cap the
+    extra load on the speaker, no more than budget fraction of calls are duplicated, and with a slot, only while the
+    speaker has spare capacity for the duplicate.
+
+    Only meant for calls that are safe to repeat, such as Get* actions.
+
+    Example:
+        hedge_policy = HedgePolicy(percentile=95, budget=0.05)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', hedge_policy=hedge_policy)
+    """
+
+    def __init__(self, percentile=95, budget=0.05, min_samples=20, window=100, max_workers=4):
+        """
+        :param percentile: Percentile of recent latencies after which a duplicate is sent
+        :param budget: Maximum fraction of calls that can be duplicated
+        :param min_samples: Number of latencies of an action observed before its calls are hedged
+        :param window: Number of recent latencies per action kept
+        :param max_workers: Maximum number of threads making calls
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+
+        self._percentile = percentile
+        self._budget = budget
+        self._min_samples = min_samples
+        self._window = window
+
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix='samsung-multiroom-hedge')
+
+        self._stats = {
+            'calls': 0,
+            'hedged': 0,
+            'hedge_wins': 0,
+            'over_budget': 0,
+            'no_capacity': 0,
+        }
+
+    def get_delay(self, action):
+        """
+        :param action: Action name e.g. GetPlayStatus
+        :returns: Time in seconds after which duplicate call is sent, None if not enough latencies were observed
+        """
+        with self._lock:
+            latencies = self._latencies.get(action)
+
+            if latencies is None or len(latencies) < self._min_samples:
+                return None
+
+            latencies = sorted(latencies)
+
+            return latencies[max(0, math.ceil(self._percentile / 100 * len(latencies)) - 1)]
+
+    def run(self, action, load, slot=None):
+        """
+        Make the call, sending a duplicate if it takes too long.
+
+        :param action: Action name e.g. GetPlayStatus
+        :param load: Callable making the actual call
+        :param slot: (optional) Callable accepting action name and returning context manager held by the duplicate,
+            yielding False if there is no spare capacity to send it, e.g. CommandScheduler.spare_slot
+        :returns: Result of the call answered first
+        """
+        self._count('calls')
+
+        delay = self.get_delay(action)
+        if delay is None:
+            return self._timed(action, load)
+
+        # calls made in worker threads still belong to the span of the caller
+        primary = self._executor.submit(contextvars.copy_context().run, self._timed, action, load)
+
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        if not self._spend_budget():
+            return primary.result()
+
+        _LOGGER.debug('%s takes longer than %.3f seconds, sending duplicate', action, delay)
+
+        hedge = self._executor.submit(contextvars.copy_context().run, self._hedge, action, load, slot)
+        pending = {primary, hedge}
+
+        while True:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is not None:
+                    continue
+
+                if future is hedge:
+                    self._count('hedge_wins')
+
+                return future.result()
+
+            # duplicate failed, wait for the primary call
+            if not pending:
+                return primary.result()
+
+    def close(self):
+        """
+        Stop worker threads once calls in flight finish.
+        """
+        self._executor.shutdown(wait=False)
+
+    def stats(self):
+        """
+        Get hedging statistics.
+
+        :returns: Dict
+            - calls - number of calls made
+            - hedged - number of calls duplicated
+            - hedge_wins - number of calls answered by the duplicate first
+            - over_budget - number of slow calls not duplicated to stay within budget
+            - no_capacity - number of slow calls not duplicated as slot had no spare capacity
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _timed(self, action, load):
+        started = time.monotonic()
+        result = load()
+
+        with self._lock:
+            latencies = self._latencies.setdefault(action, collections.deque(maxlen=self._window))
+            latencies.append(time.monotonic() - started)
+
+        return result
+
+    def _hedge(self, action, load, slot):
+        if slot is None:
+            return self._timed(action, load)
+
+        with slot(action) as acquired:
+            if not acquired:
+                # duplicate would only queue behind other calls, give the budget back
+                with self._lock:
+                    self._stats['hedged'] -= 1
+                    self._stats['no_capacity'] += 1
+
+                raise _NoCapacityError()
+
+            return self._timed(action, load)
+
+    def _spend_budget(self):
+        with self._lock:
+            if self._stats['hedged'] + 1 > self._budget * self._stats['calls']:
+                self._stats['over_budget'] += 1
+                return False
+
+            self._stats['hedged'] += 1
+            return True
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+
+class _NoCapacityError(Exception):
+    """Duplicate was not sent for lack of spare capacity."""
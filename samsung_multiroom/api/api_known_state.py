@@ -0,0 +1,187 @@
+"""
+Last known state of the speaker, used to skip writes that would change nothing.
+"""
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# response name -> {response field: state field}
+_RESPONSE_FIELDS = {
+    'VolumeLevel': {'volume': 'volume'},
+    'MuteStatus': {'mute': 'mute'},
+    'ShuffleMode': {'shuffle': 'shuffle'},
+    'RepeatMode': {'repeat': 'repeat'},
+    'SpkName': {'spkname': 'spkname'},
+    'CurrentFunc': {'function': 'function'},
+    'CurrentEQMode': {'presetindex': 'eqmode', 'eqvalue1': 'eqvalue1', 'eqvalue2': 'eqvalue2',
+                      'eqvalue3': 'eqvalue3', 'eqvalue4': 'eqvalue4', 'eqvalue5': 'eqvalue5',
+                      'eqvalue6': 'eqvalue6', 'eqvalue7': 'eqvalue7'},
+}
+_RESPONSE_FIELDS['7bandEQMode'] = _RESPONSE_FIELDS['CurrentEQMode']
+_RESPONSE_FIELDS['7bandEQValue'] = _RESPONSE_FIELDS['CurrentEQMode']
+
+# action -> {request param: state field}
+_ACTION_FIELDS = {
+    'SetVolume': {'volume': 'volume'},
+    'SetMute': {'mute': 'mute'},
+    'SetShuffleMode': {'shufflemode': 'shuffle'},
+    'SetRepeatMode': {'repeatmode': 'repeat'},
+    'SetSpkName': {'spkname': 'spkname'},
+    'SetFunc': {'function': 'function'},
+    # Set7bandEQMode is left out, as after Set7bandEQValue the speaker reports the same preset with other band values
+    'Set7bandEQValue': {'presetindex': 'eqmode', 'eqvalue1': 'eqvalue1', 'eqvalue2': 'eqvalue2',
+                        'eqvalue3': 'eqvalue3', 'eqvalue4': 'eqvalue4', 'eqvalue5': 'eqvalue5',
+                        'eqvalue6': 'eqvalue6', 'eqvalue7': 'eqvalue7'},
+}
+
+
+class KnownState:
+    """
+    Table of last known values of a single speaker's settings.
+
+    Values are learned from responses to any request and from responses pushed by the event stream. A Set* action is
+    redundant if every value it sets is known, no older than max_age, and equal to the one being set.
+
+    Skipping is opt-in, as a skipped get() returns an empty dict instead of the speaker's response.
+
+    Example:
+        known_state = KnownState(max_age=5, skip_redundant=True)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', known_state=known_state)
+
+        event_loop = EventLoop(ApiStream('unique-id', '192.168.1.129'))
+        event_loop.add_response_listener(known_state.handle_response)
+    """
+
+    def __init__(self, max_age=5, clock=time.monotonic, skip_redundant=False):
+        """
+        :param max_age: Time in seconds a learned value is trusted for
+        :param clock: Callable returning current time in seconds
+        :param skip_redundant: Report redundant Set* actions so they are skipped, otherwise values are only learned
+        """
+        self._max_age = max_age
+        self._clock = clock
+        self._skip_redundant = skip_redundant
+
+        self._lock = threading.Lock()
+        self._values = {}
+
+        self._skipped = 0
+
+    @property
+    def max_age(self):
+        """
+        :returns: Time in seconds a learned value is trusted for
+        """
+        return self._max_age
+
+    @property
+    def skip_redundant(self):
+        """
+        :returns: True if redundant Set* actions are skipped
+        """
+        return self._skip_redundant
+
+    def get(self, field):
+        """
+        :param field: State field e.g. volume
+        :returns: Last known value as str, None if unknown or too old
+        """
+        with self._lock:
+            return self._get(field)
+
+    def handle_response(self, response):
+        """
+        Learn values from a response.
+
+        Meant to be registered with EventLoop.add_response_listener() as well.
+
+        :param response: ApiResponse instance, None when the stream is closed
+        """
+        if response is None:
+            # changes made while disconnected would go unnoticed
+            self.clear()
+            return
+
+        if not response.success or response.name not in _RESPONSE_FIELDS:
+            return
+
+        fields = _RESPONSE_FIELDS[response.name]
+
+        # lazy response is parsed only now and might turn out malformed, values changed to unknown ones
+        data = response.data
+        if data is None:
+            with self._lock:
+                for field in fields.values():
+                    self._values.pop(field, None)
+            return
+
+        now = self._clock()
+
+        with self._lock:
+            for response_field, field in fields.items():
+                value = data.get(response_field)
+
+                if value is not None:
+                    self._values[field] = (str(value), now)
+
+    def is_redundant(self, action, params):
+        """
+        Check if a Set* action would change nothing, and count it as skipped if so.
+
+        :param action: Action name e.g. SetVolume
+        :param params: List of tuples (name, value, (optional) type hint)
+        :returns: True if all values it sets are already in place, always False unless skip_redundant is set
+        """
+        if not self._skip_redundant:
+            return False
+
+        fields = _ACTION_FIELDS.get(action)
+        if not fields or not params:
+            return False
+
+        params = {param[0]: param[1] for param in params}
+
+        if set(params.keys()) != set(fields.keys()):
+            return False
+
+        with self._lock:
+            for name, field in fields.items():
+                if self._get(field) != str(params[name]):
+                    return False
+
+            self._skipped += 1
+
+        _LOGGER.debug('Skipping %s, speaker is already in requested state', action)
+
+        return True
+
+    def clear(self):
+        """
+        Forget all known values.
+        """
+        with self._lock:
+            self._values.clear()
+
+    def stats(self):
+        """
+        Get statistics.
+
+        :returns: Dict
+            - skipped - number of redundant Set* actions detected
+            - known - number of values currently known
+        """
+        with self._lock:
+            return {
+                'skipped': self._skipped,
+                'known': len(self._values),
+            }
+
+    def _get(self, field):
+        known = self._values.get(field)
+
+        if known is None or self._clock() - known[1] > self._max_age:
+            return None
+
+        return known[0]
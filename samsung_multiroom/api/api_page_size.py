@@ -0,0 +1,164 @@
+"""
+Page sizes of list calls tuned to observed latency.
+"""
+import logging
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+# services return at most 30 items regardless of list_count, asking for more would look like the end of the list
+DEFAULT_MAX_PAGE_SIZES = {
+    'browse_main': 30,
+    'get_cp_list': 30,
+    'get_cp_player_playlist': 30,
+    'get_current_radio_list': 30,
+    'get_preset_list': 30,
+    'get_select_radio_list': 30,
+    'get_upper_radio_list': 30,
+    'set_select_cp_submenu': 30,
+}
+
+
+class PageSizer:
+    """
+    Track page sizes of list calls per api method and grow them while page latency stays flat.
+
+    Page size starts at list_count passed by the caller. After each page it grows by growth factor, as long as the page
+    took no longer than tolerance times the fastest page seen, up to the maximum of the method. A page that timed out,
+    or whose body was too big to be received intact, halves the size, down to the minimum, and the size never grows
+    past the halved one again.
+
+    Each api has its own page sizer, so sizes are tuned per speaker. It is used by paginator().
+
+    Example:
+        page_sizer = PageSizer(maximum=200)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', page_sizer=page_sizer)
+
+        paginator(api.pc_get_music_list_by_id, device_udn, parent_id, 0, 20)
+    """
+
+    def __init__(self, minimum=5, maximum=100, max_page_sizes=None, growth=2, tolerance=1.5):
+        """
+        :param minimum: Smallest page size failed pages shrink to
+        :param maximum: Largest page size of methods without a maximum of their own
+        :param max_page_sizes: Dict of api method name to largest page size, defaults to DEFAULT_MAX_PAGE_SIZES
+        :param growth: Factor page size is multiplied by after a page with flat latency, 1 to never grow
+        :param tolerance: Multiple of the fastest page latency still considered flat
+        """
+        if minimum < 1 or maximum < minimum:
+            raise ValueError('Minimum must be at least 1 and not greater than maximum')
+
+        if growth < 1 or tolerance < 1:
+            raise ValueError('Growth and tolerance must be at least 1')
+
+        self._minimum = minimum
+        self._maximum = maximum
+        self._max_page_sizes = dict(DEFAULT_MAX_PAGE_SIZES if max_page_sizes is None else max_page_sizes)
+        self._growth = growth
+        self._tolerance = tolerance
+
+        self._lock = threading.Lock()
+        self._methods = {}
+
+    @property
+    def minimum(self):
+        """
+        :returns: Smallest page size failed pages shrink to
+        """
+        return self._minimum
+
+    def get_max_page_size(self, method):
+        """
+        :param method: Api method name e.g. pc_get_music_list_by_id
+        :returns: Largest page size of the method
+        """
+        return self._max_page_sizes.get(method, self._maximum)
+
+    def get_page_size(self, method, list_count):
+        """
+        :param method: Api method name e.g. pc_get_music_list_by_id
+        :param list_count: Page size requested by the caller, used until pages of the method are observed
+        :returns: Page size of the next call
+        """
+        with self._lock:
+            state = self._methods.get(method)
+            page_size = list_count if state is None else state.page_size
+
+            return min(page_size, self.get_max_page_size(method))
+
+    def observe(self, method, page_size, latency):
+        """
+        Record latency of a successfully received page.
+
+        :param method: Api method name e.g. pc_get_music_list_by_id
+        :param page_size: list_count the page was requested with
+        :param latency: Time in seconds it took to receive the page
+        """
+        with self._lock:
+            state = self._methods.setdefault(method, _PageState(page_size))
+            state.pages += 1
+
+            if state.best_latency is None or latency < state.best_latency:
+                state.best_latency = latency
+
+            if latency > state.best_latency * self._tolerance:
+                return
+
+            grown = min(int(page_size * self._growth), self.get_max_page_size(method))
+            if state.limit is not None:
+                grown = min(grown, state.limit)
+
+            # pages of earlier sizes might still be arriving, size never goes back to them
+            state.page_size = max(state.page_size, grown)
+
+    def backoff(self, method, page_size):
+        """
+        Record page that timed out or was received malformed, halving the page size.
+
+        :param method: Api method name e.g. pc_get_music_list_by_id
+        :param page_size: list_count the page was requested with
+        :returns: Page size to retry the page with
+        """
+        with self._lock:
+            state = self._methods.setdefault(method, _PageState(page_size))
+            state.page_size = max(self._minimum, min(state.page_size, page_size) // 2)
+            state.limit = state.page_size
+            state.backoffs += 1
+
+            _LOGGER.debug('Page of %s failed, shrinking page size to %d', method, state.page_size)
+
+            return state.page_size
+
+    def stats(self):
+        """
+        Get page size statistics.
+
+        :returns: Dict of api method name to dict
+            - page_size - page size of the next call
+            - limit - largest page size allowed since a page failed, None if none did
+            - best_latency - fastest page latency seen in seconds
+            - pages - number of pages received
+            - backoffs - number of times page size was halved
+        """
+        with self._lock:
+            return {method: state.to_dict() for method, state in self._methods.items()}
+
+
+class _PageState:
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+        self.limit = None
+        self.best_latency = None
+        self.pages = 0
+        self.backoffs = 0
+
+    def to_dict(self):
+        """Build stats dict of the method."""
+        return {
+            'page_size': self.page_size,
+            'limit': self.limit,
+            'best_latency': self.best_latency,
+            'pages': self.pages,
+            'backoffs': self.backoffs,
+        }
@@ -0,0 +1,211 @@
+"""
+XML parsers turning response text into nested dicts.
+"""
+from xml.parsers import expat
+
+import xmltodict
+
+PARSER_EXPAT = 'expat'
+PARSER_XMLTODICT = 'xmltodict'
+
+ParseError = expat.ExpatError
+
+
+def parse_xmltodict(response_text):
+    """
+    Parse response with xmltodict, the reference implementation.
+
+    :param response_text: XML text
+    :returns: Dict of root element name -> element content
+    :raises: ParseError
+    """
+    return xmltodict.parse(response_text)
+
+
+def parse_expat(response_text):
+    """
+    Parse response with expat handlers building the same structure as xmltodict.parse() with default options.
+
+    Attributes are keys prefixed with @, text of elements with attributes is under #text, repeated elements become
+    lists, surrounding whitespace is stripped and empty elements are None.
+
+    :param response_text: XML text
+    :returns: Dict of root element name -> element content
+    :raises: ParseError
+    """
+    stack = []
+    item = None
+    data = []
+
+    def start_element(_, attributes):
+        nonlocal item, data
+
+        stack.append((item, data))
+
+        if attributes:
+            item = {'@' + attributes[i]: attributes[i + 1] for i in range(0, len(attributes), 2)}
+        else:
+            item = None
+
+        data = []
+
+    def end_element(name):
+        nonlocal item, data
+
+        text = (''.join(data).strip() or None) if data else None
+        value = item
+
+        item, data = stack.pop()
+
+        if value is None:
+            value = text
+        elif text:
+            _push(value, '#text', text)
+
+        if item is None:
+            item = {name: value}
+        else:
+            _push(item, name, value)
+
+    def character_data(text):
+        data.append(text)
+
+    _create_parser(start_element, end_element, character_data).Parse(response_text, True)
+
+    return item
+
+
+class ItemParser:
+    """
+    Incremental parser yielding list items as soon as their closing tag is received.
+
+    Items are parsed into the same dicts as parse_expat() builds, but never attached to the document, so memory held
+    does not grow with the number of items. Everything else in the response is kept as the envelope.
+
+    Example:
+        parser = ItemParser(('response', 'musiclist', 'music'))
+
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                print(item['title'])
+
+        envelope = parser.close()
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Tuple of element names leading from the root element to an item, root excluded
+        """
+        self._path = list(path)
+        self._depth = len(self._path) + 1
+        self._names = []
+        self._stack = []
+        self._item = None
+        self._data = []
+        self._items = []
+        self._parser = _create_parser(self._start_element, self._end_element, self._character_data)
+
+    def feed(self, chunk):
+        """
+        Parse next chunk of the response.
+
+        :param chunk: Response body text or bytes
+        :returns: List of item dicts completed by the chunk
+        :raises: ParseError
+        """
+        self._parser.Parse(chunk, False)
+
+        items = self._items
+        self._items = []
+
+        return items
+
+    def close(self):
+        """
+        Finish parsing.
+
+        :returns: Dict of root element name -> element content, without the items
+        :raises: ParseError if the response is incomplete or malformed
+        """
+        self._parser.Parse(b'', True)
+
+        return self._item
+
+    def _start_element(self, name, attributes):
+        self._names.append(name)
+        self._stack.append((self._item, self._data))
+        self._data = []
+
+        if attributes:
+            self._item = {'@' + attributes[i]: attributes[i + 1] for i in range(0, len(attributes), 2)}
+        else:
+            self._item = None
+
+    def _end_element(self, name):
+        text = (''.join(self._data).strip() or None) if self._data else None
+        value = self._item
+
+        is_item = len(self._names) == self._depth and self._names[1:] == self._path
+        self._names.pop()
+
+        self._item, self._data = self._stack.pop()
+
+        if value is None:
+            value = text
+        elif text:
+            _push(value, '#text', text)
+
+        if is_item:
+            self._items.append(value)
+        elif self._item is None:
+            self._item = {name: value}
+        else:
+            _push(self._item, name, value)
+
+    def _character_data(self, text):
+        self._data.append(text)
+
+
+def get_parser(parser):
+    """
+    :param parser: PARSER_* constant
+    :returns: Callable parsing response text
+    :raises: ValueError
+    """
+    try:
+        return _PARSERS[parser]
+    except KeyError:
+        raise ValueError('Invalid parser {0}, must be one of PARSER_* constants'.format(parser)) from None
+
+
+def _create_parser(start_element, end_element, character_data):
+    parser = expat.ParserCreate()
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    # do not expand entities declared in a DTD
+    parser.DefaultHandler = lambda _: None
+    parser.ExternalEntityRefHandler = lambda *_: 1
+
+    return parser
+
+
+def _push(item, key, value):
+    if key in item:
+        existing = item[key]
+
+        if isinstance(existing, list):
+            existing.append(value)
+        else:
+            item[key] = [existing, value]
+    else:
+        item[key] = value
+
+
+_PARSERS = {
+    PARSER_EXPAT: parse_expat,
+    PARSER_XMLTODICT: parse_xmltodict,
+}
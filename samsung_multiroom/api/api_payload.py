@@ -0,0 +1,202 @@
+"""
+Formatting of request payloads from precompiled templates.
+"""
+import functools
+import urllib.parse
+
+# commands with a param per list item have a signature per list length, least recently used ones are dropped
+MAX_TEMPLATES = 256
+
+
+class PayloadTemplate:
+    """
+    Payload of a single action with a given list of params, compiled once.
+
+    Static XML fragments are kept both raw and URL-quoted, so formatting a request only needs to quote param values
+    and splice them in. Quoting is done character by character, so quoted fragments joined together are the same as
+    quoted payload.
+
+    Example:
+        template = PayloadTemplate('SetVolume', [('volume', 'dec')])
+        payload, quoted = template.render([10])
+    """
+
+    def __init__(self, action, signature=()):
+        """
+        :param action: Action name e.g. SetVolume
+        :param signature: List of tuples (name, type hint) of action params
+        """
+        self._action = action
+        self._type_hints = [type_hint for _, type_hint in signature]
+
+        fragments = [format_action(action)]
+
+        for name, type_hint in signature:
+            if type_hint == 'cdata':
+                opening = '<p type="{0}" name="{1}" val="empty"><![CDATA['.format(type_hint, name)
+                closing = ']]></p>'
+            elif type_hint == 'dec_arr':
+                opening = '<p type="{0}" name="{1}" val="empty">'.format(type_hint, name)
+                closing = '</p>'
+            else:
+                opening = '<p type="{0}" name="{1}" val="'.format(type_hint, name)
+                closing = '"/>'
+
+            fragments[-1] += opening
+            fragments.append(closing)
+
+        self._fragments = fragments
+        self._quoted_fragments = [urllib.parse.quote(fragment) for fragment in fragments]
+        self._paths = {}
+
+    @property
+    def action(self):
+        """
+        :returns: Action name
+        """
+        return self._action
+
+    def render(self, values=()):
+        """
+        :param values: List of param values, in the same order as signature
+        :returns: Tuple (payload, URL-quoted payload)
+        """
+        if not values:
+            return (self._fragments[0], self._quoted_fragments[0])
+
+        fragments = self._fragments
+        quoted_fragments = self._quoted_fragments
+
+        payload = [fragments[0]]
+        quoted = [quoted_fragments[0]]
+
+        for i, value in enumerate(values):
+            value = _format_value(self._type_hints[i], value)
+
+            payload.append(value)
+            payload.append(fragments[i + 1])
+            quoted.append(urllib.parse.quote(value))
+            quoted.append(quoted_fragments[i + 1])
+
+        return (''.join(payload), ''.join(quoted))
+
+    def path(self, command, values=()):
+        """
+        :param command: COMMAND_* constant
+        :param values: List of param values, in the same order as signature
+        :returns: Tuple (payload, request path)
+        """
+        if not values:
+            path = self._paths.get(command)
+
+            if path is None:
+                path = self._paths.setdefault(command, _format_path(command, self._quoted_fragments[0]))
+
+            return (self._fragments[0], path)
+
+        payload, quoted = self.render(values)
+
+        return (payload, _format_path(command, quoted))
+
+
+def get_template(action, params=None):
+    """
+    Get compiled template of an action, compiling it on first use. Up to MAX_TEMPLATES templates are kept.
+
+    :param action: Action name e.g. SetVolume
+    :param params: List of tuples (name, value, (optional) type hint str/dec/cdata/dec_arr)
+    :returns: Tuple (PayloadTemplate, list of param values)
+    """
+    if not params:
+        signature = ()
+        values = ()
+    else:
+        signature = tuple((param[0], _get_type_hint(param)) for param in params)
+        values = [param[1] for param in params]
+
+    return (_compile_template(action, signature), values)
+
+
+def format_request(command, action, params=None):
+    """
+    Format payload and request path of an action.
+
+    :param command: COMMAND_* constant
+    :param action: Action name e.g. SetVolume
+    :param params: List of tuples (name, value, (optional) type hint str/dec/cdata/dec_arr)
+    :returns: Tuple (payload, request path)
+    """
+    template, values = get_template(action, params)
+
+    return template.path(command, values)
+
+
+def format_action(action):
+    """Format request action."""
+    return '<name>{0}</name>'.format(action)
+
+
+def format_param(param):
+    """
+    Format request parameter.
+
+    :param param: Tuple e.g. ('list_count', 30, 'dec')
+        - name - name of the param
+        - value - mixed value
+        - type_hint - (optionally) str|dec|cdata|dec_arr
+    """
+    template, values = get_template('', [param])
+
+    return template.render(values)[0][len(format_action('')):]
+
+
+def format_payload(action, params=None):
+    """Format full request payload."""
+    template, values = get_template(action, params)
+
+    return template.render(values)[0]
+
+
+def parse_action(payload):
+    """
+    Extract action name from request payload.
+
+    :param payload: Full request payload e.g. <name>GetVolume</name>
+    :returns: Action name or None
+    """
+    if not payload.startswith('<name>'):
+        return None
+
+    end = payload.find('</name>')
+
+    return payload[len('<name>'):end] if end != -1 else None
+
+
+@functools.lru_cache(maxsize=MAX_TEMPLATES)
+def _compile_template(action, signature):
+    return PayloadTemplate(action, signature)
+
+
+def _get_type_hint(param):
+    if len(param) > 2:
+        return param[2]
+
+    value = param[1]
+
+    if isinstance(value, int):
+        return 'dec'
+    if isinstance(value, list) and value and isinstance(value[0], int):
+        return 'dec_arr'
+
+    return 'str'
+
+
+def _format_value(type_hint, value):
+    if type_hint == 'dec_arr':
+        return ''.join(['<item>{0}</item>'.format(v) for v in value])
+
+    return '{0}'.format(value)
+
+
+def _format_path(command, quoted_payload):
+    return '/{0}?cmd={1}'.format(command, quoted_payload)
@@ -0,0 +1,83 @@
+"""
+Bursts of calls sent to the speaker together.
+"""
+from .api_commands import COMMANDS
+from .api_tracing import traced
+
+
+class ApiPipeline:
+    """
+    Collect calls and send them together, in the order they were added.
+
+    Created by SamsungMultiroomApi.pipeline(). With pipelining enabled on the api, requests are written back-to-back on
+    a single connection and responses matched to them in order, so a burst takes about one round trip instead of one
+    per call. Otherwise calls are made one by one.
+
+    Example:
+        api.pipeline() \\
+            .call('SetVolume', 10) \\
+            .call('SetMute', False) \\
+            .call('SetFunc', 'aux') \\
+            .send()
+    """
+
+    def __init__(self, send):
+        """
+        :param send: Callable accepting list of tuples (command, action, params, force, spec) and returning list of
+            results
+        """
+        self._send = send
+        self._calls = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def get(self, command, action, params=None, force=False):
+        """
+        Add generic request, see SamsungMultiroomApi.get().
+
+        :param command: COMMAND_* constant
+        :param action: Action name to execute e.g. SetAlarmInfo
+        :param params: List of tuples (name, value, (optional) type hint str/dec/cdata)
+        :param force: Send Set* action even if speaker is already known to be in requested state
+        :returns: Self, to chain calls
+        """
+        self._calls.append((command, action, params, force, None))
+
+        return self
+
+    def call(self, name, *args, force=False):
+        """
+        Add call described by the command table, see SamsungMultiroomApi.call().
+
+        :param name: Action name from the command table e.g. SetVolume
+        :param args: Call arguments, one per param of the command
+        :param force: Send Set* action even if speaker is already known to be in requested state
+        :returns: Self, to chain calls
+        :raises: ValueError if action is not in the command table
+        """
+        command = COMMANDS.get(name)
+        if command is None:
+            raise ValueError('Unknown action {0}'.format(name))
+
+        self._calls.append((command.command, name, command.encode(*args), force, command))
+
+        return self
+
+    @traced
+    def send(self):
+        """
+        Send collected calls and clear them.
+
+        Every call is sent even if an earlier one fails, as pipelined requests are all on the wire by then.
+
+        :returns: List of results, response dicts of get() and decoded responses of call(), in the order calls were
+            added
+        :raises: SamsungMultiroomApiException of the first call that failed
+        """
+        calls, self._calls = self._calls, []
+
+        if not calls:
+            return []
+
+        return self._send(calls)
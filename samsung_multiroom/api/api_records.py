@@ -0,0 +1,205 @@
+"""
+Compact typed records of list items returned by the speaker.
+"""
+
+
+def parse_duration(value):
+    """
+    Convert duration to seconds.
+
+    :param value: Duration in HH:MM:SS.uuu format, or seconds
+    :returns: int - number of seconds
+    """
+    if isinstance(value, int):
+        return value
+
+    (hours, minutes, seconds) = value.split(':')
+
+    return int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+
+
+class Record:
+    """
+    List item with fields stored in __slots__ and converted once, when the record is created.
+
+    Behaves like a read-only dict of the item it was made of, so code written for dicts keeps working. Fields are
+    also available as attributes, named after the key without the @ prefix. Fields missing from the item, or empty,
+    are None, and keys outside of the record type are kept aside.
+
+    Example:
+        record = MusicItem.from_dict({'@object_id': '22$@52941', 'timelength': '0:03:25.000'})
+
+        record.object_id  # '22$@52941'
+        record['timelength']  # 205
+    """
+
+    __slots__ = ('_extra',)
+
+    # tuple of tuples (key, attribute, converter or None)
+    _fields = ()
+    # key -> attribute
+    _attributes = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        :param data: Item dict as returned by ApiResponse
+        :returns: Record instance
+        """
+        record = cls.__new__(cls)
+
+        for key, attribute, converter in cls._fields:
+            value = data.get(key)
+
+            if value is not None and converter is not None:
+                try:
+                    value = converter(value)
+                except ValueError:
+                    pass
+
+            setattr(record, attribute, value)
+
+        extra = {key: value for key, value in data.items() if key not in cls._attributes}
+
+        record._extra = extra or None
+
+        return record
+
+    def get(self, key, default=None):
+        """
+        :param key: Item key e.g. @object_id
+        :param default: Value returned if field is missing
+        :returns: Field value
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """
+        :returns: List of keys of fields that are set
+        """
+        return list(iter(self))
+
+    def items(self):
+        """
+        :returns: List of tuples (key, value) of fields that are set
+        """
+        return [(key, self[key]) for key in self]
+
+    def to_dict(self):
+        """
+        :returns: Dict of fields that are set
+        """
+        return dict(self.items())
+
+    def __getitem__(self, key):
+        attribute = self._attributes.get(key)
+
+        if attribute is None:
+            if self._extra is None:
+                raise KeyError(key)
+
+            return self._extra[key]
+
+        value = getattr(self, attribute)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key):
+        attribute = self._attributes.get(key)
+
+        if attribute is None:
+            return self._extra is not None and key in self._extra
+
+        return getattr(self, attribute) is not None
+
+    def __iter__(self):
+        for key, attribute, _ in self._fields:
+            if getattr(self, attribute) is not None:
+                yield key
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self.to_dict())
+
+
+def record_type(name, fields):
+    """
+    Create Record subclass.
+
+    :param name: Class name
+    :param fields: Dict of item key -> converter callable, or None to keep the value as str
+    :returns: Record subclass
+    """
+    record_fields = tuple((key, key.lstrip('@'), converter) for key, converter in fields.items())
+
+    return type(name, (Record,), {
+        '__slots__': tuple(attribute for _, attribute, _ in record_fields),
+        '__doc__': 'Record of {0} list item.'.format(name),
+        '_fields': record_fields,
+        '_attributes': {key: attribute for key, attribute, _ in record_fields},
+    })
+
+
+DmsItem = record_type('DmsItem', {
+    '@device_id': None,
+    'dmsid': None,
+    'dmsname': None,
+    'devicetype': None,
+    'thumbnail_PNG_LRG': None,
+    'thumbnail_JPG_LRG': None,
+    'thumbnail_PNG_SM': None,
+    'thumbnail_JPG_SM': None,
+})
+
+MusicItem = record_type('MusicItem', {
+    '@object_id': None,
+    'type': None,
+    'playindex': int,
+    'name': None,
+    'title': None,
+    'artist': None,
+    'album': None,
+    'thumbnail': None,
+    'timelength': parse_duration,
+    'device_udn': None,
+})
+
+PresetItem = record_type('PresetItem', {
+    '@index': None,
+    'kind': None,
+    'title': None,
+    'description': None,
+    'thumbnail': None,
+    'contentid': None,
+    'mediaid': None,
+})
+
+MenuItem = record_type('MenuItem', {
+    '@type': None,
+    '@available': None,
+    '@currentplaying': None,
+    'title': None,
+    'description': None,
+    'artist': None,
+    'album': None,
+    'mediaid': None,
+    'tracklength': int,
+    'thumbnail': None,
+    'contentid': None,
+})
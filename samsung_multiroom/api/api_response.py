@@ -1,22 +1,42 @@
 """
 Parse API XML response.
 """
-import xmltodict
+import re
+from xml.sax.saxutils import unescape
+
+from .api_parser import PARSER_EXPAT
+from .api_parser import ParseError
+from .api_parser import get_parser
+
+_METHOD = re.compile(r'<method>([^<]*)</method>')
+_USER = re.compile(r'<user_identifier\s*(?:/>|>([^<]*)</user_identifier>)')
+_RESULT = re.compile(r'<response\s+result=(["\'])([^"\'<]*)\1')
 
 
 class ApiResponse:
     """
     Extract key information from api response body text.
+
+    When lazy, name, user and success are read by a quick scan of the header and the body is only parsed once data is
+    accessed. If the body turns out to be malformed, response becomes unsuccessful, without a name, at that point.
     """
 
-    def __init__(self, response_text):
+    def __init__(self, response_text, parser=PARSER_EXPAT, lazy=True):
+        """
+        :param response_text: Response body text
+        :param parser: PARSER_* constant, PARSER_XMLTODICT is the slower reference implementation
+        :param lazy: Parse body only when data is accessed, if header can be scanned
+        """
         self._name = None
         self._user = None
         self._success = None
         self._data = None
-        self._raw = None
+        self._raw = response_text
+        self._parse_text = get_parser(parser)
+        self._parsed = False
 
-        self._parse(response_text)
+        if not lazy or not self._scan(response_text):
+            self._parse()
 
     @property
     def name(self):
@@ -44,6 +64,9 @@ class ApiResponse:
         """
         :returns: response data
         """
+        if not self._parsed:
+            self._parse()
+
         return self._data
 
     @property
@@ -53,13 +76,41 @@ class ApiResponse:
         """
         return self._raw
 
-    def _parse(self, response_text):
+    def _scan(self, response_text):
+        """
+        :returns: True if name, user and success were found in the header
+        """
+        if not isinstance(response_text, str):
+            return False
+
+        header_end = response_text.find('<response')
+        if header_end == -1:
+            return False
+
+        header = response_text[:header_end]
+
+        method = _METHOD.search(header)
+        user = _USER.search(header)
+        result = _RESULT.match(response_text, header_end)
+
+        if method is None or user is None or result is None:
+            return False
+
+        self._name = unescape(method.group(1).strip()) or None
+        self._user = unescape((user.group(1) or '').strip()) or None
+        self._success = (result.group(2) == 'ok')
+
+        return True
+
+    def _parse(self):
+        self._parsed = True
+        self._name = None
+        self._user = None
         self._success = False
-        self._raw = response_text
 
         try:
-            response_dict = xmltodict.parse(response_text)
-        except xmltodict.expat.ExpatError:
+            response_dict = self._parse_text(self._raw)
+        except ParseError:
             return
 
         # for some requests speaker returns command in response that does not match request command
@@ -0,0 +1,128 @@
+"""
+Retrying of failed idempotent api calls.
+"""
+import logging
+import random
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    Retry failed calls with exponential backoff and full jitter.
+
+    Delay before n-th retry is random between 0 and min(max_delay, base_delay * 2^(n-1)). Calls are retried until
+    they succeed, attempts run out, or the next retry would not start before deadline measured from the first
+    attempt. Each attempt is given the time left until the deadline, to use as its timeout.
+
+    Only meant for calls that are safe to repeat, such as Get* actions.
+
+    Example:
+        retry_policy = RetryPolicy(attempts=3, base_delay=0.1, deadline=5)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', retry_policy=retry_policy)
+    """
+
+    def __init__(self, attempts=3, base_delay=0.1, max_delay=1, deadline=5, clock=time.monotonic, sleep=time.sleep,
+                 rand=random.random):
+        """
+        :param attempts: Maximum number of attempts, including the first one
+        :param base_delay: Delay in seconds before the first retry, before jitter is applied
+        :param max_delay: Maximum delay in seconds between attempts
+        :param deadline: Time in seconds since the first attempt after which no more retries are made
+        :param clock: Callable returning current time in seconds
+        :param sleep: Callable sleeping for given number of seconds
+        :param rand: Callable returning random float between 0 and 1
+        """
+        if attempts < 1:
+            raise ValueError('Attempts must be at least 1')
+
+        self._attempts = attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._clock = clock
+        self._sleep = sleep
+        self._rand = rand
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'calls': 0,
+            'retries': 0,
+            'succeeded': 0,
+            'recovered': 0,
+            'exhausted': 0,
+            'deadline_exceeded': 0,
+            'not_retryable': 0,
+        }
+
+    @property
+    def attempts(self):
+        """
+        :returns: Maximum number of attempts, including the first one
+        """
+        return self._attempts
+
+    def run(self, load, is_retryable):
+        """
+        Make the call, retrying it on retryable failures.
+
+        :param load: Callable making the actual call, accepting time in seconds left until the deadline
+        :param is_retryable: Callable accepting exception raised by load, returning True if call can be retried
+        :returns: Result of the call
+        """
+        started = self._clock()
+        attempt = 1
+
+        self._count('calls')
+
+        while True:
+            try:
+                result = load(self._deadline - (self._clock() - started))
+            except Exception as load_exception:  # pylint: disable=broad-except
+                if not is_retryable(load_exception):
+                    self._count('not_retryable')
+                    raise
+
+                if attempt >= self._attempts:
+                    self._count('exhausted')
+                    raise
+
+                delay = self._rand() * min(self._max_delay, self._base_delay * 2**(attempt - 1))
+
+                if self._clock() + delay - started >= self._deadline:
+                    self._count('deadline_exceeded')
+                    raise
+
+                _LOGGER.debug('Attempt %d failed, retrying in %.3f seconds', attempt, delay)
+
+                self._count('retries')
+                self._sleep(delay)
+
+                attempt += 1
+                continue
+
+            self._count('succeeded' if attempt == 1 else 'recovered')
+
+            return result
+
+    def stats(self):
+        """
+        Get retry statistics.
+
+        :returns: Dict
+            - calls - number of calls made
+            - retries - number of retries made
+            - succeeded - number of calls that succeeded at first attempt
+            - recovered - number of calls that succeeded after being retried
+            - exhausted - number of calls that failed at the last attempt
+            - deadline_exceeded - number of calls that failed because deadline would pass before the next attempt
+            - not_retryable - number of calls that failed with an error that can not be retried
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
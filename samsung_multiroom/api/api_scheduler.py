@@ -0,0 +1,275 @@
+"""
+Per-speaker scheduling of api calls.
+"""
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+LANE_INTERACTIVE = 'interactive'
+LANE_BULK = 'bulk'
+
+DEFAULT_WEIGHTS = {
+    LANE_INTERACTIVE: 4,
+    LANE_BULK: 1,
+}
+
+DEFAULT_BULK_ACTIONS = [
+    'BrowseMain',
+    'GetCpList',
+    'GetCpPlayerPlaylist',
+    'GetCurrentRadioList',
+    'GetDmsList',
+    'GetPresetList',
+    'GetSelectRadioList',
+    'GetUpperRadioList',
+    'PCGetMusicListByCategory',
+    'PCGetMusicListByID',
+    'SetSelectCpSubmenu',
+]
+
+
+class CommandScheduler:
+    """
+    Queue api calls to a single speaker in an interactive and a bulk lane.
+
+    At most concurrency calls are sent to the speaker at once, the rest wait in their lane in arrival order. Lanes are
+    served by weighted round robin, so interactive calls overtake a long list crawl, while the crawl still makes
+    progress.
+
+    List browsing actions go to the bulk lane, everything else is interactive. Lane can be also chosen for all calls
+    made by the current thread.
+
+    A thread already holding a turn, e.g. while consuming a streamed response, is not queued again for calls it makes
+    in the meantime, so they cannot deadlock waiting for its own turn.
+
+    Example:
+        scheduler = CommandScheduler(concurrency=1)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', scheduler=scheduler)
+
+        with scheduler.lane(LANE_BULK):
+            api.get_alarm_info()
+    """
+
+    def __init__(self, concurrency=1, weights=None, bulk_actions=None):
+        """
+        :param concurrency: Maximum number of calls sent to the speaker at once
+        :param weights: Dict of lane name to number of its calls served in a row when both lanes are busy, defaults
+            to DEFAULT_WEIGHTS
+        :param bulk_actions: List of action names queued in the bulk lane, defaults to DEFAULT_BULK_ACTIONS
+        """
+        if concurrency < 1:
+            raise ValueError('Concurrency must be at least 1')
+
+        self._concurrency = concurrency
+        self._weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self._bulk_actions = set(DEFAULT_BULK_ACTIONS if bulk_actions is None else bulk_actions)
+
+        if set(self._weights.keys()) != {LANE_INTERACTIVE, LANE_BULK} or min(self._weights.values()) < 1:
+            raise ValueError('Weights must be at least 1 for both lanes')
+
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._queues = {lane: collections.deque() for lane in self._weights}
+        self._credits = dict(self._weights)
+        self._running = 0
+        self._holders = collections.Counter()
+
+        self._stats = {lane: _LaneStats() for lane in self._weights}
+
+    @property
+    def concurrency(self):
+        """
+        :returns: Maximum number of calls sent to the speaker at once
+        """
+        return self._concurrency
+
+    @contextlib.contextmanager
+    def lane(self, lane):
+        """
+        Queue all calls made by the current thread within the context in a lane.
+
+        :param lane: LANE_* constant
+        """
+        if lane not in self._queues:
+            raise ValueError('Invalid lane {0}, must be one of LANE_* constants'.format(lane))
+
+        lanes = self._get_thread_lanes()
+        lanes.append(lane)
+
+        try:
+            yield
+        finally:
+            lanes.pop()
+
+    def get_lane(self, action):
+        """
+        :param action: Action name e.g. GetDmsList
+        :returns: LANE_* constant call would be queued in
+        """
+        lanes = self._get_thread_lanes()
+        if lanes:
+            return lanes[-1]
+
+        return LANE_BULK if action in self._bulk_actions else LANE_INTERACTIVE
+
+    def run(self, action, load):
+        """
+        Wait for turn and make the call.
+
+        :param action: Action name e.g. GetDmsList
+        :param load: Callable making the actual call
+        :returns: Result of the call
+        """
+        with self.slot(action):
+            return load()
+
+    @contextlib.contextmanager
+    def slot(self, action):
+        """
+        Wait for turn and hold it until the context is left.
+
+        Meant for calls that are consumed gradually, such as streamed responses. Nested calls made by the thread
+        holding the turn go ahead without waiting.
+
+        :param action: Action name e.g. GetDmsList
+        """
+        lane = self.get_lane(action)
+        holder = threading.get_ident()
+        ticket = object()
+        queued_at = time.monotonic()
+
+        with self._condition:
+            if not self._holders[holder]:
+                queue = self._queues[lane]
+                queue.append(ticket)
+                self._stats[lane].queued(len(queue))
+
+                while self._running >= self._concurrency or self._select_lane() != lane or queue[0] is not ticket:
+                    self._condition.wait()
+
+                self._dequeue(lane)
+
+            self._running += 1
+            self._holders[holder] += 1
+            self._stats[lane].started(time.monotonic() - queued_at)
+
+        try:
+            yield
+        finally:
+            self._release(holder)
+
+    @contextlib.contextmanager
+    def spare_slot(self, action):
+        """
+        Take turn only if one is free right away, without queueing, and hold it until the context is left.
+
+        Meant for optional calls not worth waiting for, such as duplicates of slow calls.
+
+        :param action: Action name e.g. GetDmsList
+        :returns: Context manager yielding True if turn was taken, False if every turn is busy or calls are waiting
+        """
+        lane = self.get_lane(action)
+        holder = threading.get_ident()
+
+        with self._condition:
+            acquired = self._running < self._concurrency and not any(self._queues.values())
+
+            if acquired:
+                self._running += 1
+                self._holders[holder] += 1
+                self._stats[lane].started(0)
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._release(holder)
+
+    def stats(self):
+        """
+        Get queue statistics.
+
+        :returns: Dict
+            - running - number of calls currently sent to the speaker
+            - interactive, bulk - dict of lane statistics
+                - depth - number of calls currently waiting
+                - max_depth - highest number of calls waiting at once
+                - calls - number of calls made
+                - wait_time - total time in seconds calls spent waiting
+                - max_wait_time - longest time in seconds a call waited
+        """
+        with self._condition:
+            stats = {'running': self._running}
+
+            for lane, lane_stats in self._stats.items():
+                stats[lane] = lane_stats.to_dict(len(self._queues[lane]))
+
+            return stats
+
+    def _release(self, holder):
+        with self._condition:
+            self._running -= 1
+            self._holders[holder] -= 1
+            if not self._holders[holder]:
+                del self._holders[holder]
+
+            self._condition.notify_all()
+
+    def _get_thread_lanes(self):
+        lanes = getattr(self._local, 'lanes', None)
+        if lanes is None:
+            lanes = self._local.lanes = []
+
+        return lanes
+
+    def _select_lane(self):
+        busy = [lane for lane in (LANE_INTERACTIVE, LANE_BULK) if self._queues[lane]]
+
+        for lane in busy:
+            if self._credits[lane] > 0:
+                return lane
+
+        # every busy lane used up its turn, next round starts with the interactive one
+        return busy[0] if busy else None
+
+    def _dequeue(self, lane):
+        busy = [busy_lane for busy_lane in self._queues if self._queues[busy_lane]]
+
+        if all([self._credits[busy_lane] <= 0 for busy_lane in busy]):
+            self._credits = dict(self._weights)
+
+        self._queues[lane].popleft()
+        self._credits[lane] -= 1
+
+
+class _LaneStats:
+
+    def __init__(self):
+        self.max_depth = 0
+        self.calls = 0
+        self.wait_time = 0
+        self.max_wait_time = 0
+
+    def queued(self, depth):
+        """Record call added to the lane, leaving depth calls waiting."""
+        self.max_depth = max(self.max_depth, depth)
+
+    def started(self, wait_time):
+        """Record call that took its turn after waiting wait_time seconds."""
+        self.calls += 1
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def to_dict(self, depth):
+        """Build stats dict of the lane with depth calls currently waiting."""
+        return {
+            'depth': depth,
+            'max_depth': self.max_depth,
+            'calls': self.calls,
+            'wait_time': self.wait_time,
+            'max_wait_time': self.max_wait_time,
+        }
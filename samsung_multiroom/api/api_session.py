@@ -0,0 +1,157 @@
+"""
+Keep-alive HTTP session for speaker's api.
+"""
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ApiSession:
+    """
+    Pooled HTTP session with keep-alive, meant to be used by a single speaker.
+
+    Connections are reused between requests, so a call does not pay for a new TCP connection every time. If the
+    session is not used for longer than idle_timeout, all its connections are dropped and a fresh session is created
+    on the next request, so stale sockets closed by the speaker are not reused.
+
+    Example:
+        session = ApiSession(pool_size=2, idle_timeout=30)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', session=session)
+    """
+
+    def __init__(self, pool_size=2, idle_timeout=30):
+        """
+        :param pool_size: Maximum number of connections kept open to the speaker
+        :param idle_timeout: Time in seconds after which an unused session is closed, None to never close it
+        """
+        if pool_size < 1:
+            raise ValueError('Pool size must be at least 1')
+
+        self._pool_size = pool_size
+        self._idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._adapter = None
+        self._last_used = None
+
+        self._requests = 0
+        self._sessions = 0
+        self._evictions = 0
+        self._closed_connections = 0
+
+    @property
+    def pool_size(self):
+        """
+        :returns: Maximum number of connections kept open to the speaker
+        """
+        return self._pool_size
+
+    @property
+    def idle_timeout(self):
+        """
+        :returns: Time in seconds after which an unused session is closed
+        """
+        return self._idle_timeout
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        """
+        Make GET request reusing pooled connections.
+
+        :param url: URL to request
+        :param headers: Dict of headers to send
+        :param timeout: Timeout in seconds
+        :param stream: Receive response body only as it is iterated, connection is returned to the pool once the
+            response is closed
+        :returns: requests.Response instance
+        :raises: requests.exceptions.RequestException
+        """
+        session = self._acquire()
+
+        return session.get(url, headers=headers, timeout=timeout, stream=stream)
+
+    def close(self):
+        """
+        Close all pooled connections.
+
+        Session can still be used afterwards, new connections will be opened as needed.
+        """
+        with self._lock:
+            self._close_session()
+
+    def stats(self):
+        """
+        Get pooling statistics.
+
+        :returns: Dict
+            - requests - total number of requests made
+            - connections - total number of TCP connections opened
+            - reused - number of requests that reused already open connection
+            - sessions - number of sessions created
+            - evictions - number of sessions closed after being idle
+        """
+        with self._lock:
+            connections = self._closed_connections + self._count_connections()
+
+            return {
+                'requests': self._requests,
+                'connections': connections,
+                'reused': max(0, self._requests - connections),
+                'sessions': self._sessions,
+                'evictions': self._evictions,
+            }
+
+    def _acquire(self):
+        with self._lock:
+            now = time.monotonic()
+
+            if self._session is not None and self._is_idle(now):
+                _LOGGER.debug('Closing session idle for %.1f seconds', now - self._last_used)
+                self._close_session()
+                self._evictions += 1
+
+            if self._session is None:
+                self._open_session()
+
+            self._last_used = now
+            self._requests += 1
+
+            return self._session
+
+    def _is_idle(self, now):
+        if self._idle_timeout is None or self._last_used is None:
+            return False
+
+        return now - self._last_used > self._idle_timeout
+
+    def _open_session(self):
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+
+        self._session = requests.Session()
+        self._session.mount('http://', self._adapter)
+
+        self._sessions += 1
+
+    def _close_session(self):
+        if self._session is None:
+            return
+
+        self._closed_connections += self._count_connections()
+
+        self._session.close()
+        self._session = None
+        self._adapter = None
+
+    def _count_connections(self):
+        if self._adapter is None:
+            return 0
+
+        pools = self._adapter.poolmanager.pools
+        connection_pools = [pools.get(key) for key in pools.keys()]
+
+        return sum([p.num_connections for p in connection_pools if p is not None])
@@ -0,0 +1,98 @@
+"""
+Coalescing of concurrent identical api calls.
+"""
+import copy
+import logging
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Share result of an in-flight call with every caller asking for the same key in the meantime.
+
+    First caller makes the call, others wait for it to finish and receive a copy of its result, or the same exception.
+    Once the call finishes, the next caller starts a new one.
+
+    Example:
+        single_flight = SingleFlight()
+        single_flight.do(('UIC', '<name>GetVolume</name>'), lambda: api.request('get', 'UIC', '<name>GetVolume</name>'))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+        self._calls_made = 0
+        self._calls_shared = 0
+
+    def do(self, key, load):
+        """
+        Call load, unless a call with the same key is already in flight.
+
+        :param key: Hashable identifying the call
+        :param load: Callable making the actual call
+        :returns: Result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+                self._calls_made += 1
+            else:
+                call.followers += 1
+                self._calls_shared += 1
+
+        if not leader:
+            _LOGGER.debug('Waiting for in-flight call %s', key)
+            call.done.wait()
+
+            if call.exception is not None:
+                raise call.exception
+
+            return copy.deepcopy(call.result)
+
+        result = None
+
+        try:
+            result = load()
+        except BaseException as load_exception:
+            call.exception = load_exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            # leader might modify the result as soon as it is returned, followers copy a snapshot taken before
+            if call.followers and call.exception is None:
+                call.result = copy.deepcopy(result)
+
+            call.done.set()
+
+        return result
+
+    def stats(self):
+        """
+        Get coalescing statistics.
+
+        :returns: Dict
+            - calls - number of calls made
+            - shared - number of callers that received result of another caller's call
+        """
+        with self._lock:
+            return {
+                'calls': self._calls_made,
+                'shared': self._calls_shared,
+            }
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.exception = None
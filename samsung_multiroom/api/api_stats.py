@@ -0,0 +1,177 @@
+"""
+Call counters and latency histograms per speaker and action.
+"""
+import bisect
+import threading
+
+# upper bounds of latency buckets in seconds, latencies above the last one fall into an overflow bucket
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class ApiStats:
+    """
+    Count calls, errors and bytes per speaker and action, and keep histograms of their latency. Messages pushed by
+    the event stream are counted apart from calls.
+
+    Each api has its own stats by default. Pass the same instance to apis and streams of many speakers to see all of
+    them in one place, e.g. to spot the ones on weak Wi-Fi by their latency percentiles.
+
+    Example:
+        api_stats = ApiStats()
+        apis = [SamsungMultiroomApi('unique-id', ip_address, api_stats=api_stats) for ip_address in ip_addresses]
+
+        for speaker, actions in api_stats.stats().items():
+            for action, stats in actions.items():
+                print(speaker, action, stats['calls'], stats['p95'])
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: Ascending upper bounds of latency buckets in seconds
+        """
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError('Buckets must be a non empty ascending sequence')
+
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._actions = {}
+        self._messages = {}
+
+    @property
+    def buckets(self):
+        """
+        :returns: Upper bounds of latency buckets in seconds
+        """
+        return self._buckets
+
+    def record(self, speaker, action, latency=None, bytes_out=0, bytes_in=0, error=False):
+        """
+        Record a call.
+
+        :param speaker: Speaker IP address
+        :param action: Action name e.g. GetVolume
+        :param latency: Time in seconds the call took, None if not known
+        :param bytes_out: Number of bytes of the request sent
+        :param bytes_in: Number of bytes of the response received
+        :param error: True if the call failed
+        """
+        with self._lock:
+            counter = self._actions.get((speaker, action))
+            if counter is None:
+                counter = self._actions[(speaker, action)] = _Counter(len(self._buckets) + 1)
+
+            counter.calls += 1
+            counter.bytes_out += bytes_out
+            counter.bytes_in += bytes_in
+
+            if error:
+                counter.errors += 1
+
+            if latency is not None:
+                counter.histogram[bisect.bisect_left(self._buckets, latency)] += 1
+                counter.latency_sum += latency
+                counter.latency_max = max(counter.latency_max, latency)
+
+    def record_message(self, speaker, name, bytes_in=0):
+        """
+        Record a message pushed by the event stream.
+
+        :param speaker: Speaker IP address
+        :param name: Response name e.g. VolumeLevel
+        :param bytes_in: Number of bytes of the message
+        """
+        with self._lock:
+            counter = self._messages.setdefault((speaker, name), [0, 0])
+            counter[0] += 1
+            counter[1] += bytes_in
+
+    def stats(self):
+        """
+        Get call statistics.
+
+        :returns: Dict of speaker IP address to dict of action name to dict
+            - calls - number of calls made
+            - errors - number of calls that failed
+            - bytes_out - number of bytes sent
+            - bytes_in - number of bytes received
+            - latency_mean - mean latency in seconds, None if no latency was recorded
+            - latency_max - highest latency in seconds, None if no latency was recorded
+            - p50, p95, p99 - upper bound of the bucket holding the percentile in seconds, None if no latency was
+              recorded, infinity if it is in the overflow bucket
+            - histogram - list of tuples (upper bound in seconds, number of calls), last bound is infinity
+        """
+        bounds = self._buckets + (float('inf'), )
+
+        with self._lock:
+            stats = {}
+
+            for (speaker, action), counter in self._actions.items():
+                stats.setdefault(speaker, {})[action] = counter.to_dict(bounds)
+
+            return stats
+
+    def message_stats(self):
+        """
+        Get event stream message statistics.
+
+        :returns: Dict of speaker IP address to dict of response name to dict
+            - messages - number of messages received
+            - bytes_in - number of bytes received
+        """
+        with self._lock:
+            stats = {}
+
+            for (speaker, name), (messages, bytes_in) in self._messages.items():
+                stats.setdefault(speaker, {})[name] = {'messages': messages, 'bytes_in': bytes_in}
+
+            return stats
+
+    def reset(self):
+        """
+        Forget all recorded calls and messages.
+        """
+        with self._lock:
+            self._actions.clear()
+            self._messages.clear()
+
+
+class _Counter:
+
+    def __init__(self, size):
+        self.calls = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.histogram = [0] * size
+        self.latency_sum = 0
+        self.latency_max = 0
+
+    def to_dict(self, bounds):
+        """Build stats dict of the action, with histogram buckets labelled by bounds."""
+        samples = sum(self.histogram)
+
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'bytes_out': self.bytes_out,
+            'bytes_in': self.bytes_in,
+            'latency_mean': self.latency_sum / samples if samples else None,
+            'latency_max': self.latency_max if samples else None,
+            'p50': self.get_percentile(bounds, samples, 0.5),
+            'p95': self.get_percentile(bounds, samples, 0.95),
+            'p99': self.get_percentile(bounds, samples, 0.99),
+            'histogram': list(zip(bounds, self.histogram)),
+        }
+
+    def get_percentile(self, bounds, samples, percentile):
+        """Get upper bound of the histogram bucket the percentile, a fraction between 0 and 1, falls into."""
+        if not samples:
+            return None
+
+        seen = 0
+        for bound, count in zip(bounds, self.histogram):
+            seen += count
+            if seen >= samples * percentile:
+                return bound
+
+        return bounds[-1]
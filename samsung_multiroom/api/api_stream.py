@@ -2,14 +2,13 @@
 Stream messages from the speaker.
 """
 import logging
-import socket
+import time
+import urllib.parse
 
+from .api_payload import parse_action
 from .api_response import ApiResponse
-
-try:
-    from http_parser.parser import HttpParser
-except ImportError:
-    from http_parser.pyparser import HttpParser
+from .transport import RequestsTransport
+from .transport import TransportException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +29,7 @@ class ApiStream:
             print(response.data)
     """
 
-    def __init__(self, user, ip_address, port=55001, timeout=None):
+    def __init__(self, user, ip_address, port=55001, timeout=None, transport=None, api_stats=None):
         """
         Initialise stream.
 
@@ -38,11 +37,16 @@ class ApiStream:
         :param ip_address: IP address of the speaker to connect to
         :param port: Port to use, defaults to 55001
         :param timeout: Timeout in seconds
+        :param transport: (optional) Transport instance, defaults to RequestsTransport
+        :param api_stats: (optional) ApiStats instance recording opening of the stream as a call of the requested
+            action, with latency until the first message, and counting messages by response name
         """
         self._user = user
         self._ip_address = ip_address
         self._port = port
         self._timeout = timeout
+        self._transport = transport or RequestsTransport()
+        self._api_stats = api_stats
         self._continue_stream = False
 
     def open(self, uri):
@@ -61,51 +65,44 @@ class ApiStream:
             'mobileVersion': '1.0',
         }
 
+        action = parse_action(urllib.parse.unquote(uri.partition('cmd=')[2]))
+
         while self._continue_stream:
             _LOGGER.debug('Opening new stream')
+            connection = None
+            started = time.monotonic()
             try:
-                parser = HttpParser()
-                body = []
-
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.connect((self._ip_address, self._port))
-                sock.settimeout(self._timeout)
-                sock.send('GET {0} HTTP/1.1\r\n'.format(uri).encode())
-                sock.send('Host: {0}:{1}\r\n'.format(self._ip_address, self._port).encode())
-                for header, value in headers.items():
-                    sock.send('{0}: {1}\r\n'.format(header, value).encode())
-                sock.send('\r\n\r\n'.encode())
+                connection = self._transport.open_stream(self._ip_address, self._port, uri, headers, self._timeout)
 
                 while self._continue_stream:
                     _LOGGER.debug('Receiving from stream')
-                    data = sock.recv(1024)
-
-                    while data:
-                        _LOGGER.debug('Received data: %s', data.decode())
-                        received_length = len(data)
-                        parsed_length = parser.execute(data, received_length)
+                    for response_text in connection.receive():
+                        _LOGGER.debug('Stream response: %s', response_text)
 
-                        if parser.is_partial_body():
-                            body.append(parser.recv_body().decode())
+                        response = ApiResponse(response_text)
 
-                        if parser.is_message_complete():
-                            full_body = ''.join(body)
-                            parser = HttpParser()
-                            body = []
+                        if self._api_stats is not None:
+                            if started is not None:
+                                self._api_stats.record(self._ip_address, action, time.monotonic() - started, len(uri))
+                                started = None
 
-                            _LOGGER.debug('Stream response: %s', full_body)
+                            # unparseable messages have no name to be counted under
+                            if response.name is not None:
+                                self._api_stats.record_message(self._ip_address, response.name,
+                                                               len(response_text.encode()))
 
-                            yield ApiResponse(full_body)
+                        yield response
+            except TransportException:
+                if self._api_stats is not None and started is not None:
+                    self._api_stats.record(self._ip_address, action, time.monotonic() - started, len(uri), error=True)
 
-                        data = data[parsed_length:]
-            except socket.error:
-                _LOGGER.error('Socket exception', exc_info=1)
+                _LOGGER.error('Stream exception', exc_info=1)
             except StopIteration:
                 break
             finally:
                 _LOGGER.debug('Closing the stream')
-                sock.shutdown(socket.SHUT_RDWR)
-                sock.close()
+                if connection is not None:
+                    connection.close()
 
     def close(self):
         """
@@ -0,0 +1,138 @@
+"""
+Timeouts derived from observed round trip times.
+"""
+import logging
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveTimeout:
+    """
+    Track smoothed round trip time and its variance per action and derive request timeouts from them.
+
+    Works like TCP retransmission timeout (RFC 6298): timeout is srtt + k * rttvar, bounded by floor and ceiling.
+    Until enough round trips are observed, ceiling is used. Each timed out request doubles the timeout of the action
+    until the next successful one.
+
+    Example:
+        timeouts = AdaptiveTimeout(floor=0.5, ceiling=5)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', timeouts=timeouts)
+    """
+
+    def __init__(self, floor=0.5, ceiling=5, min_samples=3, alpha=0.125, beta=0.25, k=4):
+        """
+        :param floor: Lowest timeout in seconds
+        :param ceiling: Highest timeout in seconds
+        :param min_samples: Number of round trips observed before timeout is derived from them
+        :param alpha: Gain of the smoothed round trip time
+        :param beta: Gain of the round trip time variance
+        :param k: Number of variances added to the smoothed round trip time
+        """
+        if floor <= 0 or ceiling < floor:
+            raise ValueError('Floor must be positive and not greater than ceiling')
+
+        self._floor = floor
+        self._ceiling = ceiling
+        self._min_samples = min_samples
+        self._alpha = alpha
+        self._beta = beta
+        self._k = k
+
+        self._lock = threading.Lock()
+        self._actions = {}
+
+    @property
+    def floor(self):
+        """
+        :returns: Lowest timeout in seconds
+        """
+        return self._floor
+
+    @property
+    def ceiling(self):
+        """
+        :returns: Highest timeout in seconds
+        """
+        return self._ceiling
+
+    def get_timeout(self, action):
+        """
+        :param action: Action name e.g. GetVolume
+        :returns: Timeout in seconds for the next request
+        """
+        with self._lock:
+            estimate = self._actions.get(action)
+
+            if estimate is None or estimate.samples < self._min_samples:
+                return self._ceiling
+
+            timeout = (estimate.srtt + self._k * estimate.rttvar) * 2**estimate.backoffs
+
+            return min(self._ceiling, max(self._floor, timeout))
+
+    def observe(self, action, rtt):
+        """
+        Record round trip time of a successful request.
+
+        :param action: Action name e.g. GetVolume
+        :param rtt: Round trip time in seconds
+        """
+        with self._lock:
+            estimate = self._actions.setdefault(action, _Estimate())
+
+            if estimate.samples == 0:
+                estimate.srtt = rtt
+                estimate.rttvar = rtt / 2
+            else:
+                estimate.rttvar = (1 - self._beta) * estimate.rttvar + self._beta * abs(estimate.srtt - rtt)
+                estimate.srtt = (1 - self._alpha) * estimate.srtt + self._alpha * rtt
+
+            estimate.samples += 1
+            estimate.backoffs = 0
+
+    def backoff(self, action):
+        """
+        Record failed request, doubling timeout of the next one.
+
+        :param action: Action name e.g. GetVolume
+        """
+        with self._lock:
+            estimate = self._actions.setdefault(action, _Estimate())
+
+            # no point doubling beyond the ceiling
+            if estimate.samples and (estimate.srtt + self._k * estimate.rttvar) * 2**estimate.backoffs < self._ceiling:
+                estimate.backoffs += 1
+
+            _LOGGER.debug('Request %s failed, backing off %d times', action, estimate.backoffs)
+
+    def stats(self):
+        """
+        Get round trip statistics.
+
+        :returns: Dict of action name to dict
+            - srtt - smoothed round trip time in seconds
+            - rttvar - round trip time variance in seconds
+            - samples - number of round trips observed
+            - backoffs - number of times timeout is currently doubled
+        """
+        with self._lock:
+            return {action: estimate.to_dict() for action, estimate in self._actions.items()}
+
+
+class _Estimate:
+
+    def __init__(self):
+        self.srtt = 0
+        self.rttvar = 0
+        self.samples = 0
+        self.backoffs = 0
+
+    def to_dict(self):
+        """Build stats dict of the action."""
+        return {
+            'srtt': self.srtt,
+            'rttvar': self.rttvar,
+            'samples': self.samples,
+            'backoffs': self.backoffs,
+        }
@@ -0,0 +1,195 @@
+"""
+Spans of facade and api calls, and a log of slow ones.
+"""
+import contextlib
+import contextvars
+import functools
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+_CURRENT_SPAN = contextvars.ContextVar('samsung_multiroom_span', default=None)
+
+
+class NullTracer:
+    """
+    Tracer recording nothing, used until another one is set with set_tracer().
+
+    Methods decorated with traced() skip it altogether, so tracing costs a single attribute check per call.
+    """
+
+    enabled = False
+
+    def span(self, name, **attributes):  # pylint: disable=unused-argument
+        """
+        :returns: Context manager doing nothing
+        """
+        return contextlib.nullcontext()
+
+
+class Tracer:
+    """
+    Time calls as spans nested in the calls they were made from, and log the slow ones.
+
+    Facade calls e.g. Speaker.group or DlnaBrowser.browse are parents of the api requests they make, so a slow
+    facade call can be narrowed down to the request that made it slow. Spans follow threads of paginator() prefetch,
+    HedgePolicy and BulkExecutor.
+
+    Example:
+        tracer = Tracer(slow_threshold=0.5)
+        tracer.add_listener(lambda span: print(span.path, span.elapsed))
+        set_tracer(tracer)
+
+        speaker.browser('dlna').browse('/NAS/Music')
+    """
+
+    enabled = True
+
+    def __init__(self, slow_threshold=None, clock=time.monotonic):
+        """
+        :param slow_threshold: (optional) Time in seconds, spans taking at least that long are logged as a warning
+        :param clock: Callable returning current time in seconds
+        """
+        self._slow_threshold = slow_threshold
+        self._clock = clock
+        self._listeners = []
+
+    @property
+    def slow_threshold(self):
+        """
+        :returns: Time in seconds spans taking at least that long are logged, None if none are
+        """
+        return self._slow_threshold
+
+    def add_listener(self, listener):
+        """
+        Add listener called with every finished span.
+
+        :param listener: Callable accepting Span instance
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Remove listener.
+
+        :param listener: Callable previously added
+        """
+        self._listeners.remove(listener)
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        """
+        Time the context as a span, child of the span current when it is entered.
+
+        :param name: Span name e.g. Speaker.group or GetVolume
+        :param attributes: Attributes of the span e.g. speaker IP address
+        :returns: Context manager yielding Span instance
+        """
+        span = Span(name, get_current_span(), attributes, self._clock())
+        token = _CURRENT_SPAN.set(span)
+
+        try:
+            yield span
+        except BaseException as exception:
+            span.error = exception
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.elapsed = self._clock() - span.started
+            self._finish(span)
+
+    def _finish(self, span):
+        if self._slow_threshold is not None and span.elapsed >= self._slow_threshold:
+            _LOGGER.warning('Slow call %s %s took %.3f seconds', span.path, span.attributes, span.elapsed)
+
+        for listener in self._listeners:
+            try:
+                listener(span)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.error('Span listener failed', exc_info=1)
+
+
+class Span:
+    """
+    Timed call, possibly made from within another one.
+    """
+
+    __slots__ = ('name', 'parent', 'attributes', 'started', 'elapsed', 'error')
+
+    def __init__(self, name, parent, attributes, started):
+        """
+        :param name: Span name e.g. Speaker.group
+        :param parent: Span instance the call was made from, or None
+        :param attributes: Dict of span attributes
+        :param started: Time the call started at in seconds
+        """
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.started = started
+        self.elapsed = None
+        self.error = None
+
+    @property
+    def path(self):
+        """
+        :returns: Names of the span and its parents, outermost first e.g. Speaker.group > GetSpkName
+        """
+        names = []
+
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+
+        return ' > '.join(reversed(names))
+
+    def __repr__(self):
+        return 'Span({0!r}, elapsed={1!r})'.format(self.path, self.elapsed)
+
+
+_TRACER = NullTracer()
+
+
+def get_tracer():
+    """
+    :returns: Tracer in use, NullTracer by default
+    """
+    return _TRACER
+
+
+def set_tracer(tracer):
+    """
+    Set tracer used by all speakers.
+
+    :param tracer: Tracer instance, None to stop tracing
+    """
+    global _TRACER  # pylint: disable=global-statement
+    _TRACER = tracer or NullTracer()
+
+
+def get_current_span():
+    """
+    :returns: Span instance of the call being made, None if there is none
+    """
+    return _CURRENT_SPAN.get()
+
+
+def traced(func):
+    """
+    Decorate method to time its calls as spans named after it e.g. Speaker.group.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _TRACER
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+
+        with tracer.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
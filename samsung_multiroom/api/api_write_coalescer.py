@@ -0,0 +1,162 @@
+"""
+Coalescing of rapid "last value wins" api writes.
+"""
+import concurrent.futures
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteCoalescer:
+    """
+    Collapse writes to the same target into one.
+
+    Writes are sent by a background thread, at most one per target every flush_interval. A write submitted while
+    another one to the same target is waiting replaces it, and both callers get the same future, resolved once the
+    last value is applied.
+
+    Example:
+        write_coalescer = WriteCoalescer(flush_interval=0.1)
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', write_coalescer=write_coalescer)
+
+        for volume in range(30):
+            future = api.set_volume(volume)
+
+        future.result()
+    """
+
+    def __init__(self, flush_interval=0.1, clock=time.monotonic):
+        """
+        :param flush_interval: Minimum time in seconds between two writes to the same target
+        :param clock: Callable returning current time in seconds
+        """
+        self._flush_interval = flush_interval
+        self._clock = clock
+
+        self._condition = threading.Condition()
+        self._pending = {}
+        self._next_flush = {}
+        self._thread = None
+        self._closed = False
+
+        self._submitted = 0
+        self._sent = 0
+
+    @property
+    def flush_interval(self):
+        """
+        :returns: Minimum time in seconds between two writes to the same target
+        """
+        return self._flush_interval
+
+    def submit(self, target, write):
+        """
+        Queue a write, replacing one waiting for the same target.
+
+        :param target: Hashable identifying what is written, e.g. action name
+        :param write: Callable making the actual write
+        :returns: concurrent.futures.Future resolved with the result of the write eventually sent
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('Write coalescer is closed')
+
+            self._submitted += 1
+
+            if target in self._pending:
+                future = self._pending[target][1]
+            else:
+                future = concurrent.futures.Future()
+
+            self._pending[target] = (write, future)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='samsung-multiroom-writer', daemon=True)
+                self._thread.start()
+
+            self._condition.notify_all()
+
+            return future
+
+    def flush(self):
+        """
+        Send all waiting writes straight away and wait until they are applied.
+        """
+        with self._condition:
+            self._next_flush.clear()
+            futures = [future for _, future in self._pending.values()]
+            self._condition.notify_all()
+
+        concurrent.futures.wait(futures)
+
+    def close(self):
+        """
+        Send all waiting writes and stop the background thread.
+        """
+        self.flush()
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self):
+        """
+        Get coalescing statistics.
+
+        :returns: Dict
+            - submitted - number of writes submitted
+            - sent - number of writes sent
+            - pending - number of writes waiting to be sent
+        """
+        with self._condition:
+            return {
+                'submitted': self._submitted,
+                'sent': self._sent,
+                'pending': len(self._pending),
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                target, wait = self._next_target()
+
+                while target is None and not self._closed:
+                    self._condition.wait(wait)
+                    target, wait = self._next_target()
+
+                if target is None:
+                    return
+
+                write, future = self._pending.pop(target)
+                self._sent += 1
+
+            try:
+                future.set_result(write())
+            except Exception as write_exception:  # pylint: disable=broad-except
+                _LOGGER.error('Write to %s failed', target, exc_info=1)
+                future.set_exception(write_exception)
+
+            with self._condition:
+                self._next_flush[target] = self._clock() + self._flush_interval
+
+    def _next_target(self):
+        """
+        :returns: Tuple (target due to be written or None, time in seconds until next one is due or None)
+        """
+        now = self._clock()
+        wait = None
+
+        for target in self._pending:
+            due = self._next_flush.get(target, now) - now
+
+            if due <= 0:
+                return (target, None)
+
+            wait = due if wait is None else min(wait, due)
+
+        return (None, wait)
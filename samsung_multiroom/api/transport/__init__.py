@@ -0,0 +1,13 @@
+"""
+Init.
+"""
+from .asyncio_transport import AsyncioTransport
+from .fake_transport import AsyncFakeTransport
+from .fake_transport import FakeTransport
+from .http_client_transport import HttpClientTransport
+from .requests_transport import RequestsTransport
+from .transport import AsyncTransport
+from .transport import PipelineInterruptedException
+from .transport import StreamConnection
+from .transport import Transport
+from .transport import TransportException
@@ -0,0 +1,216 @@
+"""Transport using asyncio streams."""
+import asyncio
+
+from .transport import AsyncTransport
+from .transport import TransportException
+
+try:
+    from http_parser.parser import HttpParser
+except ImportError:
+    from http_parser.pyparser import HttpParser
+
+
+class AsyncioTransport(AsyncTransport):
+    """
+    Minimal HTTP/1.1 client on asyncio streams.
+
+    Idle connections are kept open and reused by subsequent requests to the same speaker.
+    """
+
+    def __init__(self, pool_size=2):
+        """
+        :param pool_size: Maximum number of idle keep-alive connections kept open per speaker
+        """
+        self._pool_size = pool_size
+        self._idle = {}
+
+    async def request(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request.
+
+        See Transport.request().
+        """
+        try:
+            return await asyncio.wait_for(self._request(ip_address, port, path, headers), timeout)
+        except (OSError, asyncio.TimeoutError) as request_exception:
+            raise TransportException('Request http://{0}:{1}{2} failed'.format(ip_address, port,
+                                                                               path)) from request_exception
+
+    async def stream(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request and keep reading responses sent back on the same connection.
+
+        See AsyncTransport.stream().
+        """
+        try:
+            connection = await asyncio.wait_for(self._connect(ip_address, port), timeout)
+        except (OSError, asyncio.TimeoutError) as stream_exception:
+            raise TransportException('Failed to open stream {0}'.format(path)) from stream_exception
+
+        try:
+            await connection.send(path, headers)
+
+            while True:
+                _, body = await asyncio.wait_for(connection.read_response(), timeout)
+                yield body.decode()
+        except (OSError, asyncio.TimeoutError) as stream_exception:
+            raise TransportException('Failed to receive from stream') from stream_exception
+        finally:
+            connection.close()
+
+    async def close(self):
+        """
+        Close all idle connections.
+        """
+        for connections in self._idle.values():
+            while connections:
+                connections.pop().close()
+
+    async def _request(self, ip_address, port, path, headers):
+        connection = self._pop_idle(ip_address, port)
+        reused = connection is not None
+
+        if connection is None:
+            connection = await self._connect(ip_address, port)
+
+        try:
+            try:
+                keep_alive, body = await connection.exchange(path, headers)
+            except OSError:
+                # speaker might have closed idle connection in the meantime, give it one more go on a fresh one
+                connection.close()
+                if not reused:
+                    raise
+
+                connection = await self._connect(ip_address, port)
+                keep_alive, body = await connection.exchange(path, headers)
+        except BaseException:
+            connection.close()
+            raise
+
+        idle = self._idle.setdefault((ip_address, port), [])
+
+        if keep_alive and len(idle) < self._pool_size:
+            idle.append(connection)
+        else:
+            connection.close()
+
+        return body.decode()
+
+    def _pop_idle(self, ip_address, port):
+        idle = self._idle.get((ip_address, port), [])
+
+        while idle:
+            connection = idle.pop()
+            if connection.is_usable():
+                return connection
+
+            connection.close()
+
+        return None
+
+    async def _connect(self, ip_address, port):
+        reader, writer = await asyncio.open_connection(ip_address, port)
+
+        return _AsyncHttpConnection('{0}:{1}'.format(ip_address, port), reader, writer)
+
+
+class _AsyncHttpConnection:
+    """
+    Single HTTP connection to the speaker.
+    """
+
+    def __init__(self, host, reader, writer):
+        self._host = host
+        self._reader = reader
+        self._writer = writer
+        self._buffer = b''
+
+    def is_usable(self):
+        """
+        :returns: True if connection can be used to send another request
+        """
+        return not self._reader.at_eof() and not self._writer.is_closing()
+
+    async def exchange(self, path, headers):
+        """
+        Send request and read its response.
+
+        :returns: Tuple (keep_alive, body bytes)
+        """
+        await self.send(path, headers)
+
+        return await self.read_response()
+
+    async def send(self, path, headers):
+        """
+        Send GET request.
+        """
+        lines = ['GET {0} HTTP/1.1'.format(path), 'Host: {0}'.format(self._host)]
+        lines += ['{0}: {1}'.format(header, value) for header, value in headers.items()]
+
+        self._writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+        await self._writer.drain()
+
+    async def read_response(self):
+        """
+        Read single response from the connection.
+
+        :returns: Tuple (keep_alive, body bytes)
+        :raises: ConnectionError
+        """
+        parser = HttpParser()
+        body = []
+
+        # parser would carry on into the next pipelined response, so feed it exactly one message at a time
+        headers_length = await self._read_headers_length()
+        self._feed(parser, body, headers_length)
+
+        content_length = int(parser.get_headers().get('Content-Length', 0))
+        if content_length:
+            await self._fill_buffer(content_length)
+            self._feed(parser, body, content_length)
+
+        # no content length, body is chunked or delimited by closing the connection
+        while not parser.is_message_complete():
+            if not self._buffer:
+                self._buffer = await self._reader.read(4096)
+
+            # feeding empty buffer tells parser the connection was closed
+            if not self._feed(parser, body, len(self._buffer)) and not parser.is_message_complete():
+                raise ConnectionError('Connection closed by the speaker')
+
+        return (parser.should_keep_alive(), b''.join(body))
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        self._writer.close()
+
+    async def _read_headers_length(self):
+        while True:
+            ends = [(self._buffer.find(separator), len(separator)) for separator in (b'\r\n\r\n', b'\n\n')]
+            ends = [position + length for position, length in ends if position >= 0]
+
+            if ends:
+                return min(ends)
+
+            await self._fill_buffer(len(self._buffer) + 1)
+
+    async def _fill_buffer(self, length):
+        while len(self._buffer) < length:
+            data = await self._reader.read(4096)
+            if not data:
+                raise ConnectionError('Connection closed by the speaker')
+
+            self._buffer += data
+
+    def _feed(self, parser, body, length):
+        parsed_length = parser.execute(self._buffer[:length], length)
+        self._buffer = self._buffer[parsed_length:]
+
+        if parser.is_partial_body():
+            body.append(parser.recv_body())
+
+        return parsed_length
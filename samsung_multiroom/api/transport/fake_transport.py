@@ -0,0 +1,225 @@
+"""In-process transport emulating the speaker."""
+import asyncio
+import queue
+import threading
+import urllib.parse
+
+from ..api_payload import parse_action
+from .transport import AsyncTransport
+from .transport import StreamConnection
+from .transport import Transport
+from .transport import TransportException
+
+# time in seconds between checks for pushed messages by async streams
+_POLL_INTERVAL = 0.01
+
+
+class FakeTransport(Transport):
+    """
+    In-process transport answering requests without touching the network.
+
+    Responses are looked up by action name, or produced by a handler callable, so the whole stack can run against an
+    emulated speaker.
+
+    Example:
+        transport = FakeTransport()
+        transport.add_response('GetVolume', '<?xml version="1.0" encoding="UTF-8"?><UIC>...</UIC>')
+
+        api = SamsungMultiroomApi('unique-id', '192.168.1.129', transport=transport)
+        api.get_volume()
+    """
+
+    def __init__(self, handler=None, chunk_size=None, pipelining=True):
+        """
+        :param handler: (optional) Callable accepting command, action and payload, returning response text or None
+            to fall back to registered responses
+        :param chunk_size: (optional) Number of characters in chunks returned by request_chunks(), by default whole
+            response is a single chunk
+        :param pipelining: False to emulate speaker answering only the first of pipelined requests
+        """
+        self._handler = handler
+        self._chunk_size = chunk_size
+        self._pipelining = pipelining
+        self._responses = {}
+        self._requests = []
+        self._lock = threading.Lock()
+        self._messages = queue.Queue()
+
+    @property
+    def requests(self):
+        """
+        :returns: List of tuples (ip_address, port, command, payload) of requests received so far
+        """
+        with self._lock:
+            return list(self._requests)
+
+    def add_response(self, action, response_text):
+        """
+        Register response text returned for an action.
+
+        :param action: Action name e.g. GetVolume
+        :param response_text: Response body text
+        """
+        self._responses[action] = response_text
+
+    def push(self, response_text):
+        """
+        Queue message for open streams, as if speaker emitted it.
+
+        :param response_text: Response body text
+        """
+        self._messages.put(response_text)
+
+    def request(self, ip_address, port, path, headers, timeout):
+        """
+        Answer GET request.
+
+        See Transport.request().
+        """
+        command, payload = parse_path(path)
+        action = parse_action(payload)
+
+        with self._lock:
+            self._requests.append((ip_address, port, command, payload))
+
+        response_text = None
+        if self._handler is not None:
+            response_text = self._handler(command, action, payload)
+
+        if response_text is None:
+            response_text = self._responses.get(action)
+
+        if response_text is None:
+            raise TransportException('Request http://{0}:{1}{2} failed'.format(ip_address, port, path))
+
+        return response_text
+
+    def request_chunks(self, ip_address, port, path, headers, timeout):
+        """
+        Answer GET request in chunks.
+
+        See Transport.request_chunks().
+        """
+        response_text = self.request(ip_address, port, path, headers, timeout)
+
+        if self._chunk_size is None:
+            return [response_text]
+
+        return (response_text[i:i + self._chunk_size] for i in range(0, len(response_text), self._chunk_size))
+
+    def request_pipelined(self, ip_address, port, paths, headers, timeout):
+        """
+        Answer pipelined GET requests in order.
+
+        See Transport.request_pipelined().
+        """
+        if not self._pipelining:
+            paths = paths[:1]
+
+        return [self.request(ip_address, port, path, headers, timeout) for path in paths]
+
+    def open_stream(self, ip_address, port, path, headers, timeout):
+        """
+        Open stream receiving response to the request followed by pushed messages.
+
+        See Transport.open_stream().
+        """
+        response_text = self.request(ip_address, port, path, headers, timeout)
+
+        return _FakeStreamConnection(self._messages, [response_text], timeout)
+
+
+class AsyncFakeTransport(AsyncTransport):
+    """
+    Asyncio counterpart of FakeTransport.
+    """
+
+    def __init__(self, transport=None):
+        """
+        :param transport: (optional) FakeTransport instance holding responses
+        """
+        self._transport = transport or FakeTransport()
+
+    @property
+    def transport(self):
+        """
+        :returns: FakeTransport instance holding responses
+        """
+        return self._transport
+
+    async def request(self, ip_address, port, path, headers, timeout):
+        """
+        Answer GET request.
+
+        See Transport.request().
+        """
+        return self._transport.request(ip_address, port, path, headers, timeout)
+
+    async def stream(self, ip_address, port, path, headers, timeout):
+        """
+        Open stream receiving response to the request followed by pushed messages.
+
+        See AsyncTransport.stream().
+        """
+        # messages are pushed from any thread, poll for them instead of blocking the event loop
+        connection = self._transport.open_stream(ip_address, port, path, headers, 0)
+        loop = asyncio.get_running_loop()
+
+        try:
+            waiting_since = loop.time()
+
+            while True:
+                try:
+                    responses = connection.receive()
+                except TransportException:
+                    if timeout is not None and loop.time() - waiting_since >= timeout:
+                        raise
+
+                    await asyncio.sleep(_POLL_INTERVAL)
+                    continue
+
+                for response_text in responses:
+                    yield response_text
+
+                waiting_since = loop.time()
+        finally:
+            connection.close()
+
+
+class _FakeStreamConnection(StreamConnection):
+
+    def __init__(self, messages, pending, timeout):
+        self._messages = messages
+        self._pending = pending
+        self._timeout = timeout
+
+    def receive(self):
+        responses = self._pending
+        self._pending = []
+
+        if not responses:
+            try:
+                responses.append(self._messages.get(timeout=self._timeout))
+            except queue.Empty as empty_exception:
+                raise TransportException('Failed to receive from stream') from empty_exception
+
+        return responses
+
+    def close(self):
+        pass
+
+
+def parse_path(path):
+    """
+    Extract command and payload from request path.
+
+    :param path: Path with quoted query string e.g. /UIC?cmd=%3Cname%3EGetVolume%3C/name%3E
+    :returns: Tuple (command, payload)
+    """
+    url = urllib.parse.urlsplit(path)
+    query = url.query
+
+    if not query.startswith('cmd='):
+        return (url.path.strip('/'), '')
+
+    return (url.path.strip('/'), urllib.parse.unquote(query[len('cmd='):]))
@@ -0,0 +1,82 @@
+"""Transport using standard library http.client."""
+import http.client
+import threading
+
+from .transport import Transport
+from .transport import TransportException
+
+
+class HttpClientTransport(Transport):
+    """
+    Transport using standard library http.client.
+
+    Keeps one keep-alive connection per speaker and thread, with no pooling overhead on top.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def request(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request.
+
+        See Transport.request().
+        """
+        connection, reused = self._get_connection(ip_address, port, timeout)
+
+        try:
+            return self._request(connection, path, headers)
+        except (OSError, http.client.HTTPException) as request_exception:
+            connection.close()
+
+            # speaker might have closed idle connection in the meantime, give it one more go
+            if reused and isinstance(request_exception, (ConnectionError, http.client.BadStatusLine)):
+                try:
+                    return self._request(connection, path, headers)
+                except (OSError, http.client.HTTPException) as retry_exception:
+                    connection.close()
+                    request_exception = retry_exception
+
+            raise TransportException('Request http://{0}:{1}{2} failed'.format(ip_address, port,
+                                                                               path)) from request_exception
+
+    def close(self):
+        """
+        Close all connections opened by this transport.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+
+    def _request(self, connection, path, headers):
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+
+        if response.will_close:
+            connection.close()
+
+        return body.decode(response.headers.get_content_charset() or 'utf-8', 'replace')
+
+    def _get_connection(self, ip_address, port, timeout):
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        connection = connections.get((ip_address, port))
+        reused = connection is not None and connection.sock is not None
+
+        if connection is None:
+            connection = http.client.HTTPConnection(ip_address, port)
+            connections[(ip_address, port)] = connection
+
+            with self._lock:
+                self._connections.append(connection)
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        return (connection, reused)
@@ -0,0 +1,76 @@
+"""Transport using requests library."""
+import requests
+
+from .transport import Transport
+from .transport import TransportException
+
+CHUNK_SIZE = 4096
+
+
+class RequestsTransport(Transport):
+    """
+    Transport using requests library.
+
+    Without a session every request opens a new connection. Pass ApiSession to reuse pooled connections.
+    """
+
+    def __init__(self, session=None):
+        """
+        :param session: (optional) ApiSession or requests.Session instance
+        """
+        self._session = session
+
+    @property
+    def session(self):
+        """
+        :returns: Session used to make requests or None
+        """
+        return self._session
+
+    def request(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request.
+
+        See Transport.request().
+        """
+        url = 'http://{0}:{1}{2}'.format(ip_address, port, path)
+        http = self._session or requests
+
+        try:
+            response = http.get(url, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as request_exception:
+            raise TransportException('Request {0} failed'.format(url)) from request_exception
+
+        return response.text
+
+    def request_chunks(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request and return response body in chunks, as they are received.
+
+        See Transport.request_chunks().
+        """
+        url = 'http://{0}:{1}{2}'.format(ip_address, port, path)
+        http = self._session or requests
+
+        try:
+            response = http.get(url, headers=headers, timeout=timeout, stream=True)
+        except requests.exceptions.RequestException as request_exception:
+            raise TransportException('Request {0} failed'.format(url)) from request_exception
+
+        return _iter_content(url, response)
+
+    def close(self):
+        """
+        Close pooled connections.
+        """
+        if self._session is not None:
+            self._session.close()
+
+
+def _iter_content(url, response):
+    try:
+        yield from response.iter_content(CHUNK_SIZE)
+    except requests.exceptions.RequestException as request_exception:
+        raise TransportException('Request {0} failed'.format(url)) from request_exception
+    finally:
+        response.close()
@@ -0,0 +1,329 @@
+"""HTTP transport interface used by the api."""
+import abc
+import http.client
+import logging
+import socket
+
+try:
+    from http_parser.parser import HttpParser
+except ImportError:
+    from http_parser.pyparser import HttpParser
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TransportException(Exception):
+    """Transport failed to deliver request or receive response."""
+
+
+class PipelineInterruptedException(TransportException):
+    """Pipelined connection failed before all requests were answered, unanswered ones might have been executed."""
+
+    def __init__(self, message, responses):
+        """
+        :param message: Error message
+        :param responses: List of response body texts of the leading requests answered before the failure
+        """
+        super().__init__(message)
+        self.responses = responses
+
+
+class Transport(metaclass=abc.ABCMeta):
+    """
+    Blocking transport carrying api requests to the speaker.
+
+    Implementations only need to provide request(). Streams and pipelined requests default to a raw socket connection,
+    as the speaker sends multiple HTTP responses back on a single connection.
+    """
+
+    @abc.abstractmethod
+    def request(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request.
+
+        :param ip_address: IP address of the speaker
+        :param port: Port to use
+        :param path: Path with quoted query string e.g. /UIC?cmd=%3Cname%3EGetVolume%3C/name%3E
+        :param headers: Dict of headers to send
+        :param timeout: Timeout in seconds
+        :returns: Response body text
+        :raises: TransportException
+        """
+        raise NotImplementedError()
+
+    def request_chunks(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request and return response body in chunks, as they are received.
+
+        Transports that cannot read the body incrementally return it as a single chunk.
+
+        :param ip_address: IP address of the speaker
+        :param port: Port to use
+        :param path: Path with quoted query string e.g. /UIC?cmd=%3Cname%3EGetDmsList%3C/name%3E
+        :param headers: Dict of headers to send
+        :param timeout: Timeout in seconds
+        :returns: Iterable of response body chunks, text or bytes
+        :raises: TransportException, possibly while iterating
+        """
+        return [self.request(ip_address, port, path, headers, timeout)]
+
+    def open_stream(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request and keep the connection open for subsequent responses.
+
+        :param ip_address: IP address of the speaker
+        :param port: Port to use
+        :param path: Path with quoted query string e.g. /UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E
+        :param headers: Dict of headers to send
+        :param timeout: Timeout in seconds, None to wait indefinitely
+        :returns: StreamConnection instance
+        :raises: TransportException
+        """
+        return SocketStreamConnection(ip_address, port, path, headers, timeout)
+
+    def request_pipelined(self, ip_address, port, paths, headers, timeout):
+        """
+        Make GET requests written back-to-back on a single connection, without waiting for responses in between.
+
+        Speaker answers requests in the order they were written. One that does not support pipelining usually answers
+        the first request only and closes the connection, so fewer responses than requests might be returned. Requests
+        left unanswered that way were not executed and are to be sent again.
+
+        :param ip_address: IP address of the speaker
+        :param port: Port to use
+        :param paths: List of paths with quoted query strings e.g. /UIC?cmd=%3Cname%3EGetVolume%3C/name%3E
+        :param headers: Dict of headers to send
+        :param timeout: Timeout in seconds
+        :returns: List of response body texts of the leading requests that were answered before speaker closed the
+            connection, possibly empty
+        :raises: TransportException if requests could not be sent, PipelineInterruptedException if connection failed
+            or timed out before all requests were answered
+        """
+        return _request_pipelined(ip_address, port, paths, headers, timeout)
+
+    def close(self):
+        """
+        Release any connections held by the transport.
+        """
+
+
+class AsyncTransport(metaclass=abc.ABCMeta):
+    """
+    Asyncio transport carrying api requests to the speaker.
+    """
+
+    @abc.abstractmethod
+    async def request(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request.
+
+        See Transport.request().
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def stream(self, ip_address, port, path, headers, timeout):
+        """
+        Make GET request and keep reading responses sent back on the same connection.
+
+        :returns: Async iterable of response body texts
+        :raises: TransportException
+        """
+        raise NotImplementedError()
+
+    async def close(self):
+        """
+        Release any connections held by the transport.
+        """
+
+
+class StreamConnection(metaclass=abc.ABCMeta):
+    """
+    Open connection receiving speaker's responses.
+    """
+
+    @abc.abstractmethod
+    def receive(self):
+        """
+        Wait for data and return complete responses received so far.
+
+        :returns: List of response body texts, possibly empty
+        :raises: TransportException
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def close(self):
+        """
+        Close the connection.
+        """
+        raise NotImplementedError()
+
+
+class SocketStreamConnection(StreamConnection):
+    """
+    Stream connection on a raw socket.
+    """
+
+    def __init__(self, ip_address, port, path, headers, timeout):
+        """
+        Connect and send the request.
+
+        See Transport.open_stream().
+        """
+        self._parser = HttpParser()
+        self._body = []
+
+        try:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.connect((ip_address, port))
+            self._sock.settimeout(timeout)
+            self._sock.send('GET {0} HTTP/1.1\r\n'.format(path).encode())
+            self._sock.send('Host: {0}:{1}\r\n'.format(ip_address, port).encode())
+            for header, value in headers.items():
+                self._sock.send('{0}: {1}\r\n'.format(header, value).encode())
+            self._sock.send('\r\n\r\n'.encode())
+        except socket.error as socket_exception:
+            self.close()
+            raise TransportException('Failed to open stream {0}'.format(path)) from socket_exception
+
+    def receive(self):
+        """
+        Wait for data and return complete responses received so far.
+
+        :returns: List of response body texts, possibly empty
+        :raises: TransportException
+        """
+        try:
+            data = self._sock.recv(1024)
+        except socket.error as socket_exception:
+            raise TransportException('Failed to receive from stream') from socket_exception
+
+        if not data:
+            raise TransportException('Stream closed by the speaker')
+
+        responses = []
+
+        while data:
+            _LOGGER.debug('Received data: %s', data.decode())
+            received_length = len(data)
+            parsed_length = self._parser.execute(data, received_length)
+
+            if self._parser.is_partial_body():
+                self._body.append(self._parser.recv_body().decode())
+
+            if self._parser.is_message_complete():
+                responses.append(''.join(self._body))
+                self._parser = HttpParser()
+                self._body = []
+            elif not parsed_length:
+                raise TransportException('Invalid response received from stream')
+
+            data = data[parsed_length:]
+
+        return responses
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        sock = getattr(self, '_sock', None)
+        if sock is None:
+            return
+
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+
+        sock.close()
+
+
+def _request_pipelined(ip_address, port, paths, headers, timeout):
+    request = ''.join(_format_request(ip_address, port, path, headers) for path in paths)
+
+    try:
+        sock = socket.create_connection((ip_address, port), timeout)
+    except socket.error as socket_exception:
+        raise TransportException('Failed to send pipelined requests to {0}:{1}'.format(
+            ip_address, port)) from socket_exception
+
+    responses = []
+
+    try:
+        # requests might be executed even if sending the rest of them fails
+        sock.sendall(request.encode())
+        _read_responses(sock, len(paths), responses)
+    except (OSError, http.client.HTTPException) as exception:
+        raise PipelineInterruptedException('Pipelined connection to {0}:{1} failed after {2} of {3} responses'.format(
+            ip_address, port, len(responses), len(paths)), responses) from exception
+    finally:
+        sock.close()
+
+    if len(responses) < len(paths):
+        _LOGGER.debug('Speaker %s:%d answered %d of %d pipelined requests', ip_address, port, len(responses),
+                      len(paths))
+
+    return responses
+
+
+def _read_responses(sock, count, responses):
+    pipelined_socket = _PipelinedSocket(sock)
+
+    try:
+        while len(responses) < count:
+            response = http.client.HTTPResponse(pipelined_socket)
+
+            try:
+                response.begin()
+            except http.client.RemoteDisconnected:
+                # closed between responses, speaker left the rest of requests unanswered
+                return
+
+            body = response.read()
+            responses.append(body.decode(response.headers.get_content_charset() or 'utf-8', 'replace'))
+
+            if response.will_close:
+                return
+    finally:
+        pipelined_socket.close()
+
+
+def _format_request(ip_address, port, path, headers):
+    lines = ['GET {0} HTTP/1.1'.format(path), 'Host: {0}:{1}'.format(ip_address, port)]
+    lines.extend('{0}: {1}'.format(header, value) for header, value in headers.items())
+
+    return '\r\n'.join(lines) + '\r\n\r\n'
+
+
+class _PipelinedSocket:
+    """
+    Socket handing the same buffered file to every response read from it.
+
+    http.client reads ahead, bytes past the end of one response belong to the next one and must not be lost.
+    """
+
+    def __init__(self, sock):
+        self._file = sock.makefile('rb')
+
+    def makefile(self, *_):
+        """Get the shared buffered file, kept open when a response closes it."""
+        return _KeptOpenFile(self._file)
+
+    def close(self):
+        """Close the shared buffered file."""
+        self._file.close()
+
+
+class _KeptOpenFile:
+
+    def __init__(self, file):
+        self._file = file
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def close(self):
+        """
+        Leave the file open for the following responses.
+        """
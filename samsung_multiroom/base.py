@@ -19,6 +19,14 @@ class SpeakerBase(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    def is_available(self):
+        """
+        Check if speaker is responding.
+
+        :returns: False if speaker recently stopped responding and calls would fail straight away
+        """
+        raise NotImplementedError()
+
     def get_name(self):
         """
         Retrieve speaker's name.
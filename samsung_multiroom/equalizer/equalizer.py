@@ -3,6 +3,8 @@ Control speaker's sound adjustments.
 """
 import abc
 
+from ..api import traced
+
 
 class EqualizerBase(metaclass=abc.ABCMeta):
     """
@@ -56,6 +58,7 @@ class Equalizer(EqualizerBase):
     def __init__(self, api):
         self._api = api
 
+    @traced
     def get_presets_names(self):
         """
         :returns: List of preset names
@@ -64,6 +67,7 @@ class Equalizer(EqualizerBase):
 
         return [p['presetname'] for p in presets]
 
+    @traced
     def set(self, *args):
         """
         Set equalizer values by preset name or list of band values
@@ -88,6 +92,7 @@ class Equalizer(EqualizerBase):
             preset_index = self._get_current_preset()['id']
             self._api.set_7band_eq_value(preset_index, args[0])
 
+    @traced
     def save(self, name=None):
         """
         Create a new or overwrite existing preset.
@@ -114,6 +119,7 @@ class Equalizer(EqualizerBase):
 
                 self._api.add_custom_eq_mode(max(presets_ids) + 1, name)
 
+    @traced
     def delete(self, name):
         """
         Delete preset.
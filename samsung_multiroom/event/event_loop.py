@@ -15,6 +15,7 @@ class EventLoop:
         """
         self._api_stream = api_stream
         self._listeners = []
+        self._response_listeners = []
         self._factories = _get_default_factories()
 
     def register_factory(self, factory):
@@ -38,14 +39,34 @@ class EventLoop:
 
         self._listeners.append((event_name, listener))
 
+    def add_response_listener(self, listener):
+        """
+        Subscribe to raw responses pushed by the speaker, including those with no matching event.
+
+        :param listener: Callable. Will be called with every ApiResponse received, and with None once stream is closed
+        """
+        if not callable(listener):
+            raise ValueError('listener must be a callable')
+
+        self._response_listeners.append(listener)
+
     async def loop(self):
         """
         Start emitting speaker events.
         """
-        for response in self._api_stream.open('/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E'):
-            event = self._factory(response)
-            if event:
-                self._dispatch_event(event)
+        try:
+            for response in self._api_stream.open('/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E'):
+                self._dispatch_response(response)
+
+                event = self._factory(response)
+                if event:
+                    self._dispatch_event(event)
+        finally:
+            self._dispatch_response(None)
+
+    def _dispatch_response(self, response):
+        for listener in self._response_listeners:
+            listener(response)
 
     def _dispatch_event(self, event):
         for event_name, listener in self._listeners:
@@ -56,10 +77,18 @@ class EventLoop:
         """
         Factory event from response.
 
+        Responses whose body turns out to be malformed once a factory reads their data produce no event.
+
         :param response: ApiResponse instance
         """
         for factory in reversed(self._factories):
-            event = factory(response)
+            try:
+                event = factory(response)
+            except Exception:  # pylint: disable=broad-except
+                if response.data is not None:
+                    raise
+
+                return None
 
             if event:
                 return event
@@ -1,6 +1,8 @@
 """Factory for Speaker."""
 import uuid
 
+from .api import ApiCache
+from .api import ApiSession
 from .api import ApiStream
 from .api import SamsungMultiroomApi
 from .clock import Alarm
@@ -23,8 +25,8 @@ def speaker_factory(ip_address, port=55001):
     :param ip_address: IP address of the speaker.
     """
     user = str(uuid.uuid1())
-    api = SamsungMultiroomApi(user, ip_address, port=port)
-    api_stream = ApiStream(user, ip_address)
+    api = SamsungMultiroomApi(user, ip_address, port=port, session=ApiSession(), cache=ApiCache())
+    api_stream = ApiStream(user, ip_address, api_stats=api.api_stats)
 
     timer = Timer(api)
     alarm = Alarm(api)
@@ -42,5 +44,7 @@ def speaker_factory(ip_address, port=55001):
     service_registry = ServiceRegistry(api)
 
     event_loop = EventLoop(api_stream)
+    event_loop.add_response_listener(api.cache.handle_response)
+    event_loop.add_response_listener(api.known_state.handle_response)
 
     return Speaker(api, event_loop, clock, equalizer, player_operator, service_registry)
@@ -37,6 +37,14 @@ class SpeakerGroup(SpeakerBase):
         """
         return self._speakers[0].mac_address
 
+    def is_available(self):
+        """
+        Check if main speaker is responding.
+
+        :returns: False if main speaker recently stopped responding and calls would fail straight away
+        """
+        return self._speakers[0].is_available()
+
     @property
     def speakers(self):
         """
@@ -81,7 +89,7 @@ class SpeakerGroup(SpeakerBase):
 
         self._speakers[0].set_volume(volume)
 
-        for speaker in self._speakers[1:]:
+        for speaker in self._get_available_speakers(self._speakers[1:]):
             speaker.set_volume(min(100, int(speaker.get_volume() * ratio)))
 
     def get_sources(self):
@@ -112,22 +120,24 @@ class SpeakerGroup(SpeakerBase):
         """
         Check if all speakers in this group are muted.
 
+        Unavailable speakers are skipped.
+
         :returns: True if muted, False otherwise
         """
-        for speaker in self._speakers:
+        for speaker in self._get_available_speakers(self._speakers):
             if not speaker.is_muted():
                 return False
 
         return True
 
     def mute(self):
-        """Mute all speakers in this group."""
-        for speaker in self._speakers:
+        """Mute all available speakers in this group."""
+        for speaker in self._get_available_speakers(self._speakers):
             speaker.mute()
 
     def unmute(self):
-        """Unmute all speakers in this group."""
-        for speaker in self._speakers:
+        """Unmute all available speakers in this group."""
+        for speaker in self._get_available_speakers(self._speakers):
             speaker.unmute()
 
     @property
@@ -162,7 +172,7 @@ class SpeakerGroup(SpeakerBase):
 
         :returns: Clock instance
         """
-        return ClockGroup([s.clock for s in self._speakers])
+        return ClockGroup([s.clock for s in self._get_available_speakers(self._speakers)])
 
     @property
     def equalizer(self):
@@ -171,7 +181,7 @@ class SpeakerGroup(SpeakerBase):
 
         :returns: Equalizer instance
         """
-        return EqualizerGroup([s.equalizer for s in self._speakers])
+        return EqualizerGroup([s.equalizer for s in self._get_available_speakers(self._speakers)])
 
     @property
     def player(self):
@@ -220,3 +230,6 @@ class SpeakerGroup(SpeakerBase):
         """
         for speaker in reversed(self._speakers):
             speaker.ungroup()
+
+    def _get_available_speakers(self, speakers):
+        return [speaker for speaker in speakers if speaker.is_available()]
@@ -1,5 +1,6 @@
 """Generic music streaming app service browser."""
 from ...api import paginator
+from ...api import traced
 from ..browser import Browser
 from ..browser import Item
 from ..browser import path_to_folders
@@ -20,6 +21,7 @@ class AppBrowser(Browser):
     def get_name(self):
         return self._name
 
+    @traced
     def browse(self, path=None):
         folders = path_to_folders(path)
 
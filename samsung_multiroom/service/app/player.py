@@ -63,7 +63,7 @@ class AppPlayer(Player):
 
     def previous(self):
         """Play previous track in the queue."""
-        playlist = self._api.get_cp_player_playlist()
+        playlist = list(self._api.get_cp_player_playlist(0, 30))
 
         for i, playlist_item in enumerate(playlist):
             if '@currentplaying' in playlist_item and playlist_item['@currentplaying'] == '1':
@@ -93,10 +93,10 @@ class AppPlayer(Player):
 
         :returns: Track instance, or None if unavailable
         """
-        playlist = self._api.get_cp_player_playlist()
+        playlist = list(self._api.get_cp_player_playlist(0, 30))
         try:
             playlist_item = [p for p in playlist if '@currentplaying' in p and p['@currentplaying'] == '1'][0]
-        except KeyError:
+        except IndexError:
             return None
 
         track_kwargs = init_track_kwargs('app_audio')
@@ -1,9 +1,15 @@
 """DLNA service browser."""
 from ...api import paginator
+from ...api import parse_duration
+from ...api import traced
 from ..browser import Browser
 from ..browser import Item
 from ..browser import path_to_folders
 
+# pages requested ahead of the one being consumed, only worth raising along with concurrency of the api scheduler,
+# as by default it sends one request at a time
+PREFETCH = 0
+
 
 class DlnaBrowser(Browser):
     """
@@ -18,6 +24,7 @@ class DlnaBrowser(Browser):
     def get_name(self):
         return 'dlna'
 
+    @traced
     def browse(self, path=None):
         folders = path_to_folders(path)
 
@@ -32,9 +39,10 @@ class DlnaBrowser(Browser):
             if device_udn is None:
                 data_list = paginator(self._api.get_dms_list, 0, 20)
             elif parent_id is None:
-                data_list = paginator(self._api.pc_get_music_list_by_category, device_udn, 0, 20)
+                data_list = paginator(self._api.pc_get_music_list_by_category, device_udn, 0, 20, prefetch=PREFETCH)
             else:
-                data_list = paginator(self._api.pc_get_music_list_by_id, device_udn, parent_id, 0, 20)
+                data_list = paginator(self._api.pc_get_music_list_by_id, device_udn, parent_id, 0, 20,
+                                      prefetch=PREFETCH)
 
             items = [self._factory_item(data) for data in data_list]
 
@@ -65,8 +73,7 @@ class DlnaBrowser(Browser):
         if 'album' in data:
             kwargs['metadata']['album'] = data['album']
         if 'timelength' in data and data['timelength']:
-            (hours, minutes, seconds) = data['timelength'].split(':')
-            kwargs['metadata']['duration'] = int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+            kwargs['metadata']['duration'] = parse_duration(data['timelength'])
         if 'thumbnail' in data:
             kwargs['metadata']['thumbnail_url'] = data['thumbnail']
         if 'thumbnail_JPG_LRG' in data:
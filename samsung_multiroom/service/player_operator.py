@@ -1,4 +1,5 @@
 """Select the right player for the current source."""
+from ..api import traced
 from .player import REPEAT_OFF
 from .player import Player
 from .player import get_is_supported_function_name
@@ -32,6 +33,7 @@ class PlayerOperator(Player):
 
         self._players.append(player)
 
+    @traced
     def get_player(self):
         """
         Get currently active player based on selected source.
@@ -49,6 +51,7 @@ class PlayerOperator(Player):
 
         return NullPlayer()
 
+    @traced
     def play(self, playlist):
         """
         Find a suitable player and play a playlist.
@@ -62,6 +65,7 @@ class PlayerOperator(Player):
 
         return False
 
+    @traced
     def jump(self, time):
         """
         Advance current playback to specific time.
@@ -70,26 +74,32 @@ class PlayerOperator(Player):
         """
         self.get_player().jump(time)
 
+    @traced
     def resume(self):
         """Play/resume current track."""
         self.get_player().resume()
 
+    @traced
     def stop(self):
         """Stop current track and reset position to the beginning."""
         self.get_player().stop()
 
+    @traced
     def pause(self):
         """Pause current track and retain position."""
         self.get_player().pause()
 
+    @traced
     def next(self):
         """Play next track in the queue."""
         self.get_player().next()
 
+    @traced
     def previous(self):
         """Play previous track in the queue."""
         self.get_player().previous()
 
+    @traced
     def repeat(self, mode):
         """
         Set playback repeat mode.
@@ -98,6 +108,7 @@ class PlayerOperator(Player):
         """
         self.get_player().repeat(mode)
 
+    @traced
     def shuffle(self, enabled):
         """
         Enable/disable playback shuffle mode.
@@ -106,6 +117,7 @@ class PlayerOperator(Player):
         """
         self.get_player().shuffle(enabled)
 
+    @traced
     def get_repeat(self):
         """
         Get playback repeat mode.
@@ -114,6 +126,7 @@ class PlayerOperator(Player):
         """
         return self.get_player().get_repeat()
 
+    @traced
     def get_shuffle(self):
         """
         Get playback shuffle mode.
@@ -122,6 +135,7 @@ class PlayerOperator(Player):
         """
         return self.get_player().get_shuffle()
 
+    @traced
     def get_current_track(self):
         """
         Get current track info.
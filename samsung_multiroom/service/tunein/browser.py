@@ -1,5 +1,6 @@
 """TuneIn service browser."""
 from ...api import paginator
+from ...api import traced
 from ..browser import Browser
 from ..browser import Item
 from ..browser import path_to_folders
@@ -18,6 +19,7 @@ class TuneInBrowser(Browser):
     def get_name(self):
         return 'tunein'
 
+    @traced
     def browse(self, path=None):
         folders = path_to_folders(path)
 
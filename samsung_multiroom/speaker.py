@@ -1,4 +1,5 @@
 """Entry control for speaker operation."""
+from .api import traced
 from .base import SpeakerBase
 from .group import SpeakerGroup
 
@@ -32,6 +33,7 @@ class Speaker(SpeakerBase):
         return self._api.ip_address
 
     @property
+    @traced
     def mac_address(self):
         """
         :returns: Speaker's mac address
@@ -39,6 +41,15 @@ class Speaker(SpeakerBase):
         main_info = self._api.get_main_info()
         return main_info['spkmacaddr']
 
+    def is_available(self):
+        """
+        Check if speaker is responding.
+
+        :returns: False if speaker recently stopped responding and calls would fail straight away
+        """
+        return self._api.is_available()
+
+    @traced
     def get_name(self):
         """
         Retrieve speaker's name.
@@ -47,6 +58,7 @@ class Speaker(SpeakerBase):
         """
         return self._api.get_speaker_name()
 
+    @traced
     def set_name(self, name):
         """
         Set speaker's name.
@@ -55,6 +67,7 @@ class Speaker(SpeakerBase):
         """
         self._api.set_speaker_name(name)
 
+    @traced
     def get_volume(self):
         """
         Get current speaker volume.
@@ -63,16 +76,18 @@ class Speaker(SpeakerBase):
         """
         return self._api.get_volume()
 
+    @traced
     def set_volume(self, volume):
         """
         Set speaker volume.
 
         :param volume: speaker volume, integer between 0 and 100
+        :returns: Future resolved once volume is applied if api coalesces writes, None otherwise
         """
         if not isinstance(volume, int) or int(volume) < 0 or int(volume) > 100:
             raise ValueError('Volume must be integer between 0 and 100')
 
-        self._api.set_volume(volume)
+        return self._api.set_volume(volume)
 
     def get_sources(self):
         """
@@ -82,6 +97,7 @@ class Speaker(SpeakerBase):
         """
         return ['aux', 'bt', 'hdmi', 'optical', 'soundshare', 'wifi']
 
+    @traced
     def get_source(self):
         """
         Get currently selected source.
@@ -91,6 +107,7 @@ class Speaker(SpeakerBase):
         function = self._api.get_func()
         return function['function']
 
+    @traced
     def set_source(self, source):
         """
         Set speaker source.
@@ -102,6 +119,7 @@ class Speaker(SpeakerBase):
 
         self._api.set_func(source)
 
+    @traced
     def is_muted(self):
         """
         Check if speaker is muted.
@@ -110,10 +128,12 @@ class Speaker(SpeakerBase):
         """
         return self._api.get_mute()
 
+    @traced
     def mute(self):
         """Mute the speaker."""
         self._api.set_mute(True)
 
+    @traced
     def unmute(self):
         """Unmute the speaker."""
         self._api.set_mute(False)
@@ -180,6 +200,7 @@ class Speaker(SpeakerBase):
         """
         return self._service_registry.service(name).browser
 
+    @traced
     def group(self, name, speakers):
         """
         Group this speaker with another ones.
@@ -209,6 +230,7 @@ class Speaker(SpeakerBase):
 
         return SpeakerGroup(self._api, name, speakers)
 
+    @traced
     def ungroup(self):
         """
         Remove this speaker from its current group.
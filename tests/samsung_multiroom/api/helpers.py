@@ -0,0 +1,30 @@
+"""
+Helpers shared by api tests.
+"""
+
+
+class FakeClock:
+    """
+    Clock returning time set by the test, and sleeping by moving it forward.
+    """
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def uic_response(method, response, result='ok'):
+    """
+    :param method: Response name e.g. VolumeLevel
+    :param response: XML of response data e.g. <volume>10</volume>
+    :param result: Response result, ok or ng
+    :returns: Response body text of the UIC command
+    """
+    return ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>{0}</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="{1}">{2}</response></UIC>').format(method, result, response)
@@ -1,4 +1,6 @@
 import re
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
 
@@ -9,9 +11,11 @@ import xmltodict
 from samsung_multiroom.api import COMMAND_CPM
 from samsung_multiroom.api import COMMAND_UIC
 from samsung_multiroom.api import METHOD_GET
+from samsung_multiroom.api import CommandScheduler
 from samsung_multiroom.api import SamsungMultiroomApi
 from samsung_multiroom.api import SamsungMultiroomApiException
 from samsung_multiroom.api import paginator
+from samsung_multiroom.api.transport import FakeTransport
 
 
 def _get_api():
@@ -86,6 +90,32 @@ class TestApi(unittest.TestCase):
             'spkname': 'Living Room'
         })
 
+    def test_request_uses_session(self):
+        session = MagicMock()
+        session.get.return_value.text = """<?xml version="1.0" encoding="UTF-8"?>
+            <UIC>
+                <method>SpkName</method>
+                <version>1.0</version>
+                <speakerip>192.168.1.129</speakerip>
+                <user_identifier></user_identifier>
+                <response result="ok">
+                    <spkname><![CDATA[Living Room]]></spkname>
+                </response>
+            </UIC>"""
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', 55001, session=session)
+        response = api.request(METHOD_GET, COMMAND_UIC, '<name>GetSpkName</name>')
+
+        session.get.assert_called_once_with(
+            'http://192.168.1.129:55001/UIC?cmd=%3Cname%3EGetSpkName%3C/name%3E',
+            headers={
+                'mobileUUID': 'public',
+                'mobileName': 'Wireless Audio',
+                'mobileVersion': '1.0',
+            },
+            timeout=5)
+        self.assertEqual(response, {'spkname': 'Living Room'})
+
     @httpretty.activate(allow_net_connect=False)
     def test_get_speaker_name(self):
         httpretty.register_uri(
@@ -2347,3 +2377,136 @@ Last-Modified: Fri, 02 Jan 1970 10:53:13 GMT
 
         api = _get_api()
         api.set_repeat_mode('one')
+
+
+def _list_response(start_index, count):
+    return ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>PCMusicList</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><listcount>{0}</listcount><musiclist>{1}</musiclist></response></UIC>').format(
+                count, ''.join('<music><playindex>{0}</playindex></music>'.format(i)
+                               for i in range(start_index, start_index + count)))
+
+
+class TestPaginator(unittest.TestCase):
+
+    def test_paginator(self):
+        calls = []
+
+        def api_call(parent_id, start_index, list_count):
+            calls.append((parent_id, start_index, list_count))
+            return list(range(start_index, min(start_index + list_count, 7)))
+
+        items = list(paginator(api_call, '22', 0, 3))
+
+        self.assertEqual(items, list(range(7)))
+        self.assertEqual(calls, [('22', 0, 3), ('22', 3, 3), ('22', 6, 3)])
+
+    def test_paginator_secondary(self):
+        calls = []
+
+        def primary(content_id, start_index, list_count):
+            calls.append(('primary', start_index))
+            return list(range(start_index, start_index + list_count))
+
+        def secondary(start_index, list_count):
+            calls.append(('secondary', start_index))
+            return list(range(start_index, min(start_index + list_count, 5)))
+
+        for prefetch in [0, 3]:
+            with self.subTest(prefetch=prefetch):
+                calls.clear()
+
+                items = list(paginator(primary, secondary, 8, 0, 2, prefetch=prefetch))
+
+                self.assertEqual(items, list(range(5)))
+                self.assertEqual(calls[0], ('primary', 0))
+                self.assertEqual(sorted(calls[1:])[:2], [('secondary', 2), ('secondary', 4)])
+                self.assertNotIn('primary', [name for name, _ in calls[1:]])
+
+    def test_paginator_prefetch_preserves_order(self):
+        def api_call(start_index, list_count):
+            # later pages arrive first
+            time.sleep(0.01 / (start_index + 1))
+            return list(range(start_index, min(start_index + list_count, 17)))
+
+        items = list(paginator(api_call, 0, 2, prefetch=4))
+
+        self.assertEqual(items, list(range(17)))
+
+    def test_paginator_prefetch_stops_at_short_page(self):
+        def api_call(start_index, list_count):
+            # speaker keeps returning full pages past the short one
+            if start_index == 4:
+                return [start_index]
+            return list(range(start_index, start_index + list_count))
+
+        items = list(paginator(api_call, 0, 2, prefetch=3))
+
+        self.assertEqual(items, [0, 1, 2, 3, 4])
+
+    def test_paginator_prefetch_keeps_pages_in_flight(self):
+        started = []
+        release = threading.Event()
+
+        def api_call(start_index, list_count):
+            started.append(start_index)
+            if start_index:
+                release.wait(1)
+            return list(range(start_index, start_index + list_count))
+
+        items = paginator(api_call, 0, 2, prefetch=3)
+
+        self.assertEqual([next(items), next(items)], [0, 1])
+
+        next_item = threading.Thread(target=lambda: next(items))
+        next_item.start()
+
+        deadline = time.monotonic() + 1
+        while len(started) < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertEqual(sorted(started), [0, 2, 4, 6])
+
+        release.set()
+        next_item.join()
+        items.close()
+
+    def test_paginator_prefetch_respects_scheduler_concurrency(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def handler(command, action, payload):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+
+            start_index = int(re.search(r'name="liststartindex" val="(\d+)"', payload).group(1))
+            list_count = int(re.search(r'name="listcount" val="(\d+)"', payload).group(1))
+
+            return _list_response(start_index, max(0, min(list_count, 9 - start_index)))
+
+        transport = FakeTransport(handler)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport,
+                                  scheduler=CommandScheduler(concurrency=1))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 2, prefetch=4))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(9)])
+        self.assertEqual(running[1], 1)
+
+    def test_paginator_prefetch_raises_exception(self):
+        def api_call(start_index, list_count):
+            if start_index == 4:
+                raise SamsungMultiroomApiException()
+            return list(range(start_index, start_index + list_count))
+
+        items = paginator(api_call, 0, 2, prefetch=2)
+
+        self.assertEqual([next(items) for _ in range(4)], [0, 1, 2, 3])
+        self.assertRaises(SamsungMultiroomApiException, next, items)
+
+    def test_paginator_invalid_prefetch_raises_exception(self):
+        self.assertRaises(ValueError, list, paginator(lambda start_index, list_count: [], 0, 2, prefetch=-1))
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from samsung_multiroom.api import AsyncSamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api import async_paginator
+from samsung_multiroom.api.transport import AsyncFakeTransport
+from samsung_multiroom.api.transport import FakeTransport
+
+from .helpers import uic_response
+
+
+def _get_api():
+    return AsyncSamsungMultiroomApi('public', '192.168.1.129', 55001)
+
+
+def _http_response(body, connection='keep-alive'):
+    body = body.encode()
+    headers = 'HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: {0}\r\nConnection: {1}\r\n\r\n'.format(
+        len(body), connection)
+
+    return headers.encode() + body
+
+
+def _fake_connection(*chunks, eof=False):
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+
+    writer = MagicMock()
+    writer.is_closing.return_value = False
+
+    async def drain():
+        pass
+
+    writer.drain.side_effect = drain
+
+    return (reader, writer)
+
+
+class TestAsyncApi():  # pytest-asyncio doesn't play well with unittest.TestCase
+
+    @pytest.mark.asyncio
+    async def test_invalid_method_raises_exception(self):
+        api = _get_api()
+
+        with pytest.raises(ValueError):
+            await api.request('post', 'UIC', '<name>GetSpkName</name>')
+
+    @pytest.mark.asyncio
+    async def test_get_volume(self):
+        reader, writer = _fake_connection(_http_response(uic_response('VolumeLevel', '<volume>10</volume>')))
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            api = _get_api()
+            volume = await api.get_volume()
+
+        open_connection.assert_called_once_with('192.168.1.129', 55001)
+        writer.write.assert_called_once_with(
+            b'GET /UIC?cmd=%3Cname%3EGetVolume%3C/name%3E HTTP/1.1\r\n'
+            b'Host: 192.168.1.129:55001\r\n'
+            b'mobileUUID: public\r\n'
+            b'mobileName: Wireless Audio\r\n'
+            b'mobileVersion: 1.0\r\n\r\n')
+        assert volume == 10
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection_is_reused(self):
+        reader, writer = _fake_connection(
+            _http_response(uic_response('VolumeLevel', '<volume>10</volume>')),
+            _http_response(uic_response('MuteStatus', '<mute>on</mute>')),
+        )
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            api = _get_api()
+            volume = await api.get_volume()
+            muted = await api.get_mute()
+
+        open_connection.assert_called_once()
+        assert volume == 10
+        assert muted
+
+    @pytest.mark.asyncio
+    async def test_connection_error_raises_exception(self):
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.side_effect = ConnectionRefusedError()
+
+            api = _get_api()
+
+            with pytest.raises(SamsungMultiroomApiException):
+                await api.get_volume()
+
+    @pytest.mark.asyncio
+    async def test_bad_result_raises_exception(self):
+        body = uic_response('SpkName', '').replace('result="ok"', 'result="ng"')
+        reader, writer = _fake_connection(_http_response(body))
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            api = _get_api()
+
+            with pytest.raises(SamsungMultiroomApiException):
+                await api.get_speaker_name()
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_raises_exception(self):
+        reader, writer = _fake_connection(_http_response(uic_response('SpkName', '<spkname>Kitchen')))
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            api = _get_api()
+
+            with pytest.raises(SamsungMultiroomApiException) as exception_info:
+                await api.get_speaker_name()
+
+        assert isinstance(exception_info.value.__cause__, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_requests_match_sync_api(self):
+        transport = FakeTransport(lambda *_: uic_response('Ok', ''))
+
+        station_data = {'title': 'Radio', 'description': 'News', 'thumbnail': '', 'stationurl': 'http://radio'}
+        speakers = [{'name': 'Kitchen', 'ip': '192.168.1.129', 'mac': 'xx:xx'},
+                    {'name': 'Bedroom', 'ip': '192.168.1.130', 'mac': 'yy:yy'}]
+        items = [{'device_udn': 'uuid', 'object_id': '22$@1', 'title': 'Track'}]
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        api.set_alarm_info(0, 7, 30, '3E', 600, 10, station_data)
+        api.set_multispk_group('Group', speakers)
+        api.set_playlist_playback_control(items)
+        api.set_play_select(['1', '2'])
+        api.del_alarm([0, 1])
+
+        sync_requests = transport.requests
+
+        api = AsyncSamsungMultiroomApi('public', '192.168.1.129', transport=AsyncFakeTransport(transport))
+        await api.set_alarm_info(0, 7, 30, '3E', 600, 10, station_data)
+        await api.set_multispk_group('Group', speakers)
+        await api.set_playlist_playback_control(items)
+        await api.set_play_select(['1', '2'])
+        await api.del_alarm([0, 1])
+
+        assert transport.requests[len(sync_requests):] == sync_requests
+
+    @pytest.mark.asyncio
+    async def test_get_main_info(self):
+        reader, writer = _fake_connection(
+            _http_response(uic_response('RequestDeviceInfo', ''), 'close'),
+            _http_response(uic_response('MainInfo', '<spkmacaddr>xx:xx:xx:xx:xx:xx</spkmacaddr>'), 'close'),
+        )
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            api = _get_api()
+            main_info = await api.get_main_info()
+
+        assert main_info == {'spkmacaddr': 'xx:xx:xx:xx:xx:xx'}
+        writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_requests_to_many_speakers_run_concurrently(self):
+        async def slow_open_connection(ip_address, port):
+            await asyncio.sleep(0.1)
+            return _fake_connection(_http_response(uic_response('VolumeLevel', '<volume>10</volume>')))
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.side_effect = slow_open_connection
+
+            apis = [AsyncSamsungMultiroomApi('public', '192.168.1.{0}'.format(i)) for i in range(10)]
+
+            start = time.monotonic()
+            volumes = await asyncio.gather(*[api.get_volume() for api in apis])
+            elapsed = time.monotonic() - start
+
+        assert volumes == [10] * 10
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_async_paginator(self):
+        pages = {
+            0: [1, 2, 3],
+            3: [4, 5, 6],
+            6: [7],
+        }
+
+        async def api_call(start_index, list_count):
+            return pages[start_index]
+
+        items = [item async for item in async_paginator(api_call, 0, 3)]
+
+        assert items == [1, 2, 3, 4, 5, 6, 7]
@@ -0,0 +1,120 @@
+import datetime
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import BulkExecutor
+from samsung_multiroom.api import BulkResult
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import FakeTransport
+
+from .helpers import uic_response
+
+
+class TestBulkExecutor(unittest.TestCase):
+
+    def test_invalid_arguments_raise_exception(self):
+        self.assertRaises(ValueError, BulkExecutor, concurrency=0)
+        self.assertRaises(ValueError, BulkExecutor, deadline=0)
+
+    def test_run(self):
+        apis = []
+        for i in range(3):
+            transport = FakeTransport()
+            transport.add_response('GetSpkName', uic_response('SpkName', '<spkname>Speaker {0}</spkname>'.format(i)))
+            apis.append(SamsungMultiroomApi('public', '192.168.1.{0}'.format(i), transport=transport))
+
+        results = BulkExecutor().run(apis, 'get_speaker_name')
+
+        self.assertEqual([result.target for result in results], apis)
+        self.assertEqual([result.value for result in results], ['Speaker 0', 'Speaker 1', 'Speaker 2'])
+        self.assertTrue(all([result.ok for result in results]))
+
+    def test_run_passes_arguments(self):
+        transport = FakeTransport()
+        transport.add_response('SetSpeakerTime', uic_response('SpeakerTime', ''))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        results = BulkExecutor().run([api], 'set_speaker_time', datetime.datetime(2018, 12, 31, 23, 59, 58))
+
+        self.assertTrue(results[0].ok)
+        self.assertIn('<p type="dec" name="year" val="2018"/>', transport.requests[0][3])
+
+    def test_run_callable(self):
+        targets = [MagicMock(), MagicMock()]
+        targets[0].get_volume.return_value = 10
+        targets[1].get_volume.return_value = 20
+
+        results = BulkExecutor().run(targets, lambda target, delta: target.get_volume() + delta, 1)
+
+        self.assertEqual([result.get() for result in results], [11, 21])
+
+    def test_run_isolates_errors(self):
+        targets = [MagicMock(), MagicMock()]
+        targets[0].get_main_info.side_effect = SamsungMultiroomApiException('unreachable')
+        targets[1].get_main_info.return_value = {'spkname': 'Kitchen'}
+
+        results = BulkExecutor().run(targets, 'get_main_info')
+
+        self.assertFalse(results[0].ok)
+        self.assertIsInstance(results[0].error, SamsungMultiroomApiException)
+        self.assertRaises(SamsungMultiroomApiException, results[0].get)
+        self.assertIsNone(results[0].value)
+        self.assertTrue(results[1].ok)
+        self.assertEqual(results[1].get(), {'spkname': 'Kitchen'})
+
+    def test_run_takes_max_latency(self):
+        targets = [MagicMock() for _ in range(8)]
+        for target in targets:
+            target.get_volume.side_effect = lambda: time.sleep(0.05)
+
+        started = time.monotonic()
+        results = BulkExecutor(concurrency=8).run(targets, 'get_volume')
+        elapsed = time.monotonic() - started
+
+        self.assertTrue(all([result.ok for result in results]))
+        self.assertLess(elapsed, 0.05 * 4)
+
+    def test_run_bounds_concurrency(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def get_volume():
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        targets = [MagicMock() for _ in range(6)]
+        for target in targets:
+            target.get_volume.side_effect = get_volume
+
+        BulkExecutor(concurrency=2).run(targets, 'get_volume')
+
+        self.assertEqual(running[1], 2)
+
+    def test_run_deadline(self):
+        release = threading.Event()
+
+        targets = [MagicMock(), MagicMock()]
+        targets[0].get_volume.return_value = 10
+        targets[1].get_volume.side_effect = lambda: release.wait(1)
+
+        results = BulkExecutor(deadline=0.05).run(targets, 'get_volume')
+        release.set()
+
+        self.assertEqual(results[0].value, 10)
+        self.assertIsInstance(results[1].error, TimeoutError)
+        self.assertEqual(results[1].elapsed, 0.05)
+
+    def test_run_no_targets(self):
+        self.assertEqual(BulkExecutor().run([], 'get_volume'), [])
+
+    def test_result_repr(self):
+        self.assertEqual(repr(BulkResult('api', value=10)), "BulkResult('api', value=10)")
+        self.assertEqual(repr(BulkResult('api', error=ValueError('x'))), "BulkResult('api', error=ValueError('x'))")
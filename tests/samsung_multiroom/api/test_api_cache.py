@@ -0,0 +1,255 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import COMMAND_UIC
+from samsung_multiroom.api import ApiCache
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import FakeTransport
+
+from .helpers import FakeClock
+from .helpers import uic_response
+
+
+class TestApiCache(unittest.TestCase):
+
+    def test_invalid_max_size_raises_exception(self):
+        self.assertRaises(ValueError, ApiCache, max_size=0)
+
+    def test_get_caches_response(self):
+        load = MagicMock(return_value={'spkname': 'Living Room'})
+
+        cache = ApiCache()
+        response1 = cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+        response2 = cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+
+        self.assertEqual(response1, {'spkname': 'Living Room'})
+        self.assertEqual(response2, {'spkname': 'Living Room'})
+        load.assert_called_once()
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0, 'size': 1})
+
+    def test_get_returns_copy(self):
+        load = MagicMock(return_value={'spkname': 'Living Room'})
+
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)['spkname'] = 'Kitchen'
+        response = cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+
+        self.assertEqual(response, {'spkname': 'Living Room'})
+
+    def test_get_does_not_cache_actions_without_ttl(self):
+        load = MagicMock(return_value={'volume': '10'})
+
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_get_expires_response(self):
+        clock = FakeClock()
+        load = MagicMock(return_value={'spkname': 'Living Room'})
+
+        cache = ApiCache(ttl={'GetSpkName': 10}, clock=clock)
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+        clock.now = 9
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+        clock.now = 10
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_get_caches_payloads_separately(self):
+        load = MagicMock(side_effect=[{'page': 1}, {'page': 2}])
+
+        cache = ApiCache()
+        response1 = cache.get(COMMAND_UIC, 'GetCpList', '<name>GetCpList</name>1', load)
+        response2 = cache.get(COMMAND_UIC, 'GetCpList', '<name>GetCpList</name>2', load)
+
+        self.assertEqual(response1, {'page': 1})
+        self.assertEqual(response2, {'page': 2})
+
+    def test_get_evicts_least_recently_used(self):
+        load = MagicMock(return_value={})
+
+        cache = ApiCache(max_size=2)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'a', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'b', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'a', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'c', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'a', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', 'b', load)
+
+        self.assertEqual(load.call_count, 4)
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_set_action_invalidates_cached_responses(self):
+        load = MagicMock(return_value={})
+
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+        cache.get(COMMAND_UIC, 'GetFunc', '<name>GetFunc</name>', load)
+        cache.get(COMMAND_UIC, 'SetSpkName', '<name>SetSpkName</name>', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+        cache.get(COMMAND_UIC, 'GetFunc', '<name>GetFunc</name>', load)
+
+        self.assertEqual(load.call_count, 4)
+        self.assertEqual(cache.stats()['invalidations'], 1)
+
+    def test_failed_set_action_invalidates_cached_responses(self):
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', MagicMock(return_value={}))
+
+        self.assertRaises(ValueError, cache.get, COMMAND_UIC, 'SetSpkName', '<name>SetSpkName</name>',
+                          MagicMock(side_effect=ValueError()))
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_get_does_not_cache_response_invalidated_while_loading(self):
+        cache = ApiCache()
+
+        def load():
+            cache.invalidate('GetSpkName')
+            return {'spkname': 'Living Room'}
+
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', load)
+
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_get_does_not_cache_response_updated_by_event_while_loading(self):
+        cache = ApiCache()
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+
+        def load():
+            cache.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>20</volume>')))
+            return {'volume': '10'}
+
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', MagicMock(return_value={}))
+
+        self.assertEqual(cache.stats()['size'], 1)
+
+    def test_clear(self):
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetSpkName', '<name>GetSpkName</name>', MagicMock(return_value={}))
+        cache.clear()
+
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_handle_response_updates_cached_response(self):
+        clock = FakeClock()
+        load = MagicMock(return_value={'volume': '10'})
+
+        cache = ApiCache(clock=clock)
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>20</volume>')))
+        clock.now = 299
+        response = cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+
+        self.assertTrue(cache.live)
+        self.assertEqual(response, {'volume': '20'})
+        load.assert_called_once()
+
+    def test_handle_response_malformed_update_invalidates_cached_response(self):
+        load = MagicMock(return_value={'volume': '10'})
+
+        cache = ApiCache()
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>20</volume>')[:-20]))
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_handle_response_invalidates_cached_response(self):
+        load = MagicMock(return_value={})
+
+        cache = ApiCache()
+        cache.get(COMMAND_UIC, 'GetCpList', '<name>GetCpList</name>', load)
+        cache.handle_response(ApiResponse(uic_response('CpChanged', '<cpname>TuneIn</cpname>')))
+        cache.get(COMMAND_UIC, 'GetCpList', '<name>GetCpList</name>', load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_handle_response_stream_closed(self):
+        load = MagicMock(return_value={'volume': '10'})
+
+        cache = ApiCache()
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.handle_response(None)
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+
+        self.assertFalse(cache.live)
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_handle_response_reconnected_drops_event_driven_responses(self):
+        load = MagicMock(return_value={})
+
+        cache = ApiCache()
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+        cache.get(COMMAND_UIC, 'GetVolume', '<name>GetVolume</name>', load)
+        cache.get(COMMAND_UIC, 'GetCpList', '<name>GetCpList</name>', load)
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+
+        self.assertEqual(cache.stats()['size'], 1)
+
+    def test_api_uses_cache(self):
+        transport = FakeTransport()
+        transport.add_response('GetSpkName', uic_response('SpkName', '<spkname><![CDATA[Living Room]]></spkname>'))
+        transport.add_response('SetSpkName', uic_response('SpkName', '<spkname><![CDATA[Kitchen]]></spkname>'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, cache=ApiCache())
+
+        self.assertEqual(api.get_speaker_name(), 'Living Room')
+        self.assertEqual(api.get_speaker_name(), 'Living Room')
+        api.set_speaker_name('Kitchen')
+        self.assertEqual(api.get_speaker_name(), 'Living Room')
+
+        actions = [payload for _, _, _, payload in transport.requests]
+        self.assertEqual(actions, [
+            '<name>GetSpkName</name>',
+            '<name>SetSpkName</name><p type="cdata" name="spkname" val="empty"><![CDATA[Kitchen]]></p>',
+            '<name>GetSpkName</name>',
+        ])
+
+    def test_api_set_invalidates_event_driven_responses(self):
+        state = {'volume': '10', 'mute': 'off', 'shuffle': 'off', 'repeat': 'off'}
+        responses = {
+            'Volume': ('VolumeLevel', 'volume'),
+            'Mute': ('MuteStatus', 'mute'),
+            'ShuffleMode': ('ShuffleMode', 'shuffle'),
+            'RepeatMode': ('RepeatMode', 'repeat'),
+        }
+
+        def handler(command, action, payload):
+            method, field = responses[action[3:]]
+            if action.startswith('Set'):
+                state[field] = re.search(r'val="([^"]*)"', payload).group(1)
+
+            return uic_response(method, '<{0}>{1}</{0}>'.format(field, state[field]))
+
+        cache = ApiCache()
+        cache.handle_response(ApiResponse(uic_response('RequestDeviceInfo', '')))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport(handler), cache=cache)
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertFalse(api.get_mute())
+        self.assertFalse(api.get_shuffle_mode())
+        self.assertEqual(api.get_repeat_mode(), 'off')
+
+        api.set_volume(50)
+        api.set_mute(True)
+        api.set_shuffle_mode(True)
+        api.set_repeat_mode('all')
+
+        self.assertTrue(cache.live)
+        self.assertEqual(api.get_volume(), 50)
+        self.assertTrue(api.get_mute())
+        self.assertTrue(api.get_shuffle_mode())
+        self.assertEqual(api.get_repeat_mode(), 'all')
@@ -0,0 +1,171 @@
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import STATE_CLOSED
+from samsung_multiroom.api import STATE_HALF_OPEN
+from samsung_multiroom.api import STATE_OPEN
+from samsung_multiroom.api import CircuitBreaker
+from samsung_multiroom.api import RetryPolicy
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.api_circuit_breaker import ACQUIRE_ALLOW
+from samsung_multiroom.api.api_circuit_breaker import ACQUIRE_PROBE
+from samsung_multiroom.api.api_circuit_breaker import ACQUIRE_REJECT
+from samsung_multiroom.api.transport import TransportException
+
+from .helpers import FakeClock
+from .helpers import uic_response
+
+
+def _get_open_circuit_breaker():
+    clock = FakeClock()
+
+    circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+
+    return (circuit_breaker, clock)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_invalid_failure_threshold_raises_exception(self):
+        self.assertRaises(ValueError, CircuitBreaker, 0)
+
+    def test_opens_after_consecutive_failures(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=2)
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, STATE_CLOSED)
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_ALLOW)
+
+        circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, STATE_OPEN)
+        self.assertFalse(circuit_breaker.is_available())
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_REJECT)
+        self.assertEqual(circuit_breaker.stats(), {'state': STATE_OPEN, 'failures': 2, 'opened': 1, 'rejected': 1})
+
+    def test_probes_once_reset_timeout_is_over(self):
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        clock.now = 10
+
+        self.assertTrue(circuit_breaker.is_available())
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_PROBE)
+        self.assertEqual(circuit_breaker.state, STATE_HALF_OPEN)
+        self.assertFalse(circuit_breaker.is_available())
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_REJECT)
+
+        circuit_breaker.record_success()
+
+        self.assertEqual(circuit_breaker.state, STATE_CLOSED)
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_ALLOW)
+
+    def test_failed_probe_opens_circuit_again(self):
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        clock.now = 10
+
+        circuit_breaker.acquire()
+        circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, STATE_OPEN)
+
+        clock.now = 19
+
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_REJECT)
+
+        clock.now = 20
+
+        self.assertEqual(circuit_breaker.acquire(), ACQUIRE_PROBE)
+
+    def test_api_fails_fast_while_open(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        circuit_breaker.record_success()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=circuit_breaker,
+                                  retry_policy=RetryPolicy(attempts=1))
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+        self.assertRaises(SamsungMultiroomApiException, api.set_volume, 10)
+        self.assertFalse(api.is_available())
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+        self.assertEqual(transport.request.call_count, 2)
+
+    def test_api_without_circuit_breaker_keeps_sending_requests(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, retry_policy=RetryPolicy(attempts=1))
+
+        for _ in range(10):
+            self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+
+        self.assertIsNone(api.circuit_breaker)
+        self.assertTrue(api.is_available())
+        self.assertEqual(transport.request.call_count, 10)
+
+    def test_api_invalid_response_does_not_open_circuit(self):
+        transport = MagicMock()
+        transport.request.return_value = '<invalid'
+
+        circuit_breaker = CircuitBreaker(failure_threshold=1)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=circuit_breaker)
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+        self.assertTrue(api.is_available())
+
+    def test_api_probes_with_get_speaker_name(self):
+        transport = MagicMock()
+        transport.request.side_effect = [
+            uic_response('SpkName', '<spkname><![CDATA[Living Room]]></spkname>'),
+            uic_response('VolumeLevel', '<volume>10</volume>'),
+        ]
+
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        clock.now = 10
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=circuit_breaker)
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertEqual(circuit_breaker.state, STATE_CLOSED)
+        self.assertIn('GetSpkName', transport.request.call_args_list[0][0][2])
+
+    def test_api_failed_probe_fails_request(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        clock.now = 10
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=circuit_breaker)
+
+        self.assertRaises(SamsungMultiroomApiException, api.set_volume, 10)
+        self.assertEqual(circuit_breaker.state, STATE_OPEN)
+        transport.request.assert_called_once()
+
+    def test_api_probe_unexpected_exception_opens_circuit_again(self):
+        transport = MagicMock()
+        transport.request.side_effect = RuntimeError()
+
+        circuit_breaker, clock = _get_open_circuit_breaker()
+        clock.now = 10
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=circuit_breaker)
+
+        self.assertRaises(RuntimeError, api.get_volume)
+        self.assertEqual(circuit_breaker.state, STATE_OPEN)
+
+        clock.now = 20
+        transport.request.side_effect = [
+            uic_response('SpkName', '<spkname><![CDATA[Living Room]]></spkname>'),
+            uic_response('VolumeLevel', '<volume>10</volume>'),
+        ]
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertEqual(circuit_breaker.state, STATE_CLOSED)
@@ -0,0 +1,116 @@
+import unittest
+
+from samsung_multiroom.api import COMMAND_CPM
+from samsung_multiroom.api import COMMAND_UIC
+from samsung_multiroom.api import COMMANDS
+from samsung_multiroom.api import Command
+from samsung_multiroom.api import Param
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.api_commands import FIELD_BOOL
+from samsung_multiroom.api.api_commands import FIELD_INT
+from samsung_multiroom.api.api_commands import PARAM_CDATA
+from samsung_multiroom.api.api_commands import PARAM_DEC
+from samsung_multiroom.api.api_commands import PARAM_ON_OFF
+from samsung_multiroom.api.api_commands import PARAM_STR
+from samsung_multiroom.api.transport import FakeTransport
+
+from .helpers import uic_response
+
+
+class TestCommand(unittest.TestCase):
+
+    def test_encode(self):
+        command = Command('SetSomething', COMMAND_UIC, [
+            Param('volume', PARAM_DEC),
+            Param('name', PARAM_CDATA),
+            Param('mute', PARAM_ON_OFF),
+            Param('parentid', PARAM_STR),
+            Param('function'),
+            Param('filter', value='folder'),
+        ])
+
+        self.assertEqual(command.encode('10', 'Kitchen', True, 22, 'wifi'), [
+            ('volume', 10, 'dec'),
+            ('name', 'Kitchen', 'cdata'),
+            ('mute', 'on'),
+            ('parentid', '22'),
+            ('function', 'wifi'),
+            ('filter', 'folder'),
+        ])
+
+    def test_encode_numbered(self):
+        command = Command('SetSomething', COMMAND_UIC, [Param('presetindex', PARAM_DEC),
+                                                        Param('eqvalue', PARAM_DEC, numbered=True)])
+
+        self.assertEqual(command.encode(4, [1, '-2']), [
+            ('presetindex', 4, 'dec'),
+            ('eqvalue1', 1, 'dec'),
+            ('eqvalue2', -2, 'dec'),
+        ])
+
+    def test_encode_with_encoder(self):
+        command = Command('DelAlarm', COMMAND_UIC, encoder=lambda index_list: [('index', i) for i in index_list])
+
+        self.assertEqual(command.encode([0, 2]), [('index', 0), ('index', 2)])
+        self.assertRaises(TypeError, command.encode)
+
+    def test_encode_invalid_choice_raises_exception(self):
+        command = Command('SetTrickMode', COMMAND_UIC, [Param('trickmode', choices=['previous', 'next'])])
+
+        self.assertEqual(command.encode('next'), [('trickmode', 'next')])
+        self.assertRaises(ValueError, command.encode, 'forward')
+
+    def test_encode_invalid_number_of_arguments_raises_exception(self):
+        command = Command('SetVolume', COMMAND_UIC, [Param('volume', PARAM_DEC)])
+
+        self.assertRaises(TypeError, command.encode)
+        self.assertRaises(TypeError, command.encode, 1, 2)
+
+    def test_invalid_types_raise_exception(self):
+        self.assertRaises(ValueError, Param, 'volume', 'float')
+        self.assertRaises(ValueError, Command, 'GetVolume', COMMAND_UIC, field='volume', field_type='float')
+
+    def test_decode_whole_response(self):
+        command = Command('GetFunc', COMMAND_UIC)
+
+        self.assertEqual(command.decode({'function': 'wifi'}), {'function': 'wifi'})
+
+    def test_decode_field(self):
+        self.assertEqual(Command('GetVolume', COMMAND_UIC, field='volume', field_type=FIELD_INT).decode(
+            {'volume': '10'}), 10)
+        self.assertEqual(Command('GetMute', COMMAND_UIC, field='mute', field_type=FIELD_BOOL).decode(
+            {'mute': 'on'}), True)
+        self.assertEqual(Command('GetSpkName', COMMAND_UIC, field='spkname').decode({'spkname': 'Kitchen'}),
+                         'Kitchen')
+
+    def test_decode_items(self):
+        command = Command('BrowseMain', COMMAND_CPM, items=('menulist', 'menuitem'), count='listcount')
+
+        self.assertEqual(command.decode({'listcount': '0'}), [])
+        self.assertEqual(command.decode({'listcount': '1', 'menulist': {'menuitem': {'title': 'A'}}}),
+                         [{'title': 'A'}])
+        self.assertEqual(command.decode({'listcount': '2', 'menulist': {'menuitem': [{'title': 'A'},
+                                                                                    {'title': 'B'}]}}),
+                         [{'title': 'A'}, {'title': 'B'}])
+
+    def test_commands_table(self):
+        for name, command in COMMANDS.items():
+            self.assertEqual(command.name, name)
+            self.assertIn(command.command, [COMMAND_UIC, COMMAND_CPM])
+
+
+class TestApiCall(unittest.TestCase):
+
+    def test_call(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertEqual(api.call('GetVolume'), 10)
+        self.assertEqual(transport.requests[0][2:], ('UIC', '<name>GetVolume</name>'))
+
+    def test_call_unknown_action_raises_exception(self):
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport())
+
+        self.assertRaises(ValueError, api.call, 'GetSomethingUnknown')
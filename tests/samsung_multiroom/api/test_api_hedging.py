@@ -0,0 +1,157 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import CommandScheduler
+from samsung_multiroom.api import HedgePolicy
+from samsung_multiroom.api import SamsungMultiroomApi
+
+from .helpers import uic_response
+
+
+def _get_warm_hedge_policy(**kwargs):
+    hedge_policy = HedgePolicy(min_samples=10, **kwargs)
+
+    for _ in range(10):
+        hedge_policy.run('GetPlayStatus', lambda: None)
+
+    return hedge_policy
+
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def test_invalid_percentile_raises_exception(self):
+        self.assertRaises(ValueError, HedgePolicy, percentile=0)
+        self.assertRaises(ValueError, HedgePolicy, percentile=101)
+
+    def test_get_delay(self):
+        hedge_policy = HedgePolicy(percentile=90, min_samples=10)
+
+        self.assertIsNone(hedge_policy.get_delay('GetPlayStatus'))
+
+        for _ in range(10):
+            hedge_policy.run('GetPlayStatus', lambda: None)
+
+        self.assertIsNotNone(hedge_policy.get_delay('GetPlayStatus'))
+        self.assertIsNone(hedge_policy.get_delay('GetMusicInfo'))
+
+    def test_run_duplicates_slow_call(self):
+        hedge_policy = _get_warm_hedge_policy(budget=1)
+        calls = []
+
+        def load():
+            calls.append(1)
+            if len(calls) == 1:
+                self.release.wait(1)
+                return 'stalled'
+
+            return 'duplicate'
+
+        result = hedge_policy.run('GetPlayStatus', load)
+
+        self.assertEqual(result, 'duplicate')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(hedge_policy.stats()['hedged'], 1)
+        self.assertEqual(hedge_policy.stats()['hedge_wins'], 1)
+
+    def test_run_waits_for_primary_if_duplicate_fails(self):
+        hedge_policy = _get_warm_hedge_policy(budget=1)
+        calls = []
+
+        def load():
+            calls.append(1)
+            if len(calls) == 1:
+                self.release.wait(0.2)
+                return 'primary'
+
+            raise ValueError()
+
+        result = hedge_policy.run('GetPlayStatus', load)
+
+        self.assertEqual(result, 'primary')
+        self.assertEqual(hedge_policy.stats()['hedge_wins'], 0)
+
+    def test_run_respects_budget(self):
+        hedge_policy = _get_warm_hedge_policy(budget=0)
+        calls = []
+
+        def load():
+            calls.append(1)
+            self.release.wait(0.05)
+            return 'primary'
+
+        result = hedge_policy.run('GetPlayStatus', load)
+
+        self.assertEqual(result, 'primary')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(hedge_policy.stats()['over_budget'], 1)
+
+    def test_run_skips_duplicate_without_spare_capacity(self):
+        hedge_policy = _get_warm_hedge_policy(budget=1)
+        calls = []
+
+        def load():
+            calls.append(1)
+            self.release.wait(0.05)
+            return 'primary'
+
+        scheduler = CommandScheduler(concurrency=1)
+
+        with scheduler.slot('GetPlayStatus'):
+            result = hedge_policy.run('GetPlayStatus', load, scheduler.spare_slot)
+
+        self.assertEqual(result, 'primary')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(hedge_policy.stats()['hedged'], 0)
+        self.assertEqual(hedge_policy.stats()['no_capacity'], 1)
+
+    def test_run_raises_exception_of_fast_call(self):
+        hedge_policy = _get_warm_hedge_policy(budget=1)
+
+        def load():
+            raise ValueError()
+
+        self.assertRaises(ValueError, hedge_policy.run, 'GetPlayStatus', load)
+
+    def test_api_hedges_get_requests_only(self):
+        transport = MagicMock()
+        transport.request.return_value = uic_response('VolumeLevel', '<volume>10</volume>')
+
+        hedge_policy = MagicMock()
+        hedge_policy.run.side_effect = lambda action, load, slot: load()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, hedge_policy=hedge_policy)
+        api.get_volume()
+        api.set_volume(20)
+
+        hedge_policy.run.assert_called_once()
+        self.assertEqual(hedge_policy.run.call_args[0][0], 'GetVolume')
+        self.assertEqual(transport.request.call_count, 2)
+
+    def test_api_hedges_within_scheduler_concurrency(self):
+        calls = []
+
+        def request(*_):
+            calls.append(1)
+            self.release.wait(0.05)
+            return uic_response('VolumeLevel', '<volume>10</volume>')
+
+        transport = MagicMock()
+        transport.request.side_effect = request
+
+        hedge_policy = HedgePolicy(min_samples=10, budget=1)
+        for _ in range(10):
+            hedge_policy.run('GetVolume', lambda: None)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, hedge_policy=hedge_policy,
+                                  scheduler=CommandScheduler(concurrency=1))
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(hedge_policy.stats()['no_capacity'], 1)
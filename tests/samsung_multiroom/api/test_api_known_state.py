@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import COMMAND_UIC
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api import KnownState
+from samsung_multiroom.api import SamsungMultiroomApi
+
+from .helpers import FakeClock
+from .helpers import uic_response
+
+
+class TestKnownState(unittest.TestCase):
+
+    def test_handle_response(self):
+        known_state = KnownState()
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>10</volume>')))
+
+        self.assertEqual(known_state.get('volume'), '10')
+        self.assertIsNone(known_state.get('mute'))
+
+    def test_handle_response_malformed_response_forgets_values(self):
+        known_state = KnownState()
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>10</volume>')))
+        known_state.handle_response(ApiResponse(uic_response('MuteStatus', '<mute>on</mute>')))
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>20</volume>')[:-20]))
+
+        self.assertIsNone(known_state.get('volume'))
+        self.assertEqual(known_state.get('mute'), 'on')
+
+    def test_handle_response_stream_closed_forgets_values(self):
+        known_state = KnownState()
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>10</volume>')))
+        known_state.handle_response(None)
+
+        self.assertIsNone(known_state.get('volume'))
+
+    def test_get_forgets_old_values(self):
+        clock = FakeClock()
+
+        known_state = KnownState(max_age=5, clock=clock)
+        known_state.handle_response(ApiResponse(uic_response('MuteStatus', '<mute>on</mute>')))
+        clock.now = 5
+
+        self.assertEqual(known_state.get('mute'), 'on')
+
+        clock.now = 6
+
+        self.assertIsNone(known_state.get('mute'))
+
+    def test_is_redundant(self):
+        known_state = KnownState(skip_redundant=True)
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>10</volume>')))
+
+        self.assertTrue(known_state.is_redundant('SetVolume', [('volume', 10)]))
+        self.assertFalse(known_state.is_redundant('SetVolume', [('volume', 11)]))
+        self.assertFalse(known_state.is_redundant('SetMute', [('mute', 'on')]))
+        self.assertFalse(known_state.is_redundant('SetTrickMode', [('trickmode', 'next')]))
+        self.assertEqual(known_state.stats(), {'skipped': 1, 'known': 1})
+
+    def test_is_redundant_disabled_by_default(self):
+        known_state = KnownState()
+        known_state.handle_response(ApiResponse(uic_response('VolumeLevel', '<volume>10</volume>')))
+
+        self.assertFalse(known_state.skip_redundant)
+        self.assertFalse(known_state.is_redundant('SetVolume', [('volume', 10)]))
+        self.assertEqual(known_state.stats(), {'skipped': 0, 'known': 1})
+
+    def test_is_redundant_requires_all_values(self):
+        known_state = KnownState(skip_redundant=True)
+        known_state.handle_response(ApiResponse(uic_response(
+            'CurrentEQMode', '<presetindex>1</presetindex><presetname>Pop</presetname><eqvalue1>1</eqvalue1>'
+            '<eqvalue2>2</eqvalue2><eqvalue3>3</eqvalue3><eqvalue4>4</eqvalue4><eqvalue5>5</eqvalue5>'
+            '<eqvalue6>6</eqvalue6><eqvalue7>0</eqvalue7>')))
+
+        values = [1, 2, 3, 4, 5, 6, 0]
+        params = [('presetindex', 1)] + [('eqvalue' + str(i + 1), value) for i, value in enumerate(values)]
+        self.assertTrue(known_state.is_redundant('Set7bandEQValue', params))
+
+        params[7] = ('eqvalue7', -1)
+        self.assertFalse(known_state.is_redundant('Set7bandEQValue', params))
+
+    def test_is_redundant_never_skips_preset_selection(self):
+        known_state = KnownState(skip_redundant=True)
+        known_state.handle_response(ApiResponse(uic_response(
+            '7bandEQValue', '<presetindex>1</presetindex><eqvalue1>1</eqvalue1><eqvalue2>2</eqvalue2>'
+            '<eqvalue3>3</eqvalue3><eqvalue4>4</eqvalue4><eqvalue5>5</eqvalue5><eqvalue6>6</eqvalue6>'
+            '<eqvalue7>0</eqvalue7>')))
+
+        self.assertFalse(known_state.is_redundant('Set7bandEQMode', [('presetindex', 1)]))
+
+    def test_api_skips_redundant_set_requests(self):
+        transport = MagicMock()
+        transport.request.side_effect = [
+            uic_response('MuteStatus', '<mute>on</mute>'),
+            uic_response('MuteStatus', '<mute>on</mute>'),
+            uic_response('MuteStatus', '<mute>off</mute>'),
+        ]
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport,
+                                  known_state=KnownState(skip_redundant=True))
+
+        self.assertTrue(api.get_mute())
+
+        api.set_mute(True)
+
+        self.assertEqual(transport.request.call_count, 1)
+
+        api.set_mute(True, force=True)
+        api.set_mute(False)
+
+        self.assertEqual(transport.request.call_count, 3)
+        self.assertEqual(api.known_state.get('mute'), 'off')
+
+    def test_api_sends_redundant_set_requests_by_default(self):
+        transport = MagicMock()
+        transport.request.side_effect = [
+            uic_response('MuteStatus', '<mute>on</mute>'),
+            uic_response('MuteStatus', '<mute>on</mute>'),
+        ]
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertTrue(api.get_mute())
+        self.assertEqual(api.get(COMMAND_UIC, 'SetMute', [('mute', 'on')]), {'mute': 'on'})
+        self.assertEqual(transport.request.call_count, 2)
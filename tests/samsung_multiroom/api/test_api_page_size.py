@@ -0,0 +1,188 @@
+import re
+import unittest
+
+from samsung_multiroom.api import PageSizer
+from samsung_multiroom.api import RetryPolicy
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api import paginator
+from samsung_multiroom.api.transport import FakeTransport
+
+
+def _list_response(start_index, count, result='ok'):
+    return ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>PCMusicList</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="{0}"><listcount>{1}</listcount><musiclist>{2}</musiclist></response></UIC>').format(
+                result, count, ''.join('<music><playindex>{0}</playindex></music>'.format(i)
+                                       for i in range(start_index, start_index + count)))
+
+
+def _get_api(total, max_list_count=None, page_sizer=None, capped_list_count=None):
+    list_counts = []
+
+    def handler(command, action, payload):
+        start_index = int(re.search(r'name="liststartindex" val="(\d+)"', payload).group(1))
+        list_count = int(re.search(r'name="listcount" val="(\d+)"', payload).group(1))
+        list_counts.append(list_count)
+
+        # emulate body too big for the speaker to send
+        if max_list_count is not None and list_count > max_list_count:
+            return _list_response(start_index, list_count)[:-20]
+
+        # emulate speaker returning fewer items than asked for
+        if capped_list_count is not None:
+            list_count = min(list_count, capped_list_count)
+
+        return _list_response(start_index, max(0, min(list_count, total - start_index)))
+
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport(handler),
+                              retry_policy=RetryPolicy(attempts=1), page_sizer=page_sizer)
+
+    return (api, list_counts)
+
+
+class TestPageSizer(unittest.TestCase):
+
+    def test_invalid_arguments_raise_exception(self):
+        self.assertRaises(ValueError, PageSizer, minimum=0)
+        self.assertRaises(ValueError, PageSizer, minimum=20, maximum=10)
+        self.assertRaises(ValueError, PageSizer, growth=0.5)
+        self.assertRaises(ValueError, PageSizer, tolerance=0.5)
+
+    def test_get_page_size(self):
+        page_sizer = PageSizer(maximum=100)
+
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 20)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 200), 100)
+        self.assertEqual(page_sizer.get_page_size('get_select_radio_list', 50), 30)
+
+    def test_observe_grows_while_latency_is_flat(self):
+        page_sizer = PageSizer(maximum=100, growth=2, tolerance=1.5)
+
+        page_sizer.observe('pc_get_music_list_by_id', 20, 0.1)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 40)
+
+        page_sizer.observe('pc_get_music_list_by_id', 40, 0.14)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 80)
+
+        page_sizer.observe('pc_get_music_list_by_id', 80, 0.2)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 80)
+
+        page_sizer.observe('pc_get_music_list_by_id', 80, 0.1)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 100)
+
+        stats = page_sizer.stats()['pc_get_music_list_by_id']
+        self.assertEqual(stats['page_size'], 100)
+        self.assertEqual(stats['best_latency'], 0.1)
+        self.assertEqual(stats['pages'], 4)
+
+    def test_observe_stays_within_method_maximum(self):
+        page_sizer = PageSizer(maximum=100)
+
+        page_sizer.observe('browse_main', 30, 0.1)
+
+        self.assertEqual(page_sizer.get_page_size('browse_main', 30), 30)
+
+    def test_observe_does_not_shrink_on_late_pages(self):
+        page_sizer = PageSizer()
+
+        page_sizer.observe('pc_get_music_list_by_id', 40, 0.1)
+        page_sizer.observe('pc_get_music_list_by_id', 20, 0.1)
+
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 80)
+
+    def test_backoff(self):
+        page_sizer = PageSizer(minimum=5)
+
+        self.assertEqual(page_sizer.backoff('pc_get_music_list_by_id', 40), 20)
+        self.assertEqual(page_sizer.backoff('pc_get_music_list_by_id', 40), 10)
+        self.assertEqual(page_sizer.backoff('pc_get_music_list_by_id', 10), 5)
+        self.assertEqual(page_sizer.backoff('pc_get_music_list_by_id', 5), 5)
+        self.assertEqual(page_sizer.stats()['pc_get_music_list_by_id']['backoffs'], 4)
+
+        page_sizer.observe('pc_get_music_list_by_id', 5, 0.1)
+        self.assertEqual(page_sizer.get_page_size('pc_get_music_list_by_id', 20), 5)
+
+    def test_api_page_sizer(self):
+        page_sizer = PageSizer()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', page_sizer=page_sizer)
+
+        self.assertIs(api.page_sizer, page_sizer)
+        self.assertIsInstance(SamsungMultiroomApi('public', '192.168.1.129').page_sizer, PageSizer)
+        self.assertIsNone(SamsungMultiroomApi('public', '192.168.1.129', page_sizer=False).page_sizer)
+
+    def test_paginator_page_sizer_disabled(self):
+        api, list_counts = _get_api(50, page_sizer=False)
+
+        self.assertEqual(len(list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20))), 50)
+        self.assertEqual(list_counts, [20, 20, 20])
+
+        api, list_counts = _get_api(50)
+
+        self.assertEqual(len(list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20, page_sizer=False))), 50)
+        self.assertEqual(list_counts, [20, 20, 20])
+
+    def test_paginator_grows_page_size(self):
+        api, list_counts = _get_api(500, page_sizer=PageSizer(maximum=100, tolerance=1000))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(500)])
+        self.assertEqual(list_counts, [20, 40, 80, 100, 100, 100, 100])
+
+    def test_paginator_continues_after_page_cut_short_by_speaker(self):
+        api, list_counts = _get_api(100, capped_list_count=30, page_sizer=PageSizer(maximum=100, tolerance=1000))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(100)])
+        self.assertEqual(list_counts, [20, 40, 80, 100])
+
+    def test_paginator_prefetch_continues_after_page_cut_short_by_speaker(self):
+        api, _ = _get_api(100, capped_list_count=30, page_sizer=PageSizer(maximum=100, tolerance=1000))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20, prefetch=3))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(100)])
+
+    def test_paginator_shrinks_oversized_pages(self):
+        api, list_counts = _get_api(100, max_list_count=30, page_sizer=PageSizer(maximum=100, tolerance=1000))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(100)])
+        self.assertEqual(list_counts, [20, 40, 20, 20, 20, 20, 20])
+        self.assertEqual(api.page_sizer.stats()['pc_get_music_list_by_id']['limit'], 20)
+
+    def test_paginator_shrinks_prefetched_pages(self):
+        api, _ = _get_api(200, max_list_count=30, page_sizer=PageSizer(maximum=100, tolerance=1000))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 20, prefetch=3))
+
+        self.assertEqual([item['playindex'] for item in items], [str(i) for i in range(200)])
+
+    def test_paginator_raises_exception_at_minimum_page_size(self):
+        api, _ = _get_api(100, max_list_count=4, page_sizer=PageSizer(minimum=5))
+
+        self.assertRaises(SamsungMultiroomApiException, list, paginator(api.pc_get_music_list_by_id, 'uuid', '22',
+                                                                        0, 20))
+
+    def test_paginator_does_not_shrink_on_unsuccessful_response(self):
+        transport = FakeTransport()
+        transport.add_response('PCGetMusicListByID', _list_response(0, 0, result='ng'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertRaises(SamsungMultiroomApiException, list, paginator(api.pc_get_music_list_by_id, 'uuid', '22',
+                                                                        0, 20))
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_paginator_does_not_shrink_non_idempotent_calls(self):
+        transport = FakeTransport()
+        transport.add_response('SetSelectCpSubmenu', _list_response(0, 20)[:-20])
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertRaises(SamsungMultiroomApiException, list, paginator(api.set_select_cp_submenu, '1', 0, 20))
+        self.assertEqual(len(transport.requests), 1)
@@ -0,0 +1,114 @@
+import glob
+import os
+import unittest
+
+from samsung_multiroom.api import PARSER_EXPAT
+from samsung_multiroom.api import PARSER_XMLTODICT
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api.api_parser import ItemParser
+from samsung_multiroom.api.api_parser import ParseError
+from samsung_multiroom.api.api_parser import get_parser
+from samsung_multiroom.api.api_parser import parse_expat
+from samsung_multiroom.api.api_parser import parse_xmltodict
+
+CORPUS = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'benchmarks', 'corpus', '*.xml')
+
+
+class TestApiParser(unittest.TestCase):
+
+    def assertSameStructure(self, response_text):
+        expected = parse_xmltodict(response_text)
+        actual = parse_expat(response_text)
+
+        # compare order of keys too
+        self.assertEqual(repr(_to_dicts(actual)), repr(_to_dicts(expected)))
+
+    def test_parse_expat_corpus(self):
+        paths = glob.glob(CORPUS)
+        self.assertTrue(paths)
+
+        for path in paths:
+            with open(path) as corpus_file:
+                with self.subTest(path=os.path.basename(path)):
+                    self.assertSameStructure(corpus_file.read())
+
+    def test_parse_expat(self):
+        self.assertSameStructure('<a x="1">text<b>2</b><b /><b>3</b></a>')
+        self.assertSameStructure('<a><b x="1">text</b><b>text</b></a>')
+        self.assertSameStructure('<a>  <b>  </b>  </a>')
+        self.assertSameStructure('<a><![CDATA[ <b>cdata</b> ]]></a>')
+        self.assertSameStructure('<a>&apos;&amp;&lt;</a>')
+        self.assertSameStructure('<?xml version="1.0" encoding="UTF-8"?><a>Zażółć</a>')
+        self.assertSameStructure(b'<?xml version="1.0" encoding="UTF-8"?><a>\xc5\xbc</a>')
+
+    def test_parse_expat_invalid_xml_raises_exception(self):
+        self.assertRaises(ParseError, parse_expat, 'not xml')
+        self.assertRaises(ParseError, parse_expat, '<a><b></a>')
+
+    def test_item_parser(self):
+        response_text = ('<UIC><method>PCMusicList</method><response result="ok"><listcount>3</listcount><musiclist>'
+                         '<music object_id="1"><title>One</title></music><music object_id="2" />'
+                         '<music><title>Three</title></music></musiclist></response></UIC>')
+        expected = parse_expat(response_text)['UIC']['response']['musiclist']['music']
+
+        for chunk_size in [1, 7, len(response_text)]:
+            with self.subTest(chunk_size=chunk_size):
+                parser = ItemParser(('response', 'musiclist', 'music'))
+
+                chunks = [response_text[i:i + chunk_size] for i in range(0, len(response_text), chunk_size)]
+                items = [parser.feed(chunk.encode()) for chunk in chunks]
+
+                self.assertEqual(sum(items, []), expected)
+                self.assertEqual(parser.close(), {'UIC': {
+                    'method': 'PCMusicList',
+                    'response': {'@result': 'ok', 'listcount': '3', 'musiclist': None},
+                }})
+
+    def test_item_parser_yields_items_when_complete(self):
+        parser = ItemParser(('response', 'presetlist', 'preset'))
+
+        self.assertEqual(parser.feed('<CPM><response result="ok"><presetlist><preset><title>One</title>'), [])
+        self.assertEqual(parser.feed('</preset><preset><title>'), [{'title': 'One'}])
+        self.assertEqual(parser.feed('Two</title></preset></presetlist></response></CPM>'), [{'title': 'Two'}])
+
+    def test_item_parser_ignores_elements_outside_path(self):
+        parser = ItemParser(('response', 'menulist', 'menuitem'))
+
+        items = parser.feed('<CPM><menuitem>outside</menuitem><response result="ok"><menulist><menuitem>inside'
+                            '</menuitem></menulist></response></CPM>')
+
+        self.assertEqual(items, ['inside'])
+        self.assertEqual(parser.close()['CPM']['menuitem'], 'outside')
+
+    def test_item_parser_incomplete_xml_raises_exception(self):
+        parser = ItemParser(('response', 'menulist', 'menuitem'))
+        parser.feed('<CPM><response result="ok"><menulist>')
+
+        self.assertRaises(ParseError, parser.close)
+
+    def test_get_parser(self):
+        self.assertIs(get_parser(PARSER_EXPAT), parse_expat)
+        self.assertIs(get_parser(PARSER_XMLTODICT), parse_xmltodict)
+        self.assertRaises(ValueError, get_parser, 'unknown')
+
+    def test_api_response_parsers(self):
+        response_text = ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>VolumeLevel</method>'
+                         '<version>1.0</version><user_identifier>public</user_identifier>'
+                         '<response result="ok"><volume>10</volume></response></UIC>')
+
+        for parser in [PARSER_EXPAT, PARSER_XMLTODICT]:
+            response = ApiResponse(response_text, parser=parser)
+
+            self.assertTrue(response.success)
+            self.assertEqual(response.name, 'VolumeLevel')
+            self.assertEqual(response.user, 'public')
+            self.assertEqual(response.data, {'volume': '10'})
+
+
+def _to_dicts(value):
+    if isinstance(value, dict):
+        return {key: _to_dicts(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_dicts(item) for item in value]
+
+    return value
@@ -0,0 +1,74 @@
+import unittest
+import urllib.parse
+
+from samsung_multiroom.api.api_payload import MAX_TEMPLATES
+from samsung_multiroom.api.api_payload import PayloadTemplate
+from samsung_multiroom.api.api_payload import format_param
+from samsung_multiroom.api.api_payload import format_payload
+from samsung_multiroom.api.api_payload import format_request
+from samsung_multiroom.api.api_payload import get_template
+
+
+class TestApiPayload(unittest.TestCase):
+
+    def test_format_payload_without_params(self):
+        self.assertEqual(format_payload('GetVolume'), '<name>GetVolume</name>')
+
+    def test_format_payload(self):
+        payload = format_payload('SetSpkName', [('spkname', 'Living Room', 'cdata'), ('volume', 10)])
+
+        self.assertEqual(payload, '<name>SetSpkName</name>'
+                         '<p type="cdata" name="spkname" val="empty"><![CDATA[Living Room]]></p>'
+                         '<p type="dec" name="volume" val="10"/>')
+
+    def test_format_param(self):
+        self.assertEqual(format_param(('title', 'Song')), '<p type="str" name="title" val="Song"/>')
+        self.assertEqual(format_param(('list_count', 30)), '<p type="dec" name="list_count" val="30"/>')
+        self.assertEqual(format_param(('list_count', '30', 'dec')), '<p type="dec" name="list_count" val="30"/>')
+        self.assertEqual(format_param(('name', 'A&B', 'cdata')),
+                         '<p type="cdata" name="name" val="empty"><![CDATA[A&B]]></p>')
+        self.assertEqual(format_param(('ids', [1, 2])),
+                         '<p type="dec_arr" name="ids" val="empty"><item>1</item><item>2</item></p>')
+
+    def test_format_request(self):
+        params = [('spkname', 'Kitchen & Bath / 2', 'cdata'), ('eqvalues', [1, -2]), ('title', 'Zażółć')]
+
+        payload, path = format_request('UIC', 'SetSpkName', params)
+
+        self.assertEqual(payload, format_payload('SetSpkName', params))
+        self.assertEqual(path, '/UIC?cmd={0}'.format(urllib.parse.quote(payload)))
+
+    def test_format_request_without_params_reuses_path(self):
+        _, path1 = format_request('UIC', 'GetVolume')
+        _, path2 = format_request('UIC', 'GetVolume')
+        _, path3 = format_request('CPM', 'GetVolume')
+
+        self.assertIs(path1, path2)
+        self.assertEqual(path1, '/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E')
+        self.assertEqual(path3, '/CPM?cmd=%3Cname%3EGetVolume%3C/name%3E')
+
+    def test_get_template_compiles_once(self):
+        template1, values1 = get_template('SetVolume', [('volume', 10)])
+        template2, values2 = get_template('SetVolume', [('volume', 20)])
+        template3, _ = get_template('SetVolume', [('volume', '20')])
+
+        self.assertIs(template1, template2)
+        self.assertIsNot(template1, template3)
+        self.assertEqual(values1, [10])
+        self.assertEqual(values2, [20])
+
+    def test_get_template_keeps_bounded_number_of_templates(self):
+        template, _ = get_template('DelAlarm', [('index', 0)])
+
+        for i in range(MAX_TEMPLATES):
+            get_template('DelAlarm', [('index', j) for j in range(i + 2)])
+
+        self.assertIsNot(get_template('DelAlarm', [('index', 0)])[0], template)
+
+    def test_render(self):
+        template = PayloadTemplate('SetVolume', [('volume', 'dec')])
+
+        self.assertEqual(template.action, 'SetVolume')
+        self.assertEqual(template.render([10]), ('<name>SetVolume</name><p type="dec" name="volume" val="10"/>',
+                                                 '%3Cname%3ESetVolume%3C/name%3E%3Cp%20type%3D%22dec%22%20name%3D'
+                                                 '%22volume%22%20val%3D%2210%22/%3E'))
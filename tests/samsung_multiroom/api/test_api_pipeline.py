@@ -0,0 +1,170 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from samsung_multiroom.api import COMMAND_UIC
+from samsung_multiroom.api import ApiCache
+from samsung_multiroom.api import ApiPipeline
+from samsung_multiroom.api import CircuitBreaker
+from samsung_multiroom.api import KnownState
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.api.transport import PipelineInterruptedException
+from samsung_multiroom.api.transport import TransportException
+
+from .helpers import uic_response
+
+RESPONSES = {
+    'GetVolume': ('VolumeLevel', '<volume>{volume}</volume>'),
+    'SetVolume': ('VolumeLevel', '<volume>{volume}</volume>'),
+    'GetMute': ('MuteStatus', '<mute>{mute}</mute>'),
+    'SetMute': ('MuteStatus', '<mute>{mute}</mute>'),
+    'GetFunc': ('CurrentFunc', '<function>{function}</function>'),
+    'SetFunc': ('CurrentFunc', '<function>{function}</function>'),
+    'SetAlarmInfo': ('AlarmInfo', ''),
+}
+
+
+def _get_api(failing=(), **kwargs):
+    state = {'volume': 5, 'mute': 'off', 'function': 'wifi'}
+
+    def handler(command, action, payload):
+        for name, value in re.findall(r'name="(\w+)" val="([^"]*)"', payload):
+            state[name] = value
+
+        method, response = RESPONSES[action]
+
+        return uic_response(method, response.format(**state), 'ng' if action in failing else 'ok')
+
+    transport = FakeTransport(handler, pipelining=kwargs.pop('speaker_pipelining', True))
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, **kwargs)
+
+    return (api, transport)
+
+
+class TestApiPipeline(unittest.TestCase):
+
+    def test_send_pipelined(self):
+        api, transport = _get_api(pipelining=True)
+
+        with patch.object(transport, 'request_pipelined', wraps=transport.request_pipelined) as request_pipelined:
+            results = api.pipeline().call('SetVolume', 10).call('SetMute', True).call('GetVolume').send()
+
+        self.assertEqual(results, [{'volume': '10'}, {'mute': 'on'}, 10])
+        request_pipelined.assert_called_once()
+        self.assertEqual(len(request_pipelined.call_args[0][2]), 3)
+        self.assertEqual([re.search(r'<name>(\w+)</name>', request[3]).group(1) for request in transport.requests],
+                         ['SetVolume', 'SetMute', 'GetVolume'])
+        self.assertTrue(api.pipelining)
+        self.assertEqual({action: stats['calls'] for action, stats in api.api_stats.stats()['192.168.1.129'].items()},
+                         {'SetVolume': 1, 'SetMute': 1, 'GetVolume': 1})
+
+    def test_send_sequential_by_default(self):
+        api, transport = _get_api()
+
+        with patch.object(transport, 'request_pipelined') as request_pipelined:
+            results = api.pipeline().call('SetVolume', 10).call('GetMute').send()
+
+        self.assertEqual(results, [{'volume': '10'}, False])
+        request_pipelined.assert_not_called()
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_send_empty_pipeline(self):
+        api, transport = _get_api(pipelining=True)
+
+        self.assertEqual(api.pipeline().send(), [])
+        self.assertEqual(transport.requests, [])
+
+    def test_send_falls_back_to_sequential_when_speaker_does_not_pipeline(self):
+        api, transport = _get_api(pipelining=True, speaker_pipelining=False)
+
+        results = api.pipeline().call('SetVolume', 10).call('SetMute', True).call('SetFunc', 'aux').send()
+
+        self.assertEqual(results, [{'volume': '10'}, {'mute': 'on'}, {'function': 'aux'}])
+        self.assertEqual([request[2] for request in transport.requests], ['UIC', 'UIC', 'UIC'])
+        self.assertFalse(api.pipelining)
+
+        with patch.object(transport, 'request_pipelined') as request_pipelined:
+            api.pipeline().call('SetVolume', 11).call('SetMute', False).send()
+
+        request_pipelined.assert_not_called()
+
+    def test_send_interrupted_pipeline_resends_only_get_requests(self):
+        api, transport = _get_api(pipelining=True)
+        interrupted = PipelineInterruptedException('Timed out', [uic_response('VolumeLevel', '<volume>10</volume>')])
+
+        with patch.object(transport, 'request_pipelined', side_effect=interrupted):
+            pipeline = api.pipeline().call('SetVolume', 10).call('SetMute', True).call('GetFunc')
+
+            with self.assertRaises(SamsungMultiroomApiException) as context:
+                pipeline.send()
+
+        self.assertIs(context.exception.__cause__, interrupted)
+        self.assertEqual([re.search(r'<name>(\w+)</name>', request[3]).group(1) for request in transport.requests],
+                         ['GetFunc'])
+        self.assertEqual(api.known_state.get('volume'), '10')
+        self.assertFalse(api.pipelining)
+
+    def test_send_skips_redundant_writes(self):
+        api, transport = _get_api(pipelining=True, known_state=KnownState(skip_redundant=True))
+
+        api.get_volume()
+        results = api.pipeline().call('SetVolume', 5).call('SetVolume', 5, force=True).send()
+
+        self.assertEqual(results, [{}, {'volume': '5'}])
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_send_updates_known_state_and_invalidates_cache(self):
+        api, transport = _get_api(pipelining=True, cache=ApiCache(ttl={'GetFunc': 60}))
+
+        self.assertEqual(api.call('GetFunc')['function'], 'wifi')
+
+        api.pipeline().call('SetVolume', 10).call('SetFunc', 'aux').send()
+
+        self.assertEqual(api.known_state.get('volume'), '10')
+        self.assertEqual(api.call('GetFunc')['function'], 'aux')
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_send_get(self):
+        api, transport = _get_api(pipelining=True)
+
+        results = api.pipeline() \
+            .get(COMMAND_UIC, 'SetAlarmInfo', [('index', 0), ('hour', 7)]) \
+            .call('SetVolume', 10) \
+            .send()
+
+        self.assertEqual(results, [{}, {'volume': '10'}])
+        self.assertIn('<name>SetAlarmInfo</name>', transport.requests[0][3])
+
+    def test_send_unsuccessful_response_raises_exception_after_all_calls(self):
+        api, transport = _get_api(failing=('SetMute', ), pipelining=True)
+
+        pipeline = api.pipeline().call('SetVolume', 10).call('SetMute', True).call('SetFunc', 'aux')
+
+        self.assertRaises(SamsungMultiroomApiException, pipeline.send)
+        self.assertEqual(len(transport.requests), 3)
+        self.assertEqual(api.known_state.get('function'), 'aux')
+        self.assertTrue(api.pipelining)
+
+    def test_send_transport_failure_raises_exception(self):
+        transport = MagicMock()
+        transport.request_pipelined.side_effect = TransportException()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, pipelining=True,
+                                  circuit_breaker=CircuitBreaker())
+
+        self.assertRaises(SamsungMultiroomApiException, api.pipeline().call('SetVolume', 10).call('SetMute', True).send)
+        self.assertEqual(api.circuit_breaker.stats()['failures'], 1)
+        self.assertEqual(api.scheduler.stats()['running'], 0)
+
+    def test_call_unknown_action_raises_exception(self):
+        api, _ = _get_api()
+
+        self.assertRaises(ValueError, api.pipeline().call, 'Unknown')
+
+    def test_len(self):
+        pipeline = ApiPipeline(MagicMock())
+
+        self.assertEqual(len(pipeline.call('SetVolume', 10).call('GetMute')), 2)
@@ -0,0 +1,119 @@
+import unittest
+
+from samsung_multiroom.api import Record
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import parse_duration
+from samsung_multiroom.api.api_records import MenuItem
+from samsung_multiroom.api.api_records import MusicItem
+from samsung_multiroom.api.transport import FakeTransport
+
+MUSIC_LIST_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<UIC>
+    <method>PCMusicList</method>
+    <version>1.0</version>
+    <speakerip>192.168.1.129</speakerip>
+    <user_identifier>public</user_identifier>
+    <response result="ok">
+        <listcount>2</listcount>
+        <musiclist>
+            <music object_id="22$@52941">
+                <type>AUDIO</type>
+                <playindex>0</playindex>
+                <name><![CDATA[La femme d'argent.mp3]]></name>
+                <title><![CDATA[La femme d'argent]]></title>
+                <artist><![CDATA[Air]]></artist>
+                <album><![CDATA[Moon Safari]]></album>
+                <thumbnail />
+                <timelength>0:07:11.000</timelength>
+                <device_udn>uuid:00113249-398f-0011-8f39-8f3949321100</device_udn>
+            </music>
+            <music object_id="22$@52942">
+                <type>AUDIO</type>
+                <playindex>1</playindex>
+                <name><![CDATA[Sexy boy.mp3]]></name>
+                <title><![CDATA[Sexy boy]]></title>
+                <artist><![CDATA[Air]]></artist>
+                <album><![CDATA[Moon Safari]]></album>
+                <thumbnail />
+                <timelength>0:04:58.000</timelength>
+                <device_udn>uuid:00113249-398f-0011-8f39-8f3949321100</device_udn>
+            </music>
+        </musiclist>
+    </response>
+</UIC>"""
+
+
+class TestRecord(unittest.TestCase):
+
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration('0:07:11.000'), 431)
+        self.assertEqual(parse_duration('1:00:00.900'), 3600)
+        self.assertEqual(parse_duration(431), 431)
+
+    def test_from_dict(self):
+        record = MusicItem.from_dict({
+            '@object_id': '22$@52941',
+            'type': 'AUDIO',
+            'playindex': '-1',
+            'name': None,
+            'timelength': '0:07:11.000',
+        })
+
+        self.assertIsInstance(record, Record)
+        self.assertEqual(record.object_id, '22$@52941')
+        self.assertEqual(record.playindex, -1)
+        self.assertEqual(record.timelength, 431)
+        self.assertIsNone(record.name)
+        self.assertIsNone(record.artist)
+
+    def test_from_dict_keeps_invalid_values(self):
+        record = MenuItem.from_dict({'tracklength': 'unknown'})
+
+        self.assertEqual(record['tracklength'], 'unknown')
+
+    def test_mapping(self):
+        record = MenuItem.from_dict({'@type': '1', 'title': 'Song', 'tracklength': '215', 'extra': 'value'})
+
+        self.assertEqual(record['@type'], '1')
+        self.assertEqual(record['tracklength'], 215)
+        self.assertEqual(record['extra'], 'value')
+        self.assertIn('title', record)
+        self.assertIn('extra', record)
+        self.assertNotIn('artist', record)
+        self.assertNotIn('unknown', record)
+        self.assertRaises(KeyError, record.__getitem__, 'artist')
+        self.assertRaises(KeyError, record.__getitem__, 'unknown')
+        self.assertEqual(record.get('artist', 'Unknown'), 'Unknown')
+        self.assertEqual(record.keys(), ['@type', 'title', 'tracklength', 'extra'])
+        self.assertEqual(len(record), 4)
+        self.assertEqual(record, {'@type': '1', 'title': 'Song', 'tracklength': 215, 'extra': 'value'})
+
+    def test_no_instance_dict(self):
+        record = MenuItem.from_dict({'title': 'Song'})
+
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_api_records(self):
+        transport = FakeTransport()
+        transport.add_response('PCGetMusicListByID', MUSIC_LIST_RESPONSE)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, records=True)
+        music_list = api.pc_get_music_list_by_id('uuid:00113249-398f-0011-8f39-8f3949321100', '22$30224', 0, 20)
+
+        self.assertEqual(len(music_list), 2)
+        self.assertIsInstance(music_list[0], MusicItem)
+        self.assertEqual(music_list[0].object_id, '22$@52941')
+        self.assertEqual(music_list[0].playindex, 0)
+        self.assertEqual(music_list[0].timelength, 431)
+        self.assertEqual(music_list[1]['title'], 'Sexy boy')
+        self.assertNotIn('thumbnail', music_list[1])
+
+    def test_api_dicts_by_default(self):
+        transport = FakeTransport()
+        transport.add_response('PCGetMusicListByID', MUSIC_LIST_RESPONSE)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        music_list = api.pc_get_music_list_by_id('uuid:00113249-398f-0011-8f39-8f3949321100', '22$30224', 0, 20)
+
+        self.assertEqual(music_list[0]['timelength'], '0:07:11.000')
+        self.assertNotIsInstance(music_list[0], Record)
@@ -1,6 +1,13 @@
+import glob
+import os
 import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api.api_parser import parse_expat
+
+CORPUS = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'benchmarks', 'corpus', '*.xml')
 
 
 class TestApiResponse(unittest.TestCase):
@@ -70,3 +77,64 @@ class TestApiResponse(unittest.TestCase):
         self.assertEqual(response.name, None)
         self.assertEqual(response.user, None)
         self.assertEqual(response.data, None)
+
+    @patch('samsung_multiroom.api.api_response.get_parser')
+    def test_lazy_parses_body_on_data_access(self, get_parser):
+        parse = MagicMock(side_effect=parse_expat)
+        get_parser.return_value = parse
+
+        response = ApiResponse("""<?xml version="1.0" encoding="UTF-8"?>
+            <CPM>
+                <method>RadioPlayList</method>
+                <version>0.1</version>
+                <speakerip>192.168.1.129</speakerip>
+                <user_identifier>public&amp;co</user_identifier>
+                <response result='ok'>
+                    <cpname>TuneIn</cpname>
+                </response>
+            </CPM>""")
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.name, 'RadioPlayList')
+        self.assertEqual(response.user, 'public&co')
+        parse.assert_not_called()
+
+        self.assertEqual(response.data, {'cpname': 'TuneIn'})
+        self.assertEqual(response.data, {'cpname': 'TuneIn'})
+        parse.assert_called_once()
+
+    def test_lazy_malformed_body_fails_on_data_access(self):
+        response = ApiResponse("""<?xml version="1.0" encoding="UTF-8"?>
+            <UIC>
+                <method>VolumeLevel</method>
+                <version>1.0</version>
+                <speakerip>192.168.1.129</speakerip>
+                <user_identifier />
+                <response result="ok">
+                    <volume>10</vol""")
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.name, 'VolumeLevel')
+
+        self.assertIsNone(response.data)
+        self.assertFalse(response.success)
+        self.assertIsNone(response.name)
+
+    def test_not_lazy_malformed_body_fails(self):
+        response = ApiResponse("""<UIC><method>VolumeLevel</method><user_identifier />
+            <response result="ok"><volume>10</vol""", lazy=False)
+
+        self.assertFalse(response.success)
+        self.assertIsNone(response.name)
+
+    def test_lazy_header_matches_parsed_corpus(self):
+        for path in glob.glob(CORPUS):
+            with open(path) as corpus_file:
+                response_text = corpus_file.read()
+
+            with self.subTest(path=os.path.basename(path)):
+                lazy = ApiResponse(response_text)
+                eager = ApiResponse(response_text, lazy=False)
+
+                self.assertEqual((lazy.name, lazy.user, lazy.success), (eager.name, eager.user, eager.success))
+                self.assertEqual(lazy.data, eager.data)
@@ -0,0 +1,140 @@
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import RetryPolicy
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import TransportException
+
+from .helpers import FakeClock
+from .helpers import uic_response
+
+
+def _get_retry_policy(**kwargs):
+    clock = FakeClock()
+
+    retry_policy = RetryPolicy(clock=clock, sleep=clock.sleep, rand=lambda: 1, **kwargs)
+
+    return (retry_policy, clock)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_invalid_attempts_raises_exception(self):
+        self.assertRaises(ValueError, RetryPolicy, attempts=0)
+
+    def test_run_retries_until_success(self):
+        retry_policy, clock = _get_retry_policy(attempts=3, base_delay=0.1, max_delay=1)
+        load = MagicMock(side_effect=[ValueError(), ValueError(), 10])
+
+        result = retry_policy.run(load, lambda exception: True)
+
+        self.assertEqual(result, 10)
+        self.assertEqual(load.call_count, 3)
+        self.assertAlmostEqual(clock.now, 0.3)
+        self.assertEqual(retry_policy.stats()['retries'], 2)
+        self.assertEqual(retry_policy.stats()['recovered'], 1)
+
+    def test_run_gives_up_after_attempts(self):
+        retry_policy, _ = _get_retry_policy(attempts=2)
+        load = MagicMock(side_effect=ValueError())
+
+        self.assertRaises(ValueError, retry_policy.run, load, lambda exception: True)
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(retry_policy.stats()['exhausted'], 1)
+
+    def test_run_does_not_retry_non_retryable(self):
+        retry_policy, _ = _get_retry_policy()
+        load = MagicMock(side_effect=ValueError())
+
+        self.assertRaises(ValueError, retry_policy.run, load, lambda exception: False)
+        load.assert_called_once()
+        self.assertEqual(retry_policy.stats()['not_retryable'], 1)
+
+    def test_run_gives_up_at_deadline(self):
+        retry_policy, clock = _get_retry_policy(attempts=5, base_delay=1, max_delay=1, deadline=2.5)
+
+        def load(remaining):  # pylint: disable=unused-argument
+            clock.now += 0.5
+            raise ValueError()
+
+        self.assertRaises(ValueError, retry_policy.run, load, lambda exception: True)
+        self.assertEqual(retry_policy.stats()['retries'], 1)
+        self.assertEqual(retry_policy.stats()['deadline_exceeded'], 1)
+
+    def test_run_passes_time_left_until_deadline(self):
+        retry_policy, clock = _get_retry_policy(attempts=3, base_delay=0.5, max_delay=1, deadline=5)
+        remainings = []
+
+        def load(remaining):
+            remainings.append(remaining)
+            clock.now += 1
+            raise ValueError()
+
+        self.assertRaises(ValueError, retry_policy.run, load, lambda exception: True)
+        self.assertEqual(remainings, [5, 3.5, 1.5])
+
+    def test_run_caps_delay(self):
+        retry_policy, clock = _get_retry_policy(attempts=4, base_delay=0.5, max_delay=1, deadline=10)
+
+        self.assertRaises(ValueError, retry_policy.run, MagicMock(side_effect=ValueError()), lambda exception: True)
+
+        # 0.5 + 1 + 1
+        self.assertAlmostEqual(clock.now, 2.5)
+
+    def test_run_jitters_delay(self):
+        clock = FakeClock()
+        retry_policy = RetryPolicy(attempts=2, base_delay=1, clock=clock, sleep=clock.sleep, rand=lambda: 0.25)
+
+        retry_policy.run(MagicMock(side_effect=[ValueError(), 10]), lambda exception: True)
+
+        self.assertAlmostEqual(clock.now, 0.25)
+
+    def test_api_retries_get_requests(self):
+        transport = MagicMock()
+        transport.request.side_effect = [
+            TransportException(),
+            '<UIC><truncated',
+            uic_response('VolumeLevel', '<volume>10</volume>'),
+        ]
+
+        retry_policy, _ = _get_retry_policy(attempts=3)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, retry_policy=retry_policy)
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertEqual(transport.request.call_count, 3)
+
+    def test_api_caps_timeout_at_deadline(self):
+        transport = MagicMock()
+        transport.request.side_effect = [
+            TransportException(),
+            uic_response('VolumeLevel', '<volume>10</volume>'),
+        ]
+
+        retry_policy, clock = _get_retry_policy(attempts=2, base_delay=0.5, deadline=3)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, retry_policy=retry_policy)
+
+        self.assertEqual(api.get_volume(), 10)
+        self.assertEqual(transport.request.call_args_list[0][0][4], 3)
+        self.assertEqual(transport.request.call_args_list[1][0][4], 3 - clock.now)
+
+    def test_api_does_not_retry_set_requests(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        retry_policy, _ = _get_retry_policy(attempts=3)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, retry_policy=retry_policy)
+
+        self.assertRaises(SamsungMultiroomApiException, api.set_volume, 10)
+        transport.request.assert_called_once()
+        self.assertEqual(retry_policy.stats()['calls'], 0)
+
+    def test_api_does_not_retry_error_responses(self):
+        transport = MagicMock()
+        transport.request.return_value = uic_response('VolumeLevel', '', result='ng')
+
+        retry_policy, _ = _get_retry_policy(attempts=3)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, retry_policy=retry_policy)
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+        transport.request.assert_called_once()
@@ -0,0 +1,187 @@
+import threading
+import time
+import unittest
+
+from samsung_multiroom.api import LANE_BULK
+from samsung_multiroom.api import LANE_INTERACTIVE
+from samsung_multiroom.api import CommandScheduler
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api.transport import FakeTransport
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 1
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestCommandScheduler(unittest.TestCase):
+
+    def test_invalid_concurrency_raises_exception(self):
+        self.assertRaises(ValueError, CommandScheduler, 0)
+
+    def test_invalid_weights_raises_exception(self):
+        self.assertRaises(ValueError, CommandScheduler, weights={LANE_INTERACTIVE: 1})
+        self.assertRaises(ValueError, CommandScheduler, weights={LANE_INTERACTIVE: 1, LANE_BULK: 0})
+
+    def test_get_lane(self):
+        scheduler = CommandScheduler()
+
+        self.assertEqual(scheduler.get_lane('SetPlaybackControl'), LANE_INTERACTIVE)
+        self.assertEqual(scheduler.get_lane('PCGetMusicListByID'), LANE_BULK)
+
+        with scheduler.lane(LANE_BULK):
+            self.assertEqual(scheduler.get_lane('SetPlaybackControl'), LANE_BULK)
+
+            with scheduler.lane(LANE_INTERACTIVE):
+                self.assertEqual(scheduler.get_lane('PCGetMusicListByID'), LANE_INTERACTIVE)
+
+        self.assertEqual(scheduler.get_lane('SetPlaybackControl'), LANE_INTERACTIVE)
+
+    def test_invalid_lane_raises_exception(self):
+        scheduler = CommandScheduler()
+
+        with self.assertRaises(ValueError):
+            with scheduler.lane('invalid'):
+                pass
+
+    def test_run(self):
+        scheduler = CommandScheduler()
+
+        self.assertEqual(scheduler.run('GetVolume', lambda: 10), 10)
+
+        stats = scheduler.stats()
+        self.assertEqual(stats['running'], 0)
+        self.assertEqual(stats[LANE_INTERACTIVE]['calls'], 1)
+        self.assertEqual(stats[LANE_BULK]['calls'], 0)
+
+    def test_run_serves_lanes_fairly(self):
+        scheduler = CommandScheduler(concurrency=1, weights={LANE_INTERACTIVE: 2, LANE_BULK: 1})
+        release = threading.Event()
+        order = []
+
+        def call(action, name):
+            def load():
+                if name == 'blocker':
+                    release.wait(1)
+                order.append(name)
+
+            thread = threading.Thread(target=scheduler.run, args=(action, load))
+            thread.start()
+            return thread
+
+        threads = [call('GetVolume', 'blocker')]
+        _wait_for(lambda: scheduler.stats()['running'] == 1)
+
+        queued = [('GetDmsList', 'b1'), ('GetDmsList', 'b2'), ('GetDmsList', 'b3'), ('GetVolume', 'i1'),
+                  ('GetVolume', 'i2'), ('GetVolume', 'i3'), ('GetVolume', 'i4')]
+
+        for index, (action, name) in enumerate(queued):
+            threads.append(call(action, name))
+            _wait_for(lambda index=index: sum([scheduler.stats()[lane]['depth'] for lane in
+                                               (LANE_INTERACTIVE, LANE_BULK)]) == index + 1)
+
+        self.assertEqual(scheduler.stats()[LANE_BULK]['depth'], 3)
+        self.assertEqual(scheduler.stats()[LANE_INTERACTIVE]['depth'], 4)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, ['blocker', 'i1', 'b1', 'i2', 'i3', 'b2', 'i4', 'b3'])
+
+        stats = scheduler.stats()
+        self.assertEqual(stats[LANE_BULK]['max_depth'], 3)
+        self.assertEqual(stats[LANE_INTERACTIVE]['max_depth'], 4)
+        self.assertEqual(stats[LANE_BULK]['depth'], 0)
+        self.assertGreater(stats[LANE_BULK]['max_wait_time'], 0)
+
+    def test_run_respects_concurrency(self):
+        scheduler = CommandScheduler(concurrency=2)
+        release = threading.Event()
+
+        threads = [threading.Thread(target=scheduler.run, args=('GetVolume', lambda: release.wait(1)))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+
+        _wait_for(lambda: scheduler.stats()[LANE_INTERACTIVE]['depth'] == 1)
+
+        self.assertEqual(scheduler.stats()['running'], 2)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_run_releases_slot_on_exception(self):
+        scheduler = CommandScheduler()
+
+        def load():
+            raise ValueError()
+
+        self.assertRaises(ValueError, scheduler.run, 'GetVolume', load)
+        self.assertEqual(scheduler.run('GetVolume', lambda: 10), 10)
+
+    def test_slot(self):
+        scheduler = CommandScheduler(concurrency=1)
+        started = threading.Event()
+
+        with scheduler.slot('PCGetMusicListByID'):
+            thread = threading.Thread(target=lambda: scheduler.run('GetVolume', started.set))
+            thread.start()
+
+            _wait_for(lambda: scheduler.stats()[LANE_INTERACTIVE]['depth'])
+            self.assertFalse(started.is_set())
+
+        thread.join()
+
+        self.assertTrue(started.is_set())
+        self.assertEqual(scheduler.stats()[LANE_BULK]['calls'], 1)
+
+    def test_slot_is_reentrant_in_holding_thread(self):
+        scheduler = CommandScheduler(concurrency=1)
+        finished = threading.Event()
+
+        def consume():
+            with scheduler.slot('PCGetMusicListByID'):
+                scheduler.run('GetVolume', lambda: None)
+            finished.set()
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        thread.join(1)
+
+        self.assertTrue(finished.is_set())
+        self.assertEqual(scheduler.stats()['running'], 0)
+        self.assertEqual(scheduler.stats()[LANE_INTERACTIVE]['calls'], 1)
+
+    def test_spare_slot(self):
+        scheduler = CommandScheduler(concurrency=2)
+
+        with scheduler.slot('GetVolume'):
+            with scheduler.spare_slot('GetVolume') as acquired:
+                self.assertTrue(acquired)
+                self.assertEqual(scheduler.stats()['running'], 2)
+
+                with scheduler.spare_slot('GetVolume') as acquired:
+                    self.assertFalse(acquired)
+                    self.assertEqual(scheduler.stats()['running'], 2)
+
+        self.assertEqual(scheduler.stats()['running'], 0)
+        self.assertEqual(scheduler.stats()[LANE_INTERACTIVE]['calls'], 2)
+
+    def test_api_uses_scheduler(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', '<?xml version="1.0" encoding="UTF-8"?><UIC><method>VolumeLevel</method>'
+                               '<version>1.0</version><speakerip>192.168.1.129</speakerip>'
+                               '<user_identifier>public</user_identifier>'
+                               '<response result="ok"><volume>10</volume></response></UIC>')
+
+        scheduler = CommandScheduler()
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, scheduler=scheduler)
+
+        with scheduler.lane(LANE_BULK):
+            api.get_volume()
+
+        self.assertIs(api.scheduler, scheduler)
+        self.assertEqual(scheduler.stats()[LANE_BULK]['calls'], 1)
@@ -0,0 +1,99 @@
+import re
+import unittest
+from unittest.mock import patch
+
+import httpretty
+
+from samsung_multiroom.api import ApiSession
+from samsung_multiroom.api import SamsungMultiroomApi
+
+
+def _register_uri():
+    httpretty.register_uri(
+        httpretty.GET,
+        re.compile(r'http://192.168.1.129:55001/.*'),
+        body="""<?xml version="1.0" encoding="UTF-8"?>
+            <UIC>
+                <method>VolumeLevel</method>
+                <version>1.0</version>
+                <speakerip>192.168.1.129</speakerip>
+                <user_identifier>public</user_identifier>
+                <response result="ok">
+                    <volume>10</volume>
+                </response>
+            </UIC>"""
+    )
+
+
+class TestApiSession(unittest.TestCase):
+
+    def test_invalid_pool_size_raises_exception(self):
+        self.assertRaises(ValueError, ApiSession, 0)
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_get_reuses_session(self):
+        _register_uri()
+
+        session = ApiSession()
+        response1 = session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume', timeout=5)
+        response2 = session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume', timeout=5)
+
+        self.assertIn('<volume>10</volume>', response1.text)
+        self.assertIn('<volume>10</volume>', response2.text)
+
+        stats = session.stats()
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['sessions'], 1)
+        self.assertEqual(stats['evictions'], 0)
+
+    @httpretty.activate(allow_net_connect=False)
+    @patch('time.monotonic')
+    def test_idle_session_is_evicted(self, monotonic):
+        _register_uri()
+
+        session = ApiSession(idle_timeout=30)
+
+        monotonic.return_value = 100
+        session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume')
+        monotonic.return_value = 120
+        session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume')
+        monotonic.return_value = 151
+        session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume')
+
+        stats = session.stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['sessions'], 2)
+        self.assertEqual(stats['evictions'], 1)
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_close(self):
+        _register_uri()
+
+        session = ApiSession()
+        session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume')
+        session.close()
+        session.get('http://192.168.1.129:55001/UIC?cmd=GetVolume')
+
+        stats = session.stats()
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['sessions'], 2)
+        self.assertEqual(stats['evictions'], 0)
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_api_streams_through_session(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            re.compile(r'http://192.168.1.129:55001/.*'),
+            body=('<?xml version="1.0" encoding="UTF-8"?><UIC><method>PCMusicList</method><version>1.0</version>'
+                  '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+                  '<response result="ok"><listcount>2</listcount><musiclist><music><playindex>0</playindex></music>'
+                  '<music><playindex>1</playindex></music></musiclist></response></UIC>')
+        )
+
+        session = ApiSession()
+        api = SamsungMultiroomApi('public', '192.168.1.129', session=session)
+
+        items = list(api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20))
+
+        self.assertEqual([item['playindex'] for item in items], ['0', '1'])
+        self.assertEqual(session.stats()['requests'], 1)
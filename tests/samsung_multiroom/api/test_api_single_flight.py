@@ -0,0 +1,173 @@
+import threading
+import time
+import unittest
+
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api import SingleFlight
+from samsung_multiroom.api.transport import FakeTransport
+
+from .helpers import uic_response
+
+
+def _run_concurrently(target, count):
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as exception:  # pylint: disable=broad-except
+            results[index] = exception
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+
+    return (threads, results)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_do_shares_in_flight_call(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(1)
+            return {'volume': '10'}
+
+        single_flight = SingleFlight()
+
+        threads, results = _run_concurrently(lambda: single_flight.do('key', load), 1)
+        started.wait(1)
+        more_threads, more_results = _run_concurrently(lambda: single_flight.do('key', load), 4)
+
+        while single_flight.stats()['shared'] < 4:
+            time.sleep(0.001)
+
+        release.set()
+        for thread in threads + more_threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results + more_results, [{'volume': '10'}] * 5)
+        self.assertEqual(single_flight.stats(), {'calls': 1, 'shared': 4})
+
+    def test_do_shares_exception(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def load():
+            started.set()
+            release.wait(1)
+            raise ValueError('failed')
+
+        single_flight = SingleFlight()
+
+        threads, results = _run_concurrently(lambda: single_flight.do('key', load), 1)
+        started.wait(1)
+        more_threads, more_results = _run_concurrently(lambda: single_flight.do('key', load), 2)
+
+        while single_flight.stats()['shared'] < 2:
+            time.sleep(0.001)
+
+        release.set()
+        for thread in threads + more_threads:
+            thread.join()
+
+        for result in results + more_results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_do_shares_result_unaffected_by_leader(self):
+        started = threading.Event()
+        release = threading.Event()
+        modified = threading.Event()
+
+        class Result(dict):
+
+            def __deepcopy__(self, memo):
+                # give the leader a chance to modify its result before it is copied
+                modified.wait(0.1)
+                return dict(self)
+
+        def load():
+            started.set()
+            release.wait(1)
+            return Result(volume='10')
+
+        single_flight = SingleFlight()
+
+        def lead():
+            result = single_flight.do('key', load)
+            result['volume'] = '20'
+            modified.set()
+            return result
+
+        threads, results = _run_concurrently(lead, 1)
+        started.wait(1)
+        more_threads, more_results = _run_concurrently(lambda: single_flight.do('key', load), 2)
+
+        while single_flight.stats()['shared'] < 2:
+            time.sleep(0.001)
+
+        release.set()
+        for thread in threads + more_threads:
+            thread.join()
+
+        self.assertEqual(results, [{'volume': '20'}])
+        self.assertEqual(more_results, [{'volume': '10'}] * 2)
+
+    def test_do_calls_again_once_finished(self):
+        single_flight = SingleFlight()
+
+        self.assertEqual(single_flight.do('key', lambda: 1), 1)
+        self.assertEqual(single_flight.do('key', lambda: 2), 2)
+        self.assertEqual(single_flight.stats(), {'calls': 2, 'shared': 0})
+
+    def test_api_coalesces_get_requests(self):
+        release = threading.Event()
+
+        def handler(command, action, payload):
+            release.wait(1)
+            return uic_response('VolumeLevel', '<volume>10</volume>')
+
+        transport = FakeTransport(handler)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        threads, results = _run_concurrently(api.get_volume, 5)
+
+        while api.single_flight.stats()['calls'] + api.single_flight.stats()['shared'] < 5:
+            time.sleep(0.001)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [10] * 5)
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_api_does_not_coalesce_set_requests(self):
+        release = threading.Event()
+
+        def handler(command, action, payload):
+            release.wait(1)
+            return uic_response('VolumeLevel', '<volume>10</volume>')
+
+        transport = FakeTransport(handler)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        threads, _ = _run_concurrently(lambda: api.set_volume(10), 3)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_api_shares_failure(self):
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport())
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
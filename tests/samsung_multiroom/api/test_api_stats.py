@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import ApiStats
+from samsung_multiroom.api import ApiStream
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.api.transport import TransportException
+
+from .helpers import uic_response
+
+
+class TestApiStats(unittest.TestCase):
+
+    def test_invalid_buckets_raise_exception(self):
+        self.assertRaises(ValueError, ApiStats, buckets=())
+        self.assertRaises(ValueError, ApiStats, buckets=(0.1, 0.05))
+
+    def test_record(self):
+        api_stats = ApiStats(buckets=(0.1, 0.5, 1))
+
+        for latency in [0.05, 0.05, 0.2, 0.3, 0.4, 0.6, 0.7, 0.8, 0.9, 2]:
+            api_stats.record('192.168.1.129', 'GetVolume', latency, 10, 100)
+
+        api_stats.record('192.168.1.129', 'GetVolume', 5, 10, error=True)
+        api_stats.record('192.168.1.129', 'VolumeLevel', bytes_in=50)
+
+        stats = api_stats.stats()['192.168.1.129']
+
+        self.assertEqual(stats['GetVolume']['calls'], 11)
+        self.assertEqual(stats['GetVolume']['errors'], 1)
+        self.assertEqual(stats['GetVolume']['bytes_out'], 110)
+        self.assertEqual(stats['GetVolume']['bytes_in'], 1000)
+        self.assertEqual(stats['GetVolume']['histogram'], [(0.1, 2), (0.5, 3), (1, 4), (float('inf'), 2)])
+        self.assertAlmostEqual(stats['GetVolume']['latency_mean'], 11 / 11)
+        self.assertEqual(stats['GetVolume']['latency_max'], 5)
+        self.assertEqual(stats['GetVolume']['p50'], 1)
+        self.assertEqual(stats['GetVolume']['p95'], float('inf'))
+
+        self.assertEqual(stats['VolumeLevel']['calls'], 1)
+        self.assertEqual(stats['VolumeLevel']['bytes_in'], 50)
+        self.assertIsNone(stats['VolumeLevel']['latency_mean'])
+        self.assertIsNone(stats['VolumeLevel']['p50'])
+
+    def test_record_speakers_separately(self):
+        api_stats = ApiStats()
+
+        api_stats.record('192.168.1.129', 'GetVolume', 0.1)
+        api_stats.record('192.168.1.130', 'GetVolume', 0.1)
+
+        self.assertEqual(set(api_stats.stats()), {'192.168.1.129', '192.168.1.130'})
+
+    def test_reset(self):
+        api_stats = ApiStats()
+        api_stats.record('192.168.1.129', 'GetVolume', 0.1)
+
+        api_stats.reset()
+
+        self.assertEqual(api_stats.stats(), {})
+
+    def test_api_records_calls(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+        transport.add_response('GetMute', uic_response('MuteStatus', '<mute>on</mute>', result='ng'))
+
+        api_stats = ApiStats()
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, api_stats=api_stats)
+
+        api.get_volume()
+        self.assertRaises(SamsungMultiroomApiException, api.get_mute)
+
+        stats = api.api_stats.stats()['192.168.1.129']
+
+        self.assertIs(api.api_stats, api_stats)
+        self.assertEqual(stats['GetVolume']['calls'], 1)
+        self.assertEqual(stats['GetVolume']['errors'], 0)
+        self.assertEqual(stats['GetVolume']['bytes_out'], len('/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E'))
+        self.assertEqual(stats['GetVolume']['bytes_in'], len(uic_response('VolumeLevel', '<volume>10</volume>')))
+        self.assertEqual(sum(count for _, count in stats['GetVolume']['histogram']), 1)
+        self.assertEqual((stats['GetMute']['calls'], stats['GetMute']['errors']), (1, 1))
+
+    def test_api_records_transport_failures(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertRaises(SamsungMultiroomApiException, api.set_volume, 10)
+
+        stats = api.api_stats.stats()['192.168.1.129']['SetVolume']
+        self.assertEqual((stats['calls'], stats['errors'], stats['bytes_in']), (1, 1, 0))
+
+    def test_api_records_raw_requests(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        api.request('get', 'UIC', '<name>GetVolume</name>')
+
+        self.assertEqual(api.api_stats.stats()['192.168.1.129']['GetVolume']['calls'], 1)
+
+    def test_stream_records_messages(self):
+        transport = FakeTransport()
+        transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+        transport.push('<UIC><truncated')
+        transport.push(uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api_stats = ApiStats()
+        stream = ApiStream('public', '192.168.1.129', transport=transport, api_stats=api_stats)
+
+        for response in stream.open('/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E'):
+            if response.name == 'VolumeLevel':
+                stream.close()
+
+        stats = api_stats.stats()['192.168.1.129']
+
+        self.assertEqual(list(stats.keys()), ['GetMainInfo'])
+        self.assertEqual(stats['GetMainInfo']['calls'], 1)
+        self.assertEqual(stats['GetMainInfo']['bytes_out'], len('/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E'))
+
+        self.assertEqual(api_stats.message_stats(), {'192.168.1.129': {
+            'RequestDeviceInfo': {'messages': 1, 'bytes_in': len(uic_response('RequestDeviceInfo', ''))},
+            'VolumeLevel': {'messages': 1, 'bytes_in': len(uic_response('VolumeLevel', '<volume>10</volume>'))},
+        }})
+
+        api_stats.reset()
+
+        self.assertEqual(api_stats.message_stats(), {})
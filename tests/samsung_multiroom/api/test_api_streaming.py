@@ -0,0 +1,203 @@
+import re
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import CircuitBreaker
+from samsung_multiroom.api import PageSizer
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api import paginator
+from samsung_multiroom.api.api_records import MusicItem
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.api.transport import TransportException
+
+MUSIC = """<music object_id="22$@{0}">
+    <type>AUDIO</type>
+    <playindex>{0}</playindex>
+    <title><![CDATA[Track {0}]]></title>
+    <timelength>0:04:58.000</timelength>
+</music>"""
+
+
+def _music_list_response(start_index, count, result='ok'):
+    return """<?xml version="1.0" encoding="UTF-8"?>
+<UIC>
+    <method>PCMusicList</method>
+    <version>1.0</version>
+    <speakerip>192.168.1.129</speakerip>
+    <user_identifier>public</user_identifier>
+    <response result="{0}">
+        <listcount>{1}</listcount>
+        <musiclist>{2}</musiclist>
+    </response>
+</UIC>""".format(result, count, ''.join(MUSIC.format(i) for i in range(start_index, start_index + count)))
+
+
+def _get_api(total=3, **kwargs):
+    def handler(command, action, payload):
+        if action != 'PCGetMusicListByID':
+            return None
+
+        start_index = int(re.search(r'name="liststartindex" val="(\d+)"', payload).group(1))
+        list_count = int(re.search(r'name="listcount" val="(\d+)"', payload).group(1))
+
+        return _music_list_response(start_index, max(0, min(list_count, total - start_index)))
+
+    transport = FakeTransport(handler, chunk_size=16)
+    api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, **kwargs)
+
+    return (api, transport)
+
+
+class TestApiStreaming(unittest.TestCase):
+
+    def test_stream(self):
+        api, transport = _get_api()
+
+        items = api.stream('PCGetMusicListByID', 'uuid:00113249', '22$30224', 0, 20)
+
+        self.assertEqual(transport.requests, [])
+
+        self.assertEqual(list(items), api.pc_get_music_list_by_id('uuid:00113249', '22$30224', 0, 20))
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(api.api_stats.stats()['192.168.1.129']['PCGetMusicListByID']['calls'], 2)
+
+    def test_stream_records(self):
+        api, _ = _get_api(records=True)
+
+        items = list(api.stream('PCGetMusicListByID', 'uuid:00113249', '22$30224', 0, 20))
+
+        self.assertEqual(len(items), 3)
+        self.assertIsInstance(items[0], MusicItem)
+        self.assertEqual(items[2].playindex, 2)
+        self.assertEqual(items[2].timelength, 298)
+
+    def test_stream_single_and_no_items(self):
+        api, _ = _get_api(total=1)
+
+        self.assertEqual([item['title'] for item in api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20)],
+                         ['Track 0'])
+        self.assertEqual(list(api.stream('PCGetMusicListByID', 'uuid', '22', 1, 20)), [])
+
+    def test_stream_yields_items_before_response_is_complete(self):
+        response_text = _music_list_response(0, 2)
+        received = []
+
+        def request_chunks(*_):
+            for i in range(0, len(response_text), 16):
+                received.append(i)
+                yield response_text[i:i + 16]
+
+        transport = MagicMock()
+        transport.request_chunks.side_effect = request_chunks
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        items = api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20)
+
+        next(items)
+
+        self.assertLess(received[-1], response_text.index('22$@1'))
+
+    def test_streaming_api(self):
+        api, _ = _get_api(streaming=True)
+
+        items = api.pc_get_music_list_by_id('uuid:00113249', '22$30224', 0, 20)
+
+        self.assertNotIsInstance(items, list)
+        self.assertEqual([item['@object_id'] for item in items], ['22$@0', '22$@1', '22$@2'])
+
+    def test_paginator_streaming_api(self):
+        api, transport = _get_api(total=5, streaming=True, page_sizer=PageSizer(growth=1))
+
+        items = list(paginator(api.pc_get_music_list_by_id, 'uuid:00113249', '22$30224', 0, 2))
+
+        self.assertEqual([item['playindex'] for item in items], ['0', '1', '2', '3', '4'])
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_paginator_streaming_api_yields_items_before_page_is_complete(self):
+        response_text = _music_list_response(0, 2)
+        received = []
+
+        def request_chunks(*_):
+            for i in range(0, len(response_text), 16):
+                received.append(i)
+                yield response_text[i:i + 16]
+
+        transport = MagicMock()
+        transport.request_chunks.side_effect = request_chunks
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, streaming=True)
+        items = paginator(api.pc_get_music_list_by_id, 'uuid:00113249', '22$30224', 0, 2)
+
+        next(items)
+
+        self.assertLess(received[-1], response_text.index('22$@1'))
+
+    def test_stream_unknown_action_raises_exception(self):
+        api, _ = _get_api()
+
+        self.assertRaises(ValueError, api.stream, 'GetVolume')
+        self.assertRaises(ValueError, api.stream, 'Unknown')
+
+    def test_stream_unsuccessful_response_raises_exception(self):
+        transport = FakeTransport(chunk_size=16)
+        transport.add_response('PCGetMusicListByID', _music_list_response(0, 0, result='ng'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertRaises(SamsungMultiroomApiException, list, api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20))
+
+    def test_stream_malformed_response_raises_exception(self):
+        transport = FakeTransport(chunk_size=16)
+        transport.add_response('PCGetMusicListByID', _music_list_response(0, 2)[:-20])
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        items = api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20)
+
+        self.assertEqual(next(items)['playindex'], '0')
+        self.assertEqual(next(items)['playindex'], '1')
+        self.assertRaises(SamsungMultiroomApiException, next, items)
+        self.assertTrue(api.is_available())
+        self.assertEqual(api.api_stats.stats()['192.168.1.129']['PCGetMusicListByID']['errors'], 1)
+
+    def test_stream_transport_failure_raises_exception(self):
+        transport = MagicMock()
+        transport.request_chunks.side_effect = TransportException()
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, circuit_breaker=CircuitBreaker())
+
+        self.assertRaises(SamsungMultiroomApiException, list, api.stream('PCGetMusicListByID', 'uuid', '22', 0, 20))
+        self.assertEqual(api.circuit_breaker.stats()['failures'], 1)
+
+    def test_closed_stream_releases_scheduler(self):
+        api, _ = _get_api()
+
+        items = api.stream('PCGetMusicListByID', 'uuid:00113249', '22$30224', 0, 20)
+        next(items)
+
+        self.assertEqual(api.scheduler.stats()['running'], 1)
+
+        items.close()
+
+        self.assertEqual(api.scheduler.stats()['running'], 0)
+
+    def test_api_calls_while_consuming_stream(self):
+        api, transport = _get_api(streaming=True)
+        transport.add_response('GetVolume', '<?xml version="1.0" encoding="UTF-8"?><UIC><method>VolumeLevel</method>'
+                               '<version>1.0</version><speakerip>192.168.1.129</speakerip>'
+                               '<user_identifier>public</user_identifier>'
+                               '<response result="ok"><volume>10</volume></response></UIC>')
+        volumes = []
+
+        def consume():
+            for _ in paginator(api.pc_get_music_list_by_id, 'uuid:00113249', '22$30224', 0, 20):
+                volumes.append(api.get_volume())
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        thread.join(1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(volumes, [10, 10, 10])
+        self.assertEqual(api.scheduler.stats()['running'], 0)
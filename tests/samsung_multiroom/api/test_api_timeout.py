@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import AdaptiveTimeout
+from samsung_multiroom.api import RetryPolicy
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import TransportException
+
+from .helpers import uic_response
+
+
+class TestAdaptiveTimeout(unittest.TestCase):
+
+    def test_invalid_bounds_raise_exception(self):
+        self.assertRaises(ValueError, AdaptiveTimeout, floor=0)
+        self.assertRaises(ValueError, AdaptiveTimeout, floor=2, ceiling=1)
+
+    def test_get_timeout_without_samples_returns_ceiling(self):
+        timeouts = AdaptiveTimeout(ceiling=5, min_samples=3)
+        timeouts.observe('GetVolume', 0.1)
+        timeouts.observe('GetVolume', 0.1)
+
+        self.assertEqual(timeouts.get_timeout('GetVolume'), 5)
+        self.assertEqual(timeouts.get_timeout('GetSpkName'), 5)
+
+    def test_get_timeout(self):
+        timeouts = AdaptiveTimeout(floor=0.1, ceiling=5, min_samples=1)
+        timeouts.observe('GetVolume', 0.2)
+
+        # srtt 0.2 + 4 * rttvar 0.1
+        self.assertAlmostEqual(timeouts.get_timeout('GetVolume'), 0.6)
+
+        timeouts.observe('GetVolume', 0.2)
+
+        # rttvar 0.75 * 0.1 + 0.25 * 0
+        self.assertAlmostEqual(timeouts.get_timeout('GetVolume'), 0.5)
+
+    def test_get_timeout_is_bounded(self):
+        timeouts = AdaptiveTimeout(floor=0.5, ceiling=5, min_samples=1)
+        timeouts.observe('GetVolume', 0.01)
+        timeouts.observe('GetSpkName', 10)
+
+        self.assertEqual(timeouts.get_timeout('GetVolume'), 0.5)
+        self.assertEqual(timeouts.get_timeout('GetSpkName'), 5)
+
+    def test_backoff_doubles_timeout_until_success(self):
+        timeouts = AdaptiveTimeout(floor=0.1, ceiling=5, min_samples=1)
+        timeouts.observe('GetVolume', 0.2)
+        timeouts.backoff('GetVolume')
+
+        self.assertAlmostEqual(timeouts.get_timeout('GetVolume'), 1.2)
+
+        timeouts.backoff('GetVolume')
+        timeouts.backoff('GetVolume')
+        timeouts.backoff('GetVolume')
+
+        self.assertEqual(timeouts.get_timeout('GetVolume'), 5)
+        self.assertEqual(timeouts.stats()['GetVolume']['backoffs'], 4)
+
+        timeouts.observe('GetVolume', 0.2)
+
+        self.assertLess(timeouts.get_timeout('GetVolume'), 1)
+
+    def test_api_uses_adaptive_timeout_for_get_requests(self):
+        transport = MagicMock()
+        transport.request.return_value = uic_response('VolumeLevel', '<volume>10</volume>')
+
+        timeouts = AdaptiveTimeout(floor=0.5, ceiling=5, min_samples=1)
+        timeouts.observe('GetVolume', 0.01)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, timeouts=timeouts)
+        api.get_volume()
+        api.set_volume(20)
+
+        self.assertEqual(transport.request.call_args_list[0][0][4], 0.5)
+        self.assertEqual(transport.request.call_args_list[1][0][4], 5)
+        self.assertEqual(timeouts.stats()['GetVolume']['samples'], 2)
+        self.assertNotIn('SetVolume', timeouts.stats())
+
+    def test_api_backs_off_on_failed_request(self):
+        transport = MagicMock()
+        transport.request.side_effect = TransportException()
+
+        timeouts = AdaptiveTimeout(floor=0.5, ceiling=5, min_samples=1)
+        timeouts.observe('GetVolume', 0.01)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, timeouts=timeouts,
+                                  retry_policy=RetryPolicy(attempts=1))
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+        self.assertEqual(timeouts.stats()['GetVolume']['backoffs'], 1)
@@ -0,0 +1,179 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import BulkExecutor
+from samsung_multiroom.api import HedgePolicy
+from samsung_multiroom.api import NullTracer
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api import Tracer
+from samsung_multiroom.api import get_current_span
+from samsung_multiroom.api import get_tracer
+from samsung_multiroom.api import paginator
+from samsung_multiroom.api import set_tracer
+from samsung_multiroom.api import traced
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.equalizer import Equalizer
+from samsung_multiroom.speaker import Speaker
+
+from .helpers import FakeClock
+from .helpers import uic_response
+
+
+def _list_response(start_index, count):
+    return ('<?xml version="1.0" encoding="UTF-8"?><UIC><method>PCMusicList</method><version>1.0</version>'
+            '<speakerip>192.168.1.129</speakerip><user_identifier>public</user_identifier>'
+            '<response result="ok"><listcount>{0}</listcount><musiclist>{1}</musiclist></response></UIC>').format(
+                count, ''.join('<music><playindex>{0}</playindex></music>'.format(i)
+                               for i in range(start_index, start_index + count)))
+
+
+def _get_api():
+    transport = FakeTransport()
+    transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+    transport.add_response('GetSpkName', uic_response('SpkName', '<spkname>Living Room</spkname>'))
+    transport.add_response('Get7BandEQList', uic_response(
+        '7BandEQList', '<listcount>1</listcount><presetlist><preset index="0"><presetindex>0</presetindex>'
+        '<presetname>None</presetname></preset></presetlist>'))
+
+    return SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+
+def _get_speaker(api):
+    return Speaker(api, MagicMock(), MagicMock(), Equalizer(api), MagicMock(), MagicMock())
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.spans = []
+        self.tracer = Tracer()
+        self.tracer.add_listener(self.spans.append)
+
+    def tearDown(self):
+        set_tracer(None)
+
+    def test_null_tracer_by_default(self):
+        self.assertIsInstance(get_tracer(), NullTracer)
+
+        with get_tracer().span('GetVolume') as span:
+            self.assertIsNone(span)
+
+        self.assertEqual(_get_speaker(_get_api()).get_volume(), 10)
+        self.assertIsNone(get_current_span())
+
+    def test_set_tracer(self):
+        set_tracer(self.tracer)
+        self.assertIs(get_tracer(), self.tracer)
+
+        set_tracer(None)
+        self.assertIsInstance(get_tracer(), NullTracer)
+
+    def test_facade_spans_are_parents_of_api_spans(self):
+        set_tracer(self.tracer)
+
+        speaker = _get_speaker(_get_api())
+        speaker.get_volume()
+        speaker.get_name()
+        speaker.equalizer.get_presets_names()
+
+        self.assertEqual([span.path for span in self.spans], [
+            'Speaker.get_volume > GetVolume',
+            'Speaker.get_volume',
+            'Speaker.get_name > GetSpkName',
+            'Speaker.get_name',
+            'Equalizer.get_presets_names > Get7BandEQList',
+            'Equalizer.get_presets_names',
+        ])
+        self.assertEqual(self.spans[0].attributes, {'speaker': '192.168.1.129'})
+        self.assertIs(self.spans[0].parent, self.spans[1])
+        self.assertIsNone(get_current_span())
+
+    def test_span_records_error(self):
+        set_tracer(self.tracer)
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport())
+
+        self.assertRaises(SamsungMultiroomApiException, _get_speaker(api).set_name, 'Kitchen')
+
+        self.assertIsInstance(self.spans[-1].error, SamsungMultiroomApiException)
+        self.assertEqual(self.spans[-1].name, 'Speaker.set_name')
+
+    def test_slow_spans_are_logged(self):
+        clock = FakeClock()
+        set_tracer(Tracer(slow_threshold=0.5, clock=clock))
+
+        @traced
+        def browse():
+            with get_tracer().span('GetDmsList', speaker='192.168.1.129'):
+                clock.now += 0.3
+
+            with get_tracer().span('PCGetMusicListByID', speaker='192.168.1.129'):
+                clock.now += 0.6
+
+        with self.assertLogs('samsung_multiroom.api.api_tracing', 'WARNING') as logs:
+            browse()
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn('browse > PCGetMusicListByID', logs.output[0])
+        self.assertIn('0.900 seconds', logs.output[1])
+
+    def test_failing_listener_does_not_break_call(self):
+        tracer = Tracer()
+        tracer.add_listener(MagicMock(side_effect=ValueError))
+        set_tracer(tracer)
+
+        self.assertEqual(_get_speaker(_get_api()).get_volume(), 10)
+
+    def test_remove_listener(self):
+        self.tracer.remove_listener(self.spans.append)
+        set_tracer(self.tracer)
+
+        _get_speaker(_get_api()).get_volume()
+
+        self.assertEqual(self.spans, [])
+
+    def test_prefetched_pages_belong_to_caller_span(self):
+        def handler(command, action, payload):
+            start_index = int(re.search(r'name="liststartindex" val="(\d+)"', payload).group(1))
+            list_count = int(re.search(r'name="listcount" val="(\d+)"', payload).group(1))
+
+            return _list_response(start_index, max(0, min(list_count, 35 - start_index)))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport(handler))
+        set_tracer(self.tracer)
+
+        with get_tracer().span('browse'):
+            items = list(paginator(api.pc_get_music_list_by_id, 'uuid', '22', 0, 10, prefetch=2))
+
+        self.assertEqual(len(items), 35)
+        self.assertEqual({span.path for span in self.spans}, {'browse > PCGetMusicListByID', 'browse'})
+
+    def test_bulk_calls_belong_to_caller_span(self):
+        apis = [_get_api(), _get_api()]
+        set_tracer(self.tracer)
+
+        with get_tracer().span('refresh'):
+            BulkExecutor(concurrency=2).run(apis, 'get_volume')
+
+        self.assertEqual([span.path for span in self.spans], ['refresh > GetVolume', 'refresh > GetVolume', 'refresh'])
+
+    def test_hedged_calls_belong_to_caller_span(self):
+        hedge_policy = HedgePolicy(min_samples=1, budget=1)
+        hedge_policy.run('GetVolume', lambda: None)
+
+        parents = []
+
+        def load():
+            parents.append(get_current_span())
+            return len(parents)
+
+        set_tracer(self.tracer)
+
+        with get_tracer().span('refresh') as span:
+            hedge_policy.run('GetVolume', load)
+
+        hedge_policy.close()
+
+        self.assertEqual(parents, [span])
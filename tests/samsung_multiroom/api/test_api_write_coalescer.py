@@ -0,0 +1,122 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import WriteCoalescer
+
+from .helpers import uic_response
+
+
+class TestWriteCoalescer(unittest.TestCase):
+
+    def test_submit_collapses_pending_writes(self):
+        write_coalescer = WriteCoalescer(flush_interval=0.01)
+        started = threading.Event()
+        release = threading.Event()
+        written = []
+
+        def write(value):
+            written.append(value)
+            started.set()
+            release.wait(1)
+            return value
+
+        first_future = write_coalescer.submit('volume', lambda: write(0))
+        started.wait(1)
+
+        futures = [write_coalescer.submit('volume', lambda value=value: write(value)) for value in range(1, 30)]
+
+        self.assertEqual(len(set(futures)), 1)
+        self.assertEqual(write_coalescer.stats()['pending'], 1)
+
+        release.set()
+
+        self.assertEqual(first_future.result(1), 0)
+        self.assertEqual(futures[-1].result(1), 29)
+        self.assertEqual(written, [0, 29])
+        self.assertEqual(write_coalescer.stats(), {'submitted': 30, 'sent': 2, 'pending': 0})
+
+        write_coalescer.close()
+
+    def test_submit_keeps_targets_apart(self):
+        write_coalescer = WriteCoalescer(flush_interval=0.01)
+
+        volume_future = write_coalescer.submit('volume', lambda: 10)
+        mute_future = write_coalescer.submit('mute', lambda: True)
+
+        self.assertEqual(volume_future.result(1), 10)
+        self.assertTrue(mute_future.result(1))
+
+        write_coalescer.close()
+
+    def test_submit_throttles_writes_to_target(self):
+        write_coalescer = WriteCoalescer(flush_interval=0.2)
+        written = []
+
+        write_coalescer.submit('volume', lambda: written.append(time.monotonic())).result(1)
+        write_coalescer.submit('volume', lambda: written.append(time.monotonic())).result(1)
+
+        self.assertGreaterEqual(written[1] - written[0], 0.19)
+
+        write_coalescer.close()
+
+    def test_failed_write_resolves_future_with_exception(self):
+        write_coalescer = WriteCoalescer()
+
+        def write():
+            raise ValueError()
+
+        future = write_coalescer.submit('volume', write)
+
+        self.assertIsInstance(future.exception(1), ValueError)
+
+        write_coalescer.close()
+
+    def test_flush_sends_waiting_writes(self):
+        write_coalescer = WriteCoalescer(flush_interval=10)
+
+        write_coalescer.submit('volume', lambda: 10).result(1)
+        future = write_coalescer.submit('volume', lambda: 20)
+        write_coalescer.flush()
+
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 20)
+
+        write_coalescer.close()
+
+    def test_submit_after_close_raises_exception(self):
+        write_coalescer = WriteCoalescer()
+        write_coalescer.close()
+
+        self.assertRaises(RuntimeError, write_coalescer.submit, 'volume', lambda: 10)
+
+    def test_api_coalesces_writes(self):
+        transport = MagicMock()
+        transport.request.return_value = uic_response('VolumeLevel', '<volume>10</volume>')
+
+        write_coalescer = WriteCoalescer(flush_interval=10)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport, write_coalescer=write_coalescer)
+
+        api.set_volume(5).result(1)
+        api.set_volume(6)
+        api.set_volume(7)
+        api.set_7band_eq_value(1, [0, 0, 0, 0, 0, 0, 0])
+        api.set_7band_eq_value(2, [0, 0, 0, 0, 0, 0, 0])
+        write_coalescer.flush()
+
+        self.assertEqual(transport.request.call_count, 4)
+        paths = [call[0][2] for call in transport.request.call_args_list]
+        self.assertEqual(len([path for path in paths if '%22volume%22%20val%3D%227%22' in path]), 1)
+
+        write_coalescer.close()
+
+    def test_api_without_coalescer_writes_straight_away(self):
+        transport = MagicMock()
+        transport.request.return_value = uic_response('VolumeLevel', '<volume>10</volume>')
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+
+        self.assertIsNone(api.set_volume(5))
+        transport.request.assert_called_once()
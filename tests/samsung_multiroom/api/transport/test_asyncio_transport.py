@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from samsung_multiroom.api.transport import AsyncioTransport
+from samsung_multiroom.api.transport import TransportException
+
+
+def _fake_connection(*chunks, eof=False):
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+
+    writer = MagicMock()
+    writer.is_closing.return_value = False
+
+    async def drain():
+        pass
+
+    writer.drain.side_effect = drain
+
+    return (reader, writer)
+
+
+class TestAsyncioTransport():  # pytest-asyncio doesn't play well with unittest.TestCase
+
+    @pytest.mark.asyncio
+    async def test_request_chunked_response(self):
+        reader, writer = _fake_connection(
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n')
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            transport = AsyncioTransport()
+            response_text = await transport.request('192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+        assert response_text == 'hello world'
+
+    @pytest.mark.asyncio
+    async def test_request_response_delimited_by_closing_connection(self):
+        reader, writer = _fake_connection(b'HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nhello', eof=True)
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            transport = AsyncioTransport()
+            response_text = await transport.request('192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+        assert response_text == 'hello'
+        writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_request_truncated_response_raises_transport_exception(self):
+        reader, writer = _fake_connection(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nhello', eof=True)
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            transport = AsyncioTransport()
+
+            with pytest.raises(TransportException):
+                await transport.request('192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+    @pytest.mark.asyncio
+    async def test_stream(self):
+        reader, writer = _fake_connection(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\nConnection: close\r\n\r\nfirst'
+            b'HTTP/1.1 200 OK\r\nContent-Length: 6\r\nConnection: close\r\n\r\nsecond',
+            eof=True)
+
+        with patch('asyncio.open_connection') as open_connection:
+            open_connection.return_value = (reader, writer)
+
+            transport = AsyncioTransport()
+            responses = []
+
+            with pytest.raises(TransportException):
+                async for response_text in transport.stream('192.168.1.129', 55001, '/UIC?cmd=', {}, 5):
+                    responses.append(response_text)
+
+        assert responses == ['first', 'second']
+        writer.close.assert_called_once()
@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+
+import pytest
+
+from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api import ApiStream
+from samsung_multiroom.api import AsyncSamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApi
+from samsung_multiroom.api import SamsungMultiroomApiException
+from samsung_multiroom.api.transport import AsyncFakeTransport
+from samsung_multiroom.api.transport import FakeTransport
+from samsung_multiroom.api.transport import TransportException
+
+from ..helpers import uic_response
+
+
+class TestFakeTransport(unittest.TestCase):
+
+    def test_api_request(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        volume = api.get_volume()
+
+        self.assertEqual(volume, 10)
+        self.assertEqual(transport.requests, [('192.168.1.129', 55001, 'UIC', '<name>GetVolume</name>')])
+
+    def test_api_request_with_handler(self):
+        def handler(command, action, payload):
+            if action == 'SetVolume':
+                return uic_response('VolumeLevel', '<volume>20</volume>')
+
+            return None
+
+        transport = FakeTransport(handler)
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        api.set_volume(20)
+
+        self.assertEqual(transport.requests, [
+            ('192.168.1.129', 55001, 'UIC', '<name>SetVolume</name><p type="dec" name="volume" val="20"/>'),
+        ])
+
+    def test_unknown_action_raises_exception(self):
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=FakeTransport())
+
+        self.assertRaises(SamsungMultiroomApiException, api.get_volume)
+
+    def test_api_get_main_info(self):
+        transport = FakeTransport()
+        transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+        transport.push(uic_response('MainInfo', '<spkmacaddr>xx:xx:xx:xx:xx:xx</spkmacaddr>'))
+
+        api = SamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        main_info = api.get_main_info()
+
+        self.assertEqual(main_info, {'spkmacaddr': 'xx:xx:xx:xx:xx:xx'})
+
+    def test_request_pipelined(self):
+        transport = FakeTransport()
+        transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+        transport.add_response('GetMute', uic_response('MuteStatus', '<mute>on</mute>'))
+
+        paths = ['/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E', '/UIC?cmd=%3Cname%3EGetMute%3C/name%3E']
+
+        self.assertEqual(transport.request_pipelined('192.168.1.129', 55001, paths, {}, 5), [
+            uic_response('VolumeLevel', '<volume>10</volume>'),
+            uic_response('MuteStatus', '<mute>on</mute>'),
+        ])
+        self.assertEqual(len(FakeTransport(pipelining=False, handler=lambda *_: 'response').request_pipelined(
+            '192.168.1.129', 55001, paths, {}, 5)), 1)
+
+    def test_stream(self):
+        transport = FakeTransport()
+        transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+        transport.push(uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        stream = ApiStream('public', '192.168.1.129', transport=transport)
+
+        names = []
+        for response in stream.open('/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E'):
+            names.append(response.name)
+            if len(names) == 2:
+                stream.close()
+
+        self.assertEqual(names, ['RequestDeviceInfo', 'VolumeLevel'])
+
+
+class TestAsyncFakeTransport():  # pytest-asyncio doesn't play well with unittest.TestCase
+
+    @pytest.mark.asyncio
+    async def test_api_request(self):
+        transport = AsyncFakeTransport()
+        transport.transport.add_response('GetVolume', uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api = AsyncSamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        volume = await api.get_volume()
+
+        assert volume == 10
+
+    @pytest.mark.asyncio
+    async def test_api_get_main_info(self):
+        transport = AsyncFakeTransport()
+        transport.transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+        transport.transport.push(uic_response('MainInfo', '<spkmacaddr>xx:xx:xx:xx:xx:xx</spkmacaddr>'))
+
+        api = AsyncSamsungMultiroomApi('public', '192.168.1.129', transport=transport)
+        main_info = await api.get_main_info()
+
+        assert main_info == {'spkmacaddr': 'xx:xx:xx:xx:xx:xx'}
+
+    @pytest.mark.asyncio
+    async def test_stream_does_not_block_event_loop(self):
+        transport = AsyncFakeTransport()
+        transport.transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+
+        async def push():
+            await asyncio.sleep(0.05)
+            transport.transport.push(uic_response('MainInfo', ''))
+
+        task = asyncio.ensure_future(push())
+        stream = transport.stream('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E', {}, 5)
+
+        assert ApiResponse(await stream.__anext__()).name == 'RequestDeviceInfo'
+        assert ApiResponse(await stream.__anext__()).name == 'MainInfo'
+
+        await stream.aclose()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_raises_transport_exception(self):
+        transport = AsyncFakeTransport()
+        transport.transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+
+        stream = transport.stream('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetMainInfo%3C/name%3E', {}, 0.05)
+        await stream.__anext__()
+
+        with pytest.raises(TransportException):
+            await stream.__anext__()
@@ -0,0 +1,36 @@
+import socket
+import unittest
+from unittest.mock import patch
+
+import httpretty
+
+from samsung_multiroom.api.transport import HttpClientTransport
+from samsung_multiroom.api.transport import TransportException
+
+
+class TestHttpClientTransport(unittest.TestCase):
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_request(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            'http://192.168.1.129:55001/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E',
+            match_querystring=True,
+            body='<UIC></UIC>'
+        )
+
+        transport = HttpClientTransport()
+        response_text = transport.request('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E',
+                                          {'mobileUUID': 'public'}, 5)
+
+        self.assertEqual(response_text, '<UIC></UIC>')
+        self.assertEqual(httpretty.last_request().headers['mobileUUID'], 'public')
+
+    @patch('http.client.HTTPConnection.request')
+    def test_request_exception_raises_transport_exception(self, request):
+        request.side_effect = socket.timeout()
+
+        transport = HttpClientTransport()
+
+        self.assertRaises(TransportException, transport.request, '192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+        request.assert_called_once()
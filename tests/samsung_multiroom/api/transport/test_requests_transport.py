@@ -0,0 +1,98 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+
+import httpretty
+import requests
+
+from samsung_multiroom.api import ApiSession
+from samsung_multiroom.api.transport import RequestsTransport
+from samsung_multiroom.api.transport import TransportException
+
+
+class TestRequestsTransport(unittest.TestCase):
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_request(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            'http://192.168.1.129:55001/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E',
+            match_querystring=True,
+            body='<UIC></UIC>'
+        )
+
+        transport = RequestsTransport()
+        response_text = transport.request('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetVolume%3C/name%3E',
+                                          {'mobileUUID': 'public'}, 5)
+
+        self.assertEqual(response_text, '<UIC></UIC>')
+        self.assertEqual(httpretty.last_request().headers['mobileUUID'], 'public')
+
+    def test_request_uses_session(self):
+        session = MagicMock()
+        session.get.return_value.text = '<UIC></UIC>'
+
+        transport = RequestsTransport(session)
+        response_text = transport.request('192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+        session.get.assert_called_once_with('http://192.168.1.129:55001/UIC?cmd=', headers={}, timeout=5)
+        self.assertEqual(response_text, '<UIC></UIC>')
+
+    def test_request_exception_raises_transport_exception(self):
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError()
+
+        transport = RequestsTransport(session)
+
+        self.assertRaises(TransportException, transport.request, '192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_request_chunks(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            'http://192.168.1.129:55001/UIC?cmd=%3Cname%3EGetDmsList%3C/name%3E',
+            match_querystring=True,
+            body='<UIC>' + 'x' * 10000 + '</UIC>'
+        )
+
+        transport = RequestsTransport()
+        chunks = transport.request_chunks('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetDmsList%3C/name%3E',
+                                          {'mobileUUID': 'public'}, 5)
+
+        self.assertEqual(b''.join(chunks), b'<UIC>' + b'x' * 10000 + b'</UIC>')
+
+    @httpretty.activate(allow_net_connect=False)
+    def test_request_chunks_uses_api_session(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            'http://192.168.1.129:55001/UIC?cmd=%3Cname%3EGetDmsList%3C/name%3E',
+            match_querystring=True,
+            body='<UIC>' + 'x' * 10000 + '</UIC>'
+        )
+
+        session = ApiSession()
+        transport = RequestsTransport(session)
+        chunks = transport.request_chunks('192.168.1.129', 55001, '/UIC?cmd=%3Cname%3EGetDmsList%3C/name%3E',
+                                          {'mobileUUID': 'public'}, 5)
+
+        self.assertEqual(b''.join(chunks), b'<UIC>' + b'x' * 10000 + b'</UIC>')
+        self.assertEqual(session.stats()['requests'], 1)
+
+    def test_request_chunks_exception_raises_transport_exception(self):
+        session = MagicMock()
+        session.get.return_value.iter_content.side_effect = requests.exceptions.ChunkedEncodingError()
+
+        transport = RequestsTransport(session)
+        chunks = transport.request_chunks('192.168.1.129', 55001, '/UIC?cmd=', {}, 5)
+
+        self.assertRaises(TransportException, list, chunks)
+        session.get.assert_called_once_with('http://192.168.1.129:55001/UIC?cmd=', headers={}, timeout=5, stream=True)
+        session.get.return_value.close.assert_called_once()
+
+    def test_close_closes_session(self):
+        session = MagicMock()
+
+        transport = RequestsTransport(session)
+        transport.close()
+
+        session.close.assert_called_once()
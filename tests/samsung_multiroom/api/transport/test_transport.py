@@ -0,0 +1,134 @@
+import socket
+import threading
+import unittest
+from unittest.mock import patch
+
+from samsung_multiroom.api.transport import PipelineInterruptedException
+from samsung_multiroom.api.transport import RequestsTransport
+from samsung_multiroom.api.transport import TransportException
+
+
+class TestSocketStreamConnection(unittest.TestCase):
+
+    @patch('socket.socket')
+    def test_receive(self, s):
+        s.return_value.recv.side_effect = [
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\nConnection: close\r\n\r\nfirst'
+            b'HTTP/1.1 200 OK\r\nContent-Length: 6\r\nConnection: close\r\n\r\nsec',
+            b'ond',
+        ]
+
+        connection = RequestsTransport().open_stream('192.168.1.129', 55001, '/UIC?cmd=', {'mobileUUID': 'public'},
+                                                     None)
+
+        self.assertEqual(connection.receive(), ['first'])
+        self.assertEqual(connection.receive(), ['second'])
+
+        s.return_value.connect.assert_called_once_with(('192.168.1.129', 55001))
+        s.return_value.send.assert_any_call(b'mobileUUID: public\r\n')
+
+        connection.close()
+
+        s.return_value.close.assert_called_once()
+
+    @patch('socket.socket')
+    def test_closed_stream_raises_transport_exception(self, s):
+        s.return_value.recv.return_value = b''
+
+        connection = RequestsTransport().open_stream('192.168.1.129', 55001, '/UIC?cmd=', {}, None)
+
+        self.assertRaises(TransportException, connection.receive)
+
+    @patch('socket.socket')
+    def test_socket_error_raises_transport_exception(self, s):
+        s.return_value.connect.side_effect = socket.error()
+
+        self.assertRaises(TransportException, RequestsTransport().open_stream, '192.168.1.129', 55001, '/UIC?cmd=',
+                          {}, None)
+
+
+class _Speaker(threading.Thread):
+
+    def __init__(self, count, responses):
+        super().__init__(daemon=True)
+        self.requests = b''
+        self._count = count
+        self._responses = responses
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(1)
+        self.port = self._server.getsockname()[1]
+
+    def run(self):
+        connection, _ = self._server.accept()
+
+        with connection:
+            while self.requests.count(b'\r\n\r\n') < self._count:
+                self.requests += connection.recv(1024)
+
+            # send responses split at arbitrary points, to check they are framed correctly
+            data = b''.join(self._responses)
+            for i in range(0, len(data), 7):
+                connection.sendall(data[i:i + 7])
+
+        self._server.close()
+
+
+class TestRequestPipelined(unittest.TestCase):
+
+    def test_request_pipelined(self):
+        speaker = _Speaker(3, [
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nfirst',
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nsec\r\n3\r\nond\r\n0\r\n\r\n',
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nthird',
+        ])
+        speaker.start()
+
+        responses = RequestsTransport().request_pipelined('127.0.0.1', speaker.port, ['/UIC?cmd=1', '/UIC?cmd=2',
+                                                                                      '/UIC?cmd=3'],
+                                                          {'mobileUUID': 'public'}, 5)
+        speaker.join(5)
+
+        self.assertEqual(responses, ['first', 'second', 'third'])
+        self.assertEqual(speaker.requests.count(b'mobileUUID: public\r\n'), 3)
+        self.assertTrue(speaker.requests.startswith(b'GET /UIC?cmd=1 HTTP/1.1\r\nHost: 127.0.0.1:'))
+
+    def test_request_pipelined_connection_closed_after_first_response(self):
+        speaker = _Speaker(2, [b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\nConnection: close\r\n\r\nfirst'])
+        speaker.start()
+
+        responses = RequestsTransport().request_pipelined('127.0.0.1', speaker.port, ['/UIC?cmd=1', '/UIC?cmd=2'],
+                                                          {}, 5)
+        speaker.join(5)
+
+        self.assertEqual(responses, ['first'])
+
+    def test_request_pipelined_truncated_response(self):
+        speaker = _Speaker(2, [
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nfirst',
+            b'HTTP/1.1 200 OK\r\nContent-Length: 6\r\n\r\nsec',
+        ])
+        speaker.start()
+
+        with self.assertRaises(PipelineInterruptedException) as context:
+            RequestsTransport().request_pipelined('127.0.0.1', speaker.port, ['/UIC?cmd=1', '/UIC?cmd=2'], {}, 5)
+        speaker.join(5)
+
+        self.assertEqual(context.exception.responses, ['first'])
+
+    def test_request_pipelined_connection_closed_between_responses(self):
+        speaker = _Speaker(2, [b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nfirst'])
+        speaker.start()
+
+        responses = RequestsTransport().request_pipelined('127.0.0.1', speaker.port, ['/UIC?cmd=1', '/UIC?cmd=2'],
+                                                          {}, 5)
+        speaker.join(5)
+
+        self.assertEqual(responses, ['first'])
+
+    @patch('socket.create_connection')
+    def test_request_pipelined_socket_error_raises_transport_exception(self, create_connection):
+        create_connection.side_effect = socket.error()
+
+        self.assertRaises(TransportException, RequestsTransport().request_pipelined, '192.168.1.129', 55001,
+                          ['/UIC?cmd='], {}, None)
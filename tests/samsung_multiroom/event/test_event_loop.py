@@ -4,9 +4,13 @@ from unittest.mock import MagicMock
 import pytest
 
 from samsung_multiroom.api import ApiResponse
+from samsung_multiroom.api import ApiStream
+from samsung_multiroom.api.transport import FakeTransport
 from samsung_multiroom.event import EventLoop
 from samsung_multiroom.event.event import Event
 
+from ..api.helpers import uic_response
+
 
 def _get_event_loop():
     api_stream = MagicMock()
@@ -62,3 +66,46 @@ class TestEventLoop():  # pytest-asyncio doesn't play well with unittest.TestCas
         await event_loop.loop()
 
         listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_loop_response_listener(self):
+        listener = MagicMock()
+
+        event_loop, api_stream = _get_event_loop()
+
+        response = _get_api_response('FakeEvent')
+        api_stream.open.return_value = iter([response])
+
+        event_loop.add_response_listener(listener)
+
+        await event_loop.loop()
+
+        assert listener.call_args_list == [((response,),), ((None,),)]
+
+    @pytest.mark.asyncio
+    async def test_loop_skips_malformed_event(self):
+        transport = FakeTransport()
+        transport.add_response('GetMainInfo', uic_response('RequestDeviceInfo', ''))
+        transport.push(uic_response('VolumeLevel', '<volume>5</vol'))
+        transport.push(uic_response('VolumeLevel', '<volume>10</volume>'))
+
+        api_stream = ApiStream('public', '192.168.1.129', transport=transport)
+        event_loop = EventLoop(api_stream)
+
+        volumes = []
+
+        def listener(event):
+            volumes.append(event.volume)
+            api_stream.close()
+
+        event_loop.add_listener('speaker.volume.changed', listener)
+
+        await event_loop.loop()
+
+        assert volumes == [10]
+
+    def test_add_response_listener_not_callable_raises_exception(self):
+        event_loop, _ = _get_event_loop()
+
+        with pytest.raises(ValueError):
+            event_loop.add_response_listener('not callable')
@@ -116,6 +116,7 @@ class TestAppPlayer(unittest.TestCase):
 
         player.previous()
 
+        api.get_cp_player_playlist.assert_called_once_with(0, 30)
         api.set_play_cp_playlist_track.assert_called_once_with('1')
 
     def test_repeat(self):
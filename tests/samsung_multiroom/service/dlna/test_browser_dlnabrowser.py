@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import MagicMock
 from unittest.mock import call
 
+from samsung_multiroom.api.api_records import DmsItem
+from samsung_multiroom.api.api_records import MusicItem
 from samsung_multiroom.service import Item
 from samsung_multiroom.service.dlna import DlnaBrowser
 
@@ -206,3 +208,30 @@ class TestDlnaBrowser(unittest.TestCase):
         self.assertEqual(browser[0].object_type, 'dlna_audio')
         self.assertEqual(browser[0].name, 'La femme d\'argent')
         self.assertEqual(browser[0].device_udn, 'uuid:00113249-398f-0011-8f39-8f3949321100')
+
+    @unittest.mock.patch('samsung_multiroom.api.api._get_callable_parameters')
+    def test_browse_records(self, signature):
+        signature.side_effect = [['start_index', 'list_count']] * 2 +\
+            [['device_udn', 'start_index', 'list_count']] * 2 +\
+            [['device_udn', 'parent_id', 'start_index', 'list_count']] * 4
+
+        def records_side_effect(*args, **kwargs):
+            return [MusicItem.from_dict(data) for data in pc_get_music_list_by_id_side_effect(*args, **kwargs)]
+
+        api = MagicMock()
+        api.get_dms_list.return_value = [DmsItem.from_dict(data) for data in get_dms_list_return_value()]
+        api.pc_get_music_list_by_category.return_value = [MusicItem.from_dict(data) for data in
+                                                          pc_get_music_list_by_category_return_value()]
+        api.pc_get_music_list_by_id.side_effect = records_side_effect
+
+        browser = DlnaBrowser(api)
+        browser = browser.browse('/NAS/Music/By Folder')
+
+        self.assertEqual(browser.get_path(), '/NAS/Music/By Folder')
+        self.assertEqual(len(browser), 2)
+        self.assertEqual(browser[0].object_id, '22$@52941')
+        self.assertEqual(browser[0].object_type, 'dlna_audio')
+        self.assertEqual(browser[0].name, 'La femme d\'argent')
+        self.assertEqual(browser[0].artist, 'Air')
+        self.assertEqual(browser[0].duration, 431)
+        self.assertEqual(browser[0].device_udn, 'uuid:00113249-398f-0011-8f39-8f3949321100')
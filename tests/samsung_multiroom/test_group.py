@@ -162,6 +162,22 @@ class TestSpeakerGroup(unittest.TestCase):
         speakers[1].mute.assert_called_once()
         speakers[2].mute.assert_called_once()
 
+    def test_mute_skips_unavailable_speakers(self):
+        speaker_group, api, speakers = _get_speaker_group()
+        speakers[1].is_available.return_value = False
+
+        speaker_group.mute()
+
+        speakers[0].mute.assert_called_once()
+        speakers[1].mute.assert_not_called()
+        speakers[2].mute.assert_called_once()
+
+    def test_is_available_returns_main_speaker_availability(self):
+        speaker_group, api, speakers = _get_speaker_group()
+        speakers[0].is_available.return_value = False
+
+        self.assertFalse(speaker_group.is_available())
+
     def test_unmute_unmutes_all_speakers(self):
         speaker_group, api, speakers = _get_speaker_group()
 
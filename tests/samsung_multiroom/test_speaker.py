@@ -44,6 +44,12 @@ class TestSpeaker(unittest.TestCase):
 
         api.set_speaker_name.assert_called_once_with('Living Room')
 
+    def test_is_available(self):
+        speaker, api, event_loop, clock, equalizer, player_operator, service_registry = get_speaker()
+        api.is_available.return_value = False
+
+        self.assertFalse(speaker.is_available())
+
     def test_get_volume(self):
         speaker, api, event_loop, clock, equalizer, player_operator, service_registry = get_speaker()
         api.get_volume.return_value = 10